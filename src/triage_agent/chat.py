@@ -8,40 +8,111 @@ Usage:
     python -m src.triage_agent.chat
 """
 
-import json
+import gc
+import secrets
 import sys
-import uuid
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm
-from rich.markdown import Markdown
-
-from src.triage_agent.config import Config, setup_logging
-from src.triage_agent.core.agent import TriageAgent
+from src.triage_agent.config import get_config, setup_logging
 from src.triage_agent.models.ticket import SupportTicket
-from src.triage_agent.models.triage_output import TriageOutput
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from src.triage_agent.core.agent import TriageAgent
+    from src.triage_agent.models.triage_output import TriageOutput
+
+# Rich console, created on first use so `quit`/`help` paths stay cheap
+_console: Optional["Console"] = None
+
+# Urgency color coding, with the closing tag baked in
+_URGENCY_MARKUP = {
+    "critical": "[red bold]{}[/red bold]",
+    "high": "[yellow]{}[/yellow]",
+    "medium": "[blue]{}[/blue]",
+    "low": "[green]{}[/green]",
+}
+
+# Prompt choices for the customer tier
+_TIER_CHOICES_FULL = ["free", "pro", "enterprise", "unknown"]
+_TIER_CHOICES_QUICK = ["free", "pro", "enterprise"]
+
+# Cached local-date prefix for ticket IDs, rebuilt at local midnight
+_prefix_date: Optional[str] = None
+_prefix_expires: float = 0.0
+
+
+def _get_console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
 
-# Ticket counter for auto-generating IDs
-_ticket_counter = 0
+def __getattr__(name: str) -> Any:
+    """Lazily expose `console` and `TriageAgent` for external importers."""
+    if name == "console":
+        return _get_console()
+    if name == "TriageAgent":
+        from src.triage_agent.core.agent import TriageAgent
+        return TriageAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def generate_ticket_id() -> str:
     """Generate a unique ticket ID."""
-    global _ticket_counter
-    _ticket_counter += 1
-    timestamp = datetime.now().strftime("%Y%m%d")
-    short_uuid = uuid.uuid4().hex[:6].upper()
-    return f"T-{timestamp}-{short_uuid}"
+    global _prefix_date, _prefix_expires
+    
+    # Only re-format the date when the local day rolls over
+    now = time.time()
+    if now >= _prefix_expires:
+        local = time.localtime(now)
+        _prefix_date = time.strftime("%Y%m%d", local)
+        # mktime normalizes day overflow and picks the DST offset
+        _prefix_expires = time.mktime(
+            (local.tm_year, local.tm_mon, local.tm_mday + 1, 0, 0, 0, 0, 0, -1)
+        )
+    
+    short_id = secrets.token_hex(3).upper()
+    return f"T-{_prefix_date}-{short_id}"
+
+
+@lru_cache(maxsize=None)
+def _sample_choices(count: int) -> tuple[str, ...]:
+    """Get the prompt choices ("1".."count") for picking a sample ticket."""
+    return tuple(map(str, range(1, count + 1)))
+
+
+def _read_until_blank_line() -> str:
+    """
+    Read raw lines from stdin until a blank line (or EOF) is entered.
+    
+    Lines are kept with their trailing newlines so they can be joined
+    without re-inserting separators.
+    
+    Returns:
+        str: The entered text, without the final newline.
+    """
+    readline = sys.stdin.readline
+    parts = []
+    while True:
+        line = readline()
+        if not line or line == "\n" or line == "\r\n":
+            break
+        parts.append(line)
+    return "".join(parts).rstrip("\r\n")
 
 
 def display_welcome():
     """Display welcome banner."""
+    from rich.panel import Panel
+
+    console = _get_console()
     console.print()
     console.print(Panel.fit(
         "[bold blue]🎫 Support Ticket Triage Agent[/bold blue]\n\n"
@@ -54,6 +125,8 @@ def display_welcome():
 
 def display_help():
     """Display help information."""
+    from rich.panel import Panel
+
     help_text = """
 [bold cyan]Available Commands:[/bold cyan]
 
@@ -76,19 +149,17 @@ def display_help():
 - Include customer tier (free/pro/enterprise) for accurate routing
 - Mention specific errors or regions for infrastructure issues
 """
-    console.print(Panel(help_text, title="Help", border_style="cyan"))
+    _get_console().print(Panel(help_text, title="Help", border_style="cyan"))
 
 
-def display_result(result: TriageOutput):
+def display_result(result: "TriageOutput"):
     """Display triage result in a formatted way."""
-    # Urgency color coding
-    urgency_colors = {
-        "critical": "red bold",
-        "high": "yellow",
-        "medium": "blue",
-        "low": "green"
-    }
-    urgency_color = urgency_colors.get(result.urgency.value, "white")
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    urgency = result.urgency.value
+    urgency_markup = _URGENCY_MARKUP.get(urgency, "[white]{}[/white]")
     
     # Main result table
     table = Table(title="📋 Triage Result", show_header=False, border_style="cyan")
@@ -96,7 +167,7 @@ def display_result(result: TriageOutput):
     table.add_column("Value", style="white")
     
     table.add_row("Ticket ID", result.ticket_id)
-    table.add_row("Urgency", f"[{urgency_color}]{result.urgency.value.upper()}[/{urgency_color}]")
+    table.add_row("Urgency", urgency_markup.format(urgency.upper()))
     table.add_row("Issue Type", result.issue_type.value)
     table.add_row("Sentiment", result.customer_sentiment.value)
     table.add_row("Product", result.product or "Not detected")
@@ -109,37 +180,41 @@ def display_result(result: TriageOutput):
     table.add_row("Specialist Queue", result.recommended_specialist_queue.value)
     table.add_row("Confidence", f"{result.confidence_score:.0%}")
     
-    console.print()
-    console.print(table)
+    # Collect everything and render it in a single print call
+    renderables: list = ["", table]
     
     # Knowledge base results
     if result.knowledge_base_results:
-        console.print("\n[bold cyan]📚 Knowledge Base Results:[/bold cyan]")
+        renderables.append("\n[bold cyan]📚 Knowledge Base Results:[/bold cyan]")
         for kb in result.knowledge_base_results[:3]:
-            console.print(f"  • [green]{kb.title}[/green] (relevance: {kb.relevance_score:.2f})")
-            console.print(f"    [dim]{kb.url}[/dim]")
+            renderables.append(f"  • [green]{kb.title}[/green] (relevance: {kb.relevance_score:.2f})")
+            renderables.append(f"    [dim]{kb.url}[/dim]")
     
     # Tool calls
     if result.tool_calls:
-        console.print("\n[bold cyan]🔧 Tools Used:[/bold cyan]")
+        renderables.append("\n[bold cyan]🔧 Tools Used:[/bold cyan]")
         for call in result.tool_calls:
             status = "✅" if call.success else "❌"
-            console.print(f"  {status} {call.tool_name}")
+            renderables.append(f"  {status} {call.tool_name}")
     
     # Suggested reply
     if result.suggested_reply:
-        console.print("\n[bold cyan]💬 Suggested Reply:[/bold cyan]")
-        console.print(Panel(result.suggested_reply, border_style="green"))
+        renderables.append("\n[bold cyan]💬 Suggested Reply:[/bold cyan]")
+        renderables.append(Panel(result.suggested_reply, border_style="green"))
     
     # Reasoning
     if result.reasoning:
-        console.print(f"\n[dim]💭 Reasoning: {result.reasoning}[/dim]")
+        renderables.append(f"\n[dim]💭 Reasoning: {result.reasoning}[/dim]")
     
-    console.print()
+    renderables.append("")
+    _get_console().print(Group(*renderables))
 
 
 def get_ticket_interactive() -> Optional[SupportTicket]:
     """Get ticket details interactively."""
+    from rich.prompt import Prompt
+
+    console = _get_console()
     console.print("\n[bold cyan]📝 Create New Ticket[/bold cyan]\n")
     
     try:
@@ -154,16 +229,7 @@ def get_ticket_interactive() -> Optional[SupportTicket]:
             return None
         
         console.print("Body (enter your message, press Enter twice to finish):")
-        lines = []
-        empty_count = 0
-        while empty_count < 1:
-            line = input()
-            if line == "":
-                empty_count += 1
-            else:
-                empty_count = 0
-                lines.append(line)
-        body = "\n".join(lines)
+        body = _read_until_blank_line()
         
         if not body.strip():
             console.print("[red]Body cannot be empty[/red]")
@@ -173,7 +239,7 @@ def get_ticket_interactive() -> Optional[SupportTicket]:
         customer_name = Prompt.ask("Customer Name (optional)", default="")
         customer_tier = Prompt.ask(
             "Customer Tier",
-            choices=["free", "pro", "enterprise", "unknown"],
+            choices=_TIER_CHOICES_FULL,
             default="unknown"
         )
         customer_region = Prompt.ask(
@@ -189,7 +255,7 @@ def get_ticket_interactive() -> Optional[SupportTicket]:
             customer_name=customer_name or None,
             customer_tier=customer_tier,
             customer_region=customer_region or None,
-            timestamp=datetime.now(timezone.utc).isoformat()
+            timestamp=datetime.now(timezone.utc)
         )
         
     except KeyboardInterrupt:
@@ -202,6 +268,9 @@ def get_ticket_interactive() -> Optional[SupportTicket]:
 
 def get_ticket_quick() -> Optional[SupportTicket]:
     """Get ticket with minimal input."""
+    from rich.prompt import Prompt
+
+    console = _get_console()
     console.print("\n[bold cyan]⚡ Quick Ticket Entry[/bold cyan]\n")
     
     try:
@@ -215,16 +284,7 @@ def get_ticket_quick() -> Optional[SupportTicket]:
             return None
         
         console.print("Body (enter message, press Enter twice to finish):")
-        lines = []
-        empty_count = 0
-        while empty_count < 1:
-            line = input()
-            if line == "":
-                empty_count += 1
-            else:
-                empty_count = 0
-                lines.append(line)
-        body = "\n".join(lines)
+        body = _read_until_blank_line()
         
         if not body.strip():
             console.print("[red]Body cannot be empty[/red]")
@@ -233,7 +293,7 @@ def get_ticket_quick() -> Optional[SupportTicket]:
         # Ask for tier as it affects routing
         customer_tier = Prompt.ask(
             "Customer Tier",
-            choices=["free", "pro", "enterprise"],
+            choices=_TIER_CHOICES_QUICK,
             default="free"
         )
         
@@ -243,7 +303,7 @@ def get_ticket_quick() -> Optional[SupportTicket]:
             body=body,
             customer_email="customer@example.com",
             customer_tier=customer_tier,
-            timestamp=datetime.now(timezone.utc).isoformat()
+            timestamp=datetime.now(timezone.utc)
         )
         
     except KeyboardInterrupt:
@@ -253,26 +313,22 @@ def get_ticket_quick() -> Optional[SupportTicket]:
 
 def get_ticket_json() -> Optional[SupportTicket]:
     """Get ticket from JSON input."""
+    from pydantic import ValidationError
+
+    console = _get_console()
     console.print("\n[bold cyan]📄 JSON Ticket Entry[/bold cyan]")
     console.print("[dim]Paste your JSON and press Enter twice:[/dim]\n")
     
     try:
-        lines = []
-        empty_count = 0
-        while empty_count < 1:
-            line = input()
-            if line == "":
-                empty_count += 1
-            else:
-                empty_count = 0
-                lines.append(line)
-        
-        json_str = "\n".join(lines)
-        data = json.loads(json_str)
-        return SupportTicket.model_validate(data)
+        # Parse and validate in a single pass through pydantic-core
+        json_str = _read_until_blank_line()
+        return SupportTicket.model_validate_json(json_str)
         
-    except json.JSONDecodeError as e:
-        console.print(f"[red]Invalid JSON: {e}[/red]")
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            console.print(f"[red]Invalid JSON: {e}[/red]")
+        else:
+            console.print(f"[red]Error: {e}[/red]")
         return None
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -281,45 +337,173 @@ def get_ticket_json() -> Optional[SupportTicket]:
 
 def get_sample_ticket() -> SupportTicket:
     """Get a sample ticket for demo."""
-    from src.triage_agent.models.ticket import SAMPLE_TICKETS
+    from rich.prompt import Prompt
+
+    from src.triage_agent.models.ticket import get_sample_tickets
     
+    console = _get_console()
+    sample_tickets = get_sample_tickets()
     console.print("\n[bold cyan]📦 Sample Tickets[/bold cyan]\n")
     
-    for i, ticket in enumerate(SAMPLE_TICKETS, 1):
+    for i, ticket in enumerate(sample_tickets, 1):
         console.print(f"  [{i}] {ticket.subject[:50]}... ({ticket.customer_tier})")
     
     choice = Prompt.ask(
         "\nSelect sample",
-        choices=[str(i) for i in range(1, len(SAMPLE_TICKETS) + 1)],
+        choices=list(_sample_choices(len(sample_tickets))),
         default="1"
     )
     
-    return SAMPLE_TICKETS[int(choice) - 1]
+    return sample_tickets[int(choice) - 1]
 
 
-def process_ticket(agent: TriageAgent, ticket: SupportTicket):
+def _triage_cached(agent: "TriageAgent", ticket: SupportTicket) -> "TriageOutput":
+    """
+    Triage a ticket, reusing a stored result for an identical ticket.
+    
+    Results are kept in a `shelve` database under `config.result_cache_dir`,
+    keyed on a BLAKE2b digest of the model settings and ticket JSON. Caching
+    is skipped unless `config.enable_result_cache` is set, and only LLM
+    results are stored, so a fallback during an outage or without an API
+    key is never reused.
+    
+    Args:
+        agent: The triage agent.
+        ticket: The ticket to triage.
+    
+    Returns:
+        TriageOutput: The cached or freshly computed result.
+    """
+    if not agent.config.enable_result_cache:
+        return agent.triage(ticket)
+    
+    import hashlib
+    import shelve
+    from pathlib import Path
+
+    from src.triage_agent.models.triage_output import TriageOutput
+
+    cache_dir = Path(agent.config.result_cache_dir).expanduser()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{agent.config.openai_model}|{agent.config.openai_temperature}|".encode())
+    # Chat ticket IDs and timestamps are fresh per submission, so they are
+    # left out of the key and the stored result is re-labelled on a hit
+    digest.update(ticket.model_dump_json(exclude={"ticket_id", "timestamp"}).encode())
+    key = digest.hexdigest()
+    cache_path = str(cache_dir / "results")
+    
+    with shelve.open(cache_path) as cache:
+        cached = cache.get(key)
+    if cached is not None:
+        return TriageOutput.model_validate_json(cached).model_copy(
+            update={"ticket_id": ticket.ticket_id}
+        )
+    
+    # The shelf is closed while the LLM runs so other sessions can use it
+    result = agent.triage(ticket)
+    if agent.client is not None and not agent.is_fallback_output(result):
+        with shelve.open(cache_path) as cache:
+            cache[key] = result.to_json_bytes()
+    return result
+
+
+def process_ticket(agent: "TriageAgent", ticket: SupportTicket):
     """Process a ticket and display results."""
+    from rich.prompt import Confirm
+
+    console = _get_console()
     console.print("\n[bold yellow]⏳ Processing ticket...[/bold yellow]")
     
     try:
-        result = agent.triage(ticket)
+        result = _triage_cached(agent, ticket)
         display_result(result)
         
         # Offer to show JSON
         if Confirm.ask("Show raw JSON output?", default=False):
             console.print("\n[bold cyan]Raw JSON:[/bold cyan]")
-            console.print_json(result.model_dump_json())
+            # Pretty-printed by pydantic-core; Rich only adds colour on a TTY
+            json_str = result.model_dump_json(indent=2)
+            if sys.stdout.isatty():
+                from rich.syntax import Syntax
+                console.print(Syntax(json_str, "json", theme="ansi_dark"))
+            else:
+                sys.stdout.write(json_str + "\n")
             
     except Exception as e:
         console.print(f"[red]Error processing ticket: {e}[/red]")
 
 
+def _cmd_quit(agent: "TriageAgent") -> bool:
+    """Say goodbye and signal the main loop to exit."""
+    _get_console().print("\n[blue]Goodbye! 👋[/blue]\n")
+    return True
+
+
+def _cmd_help(agent: "TriageAgent") -> bool:
+    """Show the help panel."""
+    display_help()
+    return False
+
+
+def _cmd_new(agent: "TriageAgent") -> bool:
+    """Create a ticket interactively and triage it."""
+    ticket = get_ticket_interactive()
+    if ticket:
+        process_ticket(agent, ticket)
+    return False
+
+
+def _cmd_quick(agent: "TriageAgent") -> bool:
+    """Create a ticket with minimal input and triage it."""
+    ticket = get_ticket_quick()
+    if ticket:
+        process_ticket(agent, ticket)
+    return False
+
+
+def _cmd_sample(agent: "TriageAgent") -> bool:
+    """Triage a sample ticket."""
+    ticket = get_sample_ticket()
+    process_ticket(agent, ticket)
+    return False
+
+
+def _cmd_json(agent: "TriageAgent") -> bool:
+    """Read a ticket as JSON and triage it."""
+    ticket = get_ticket_json()
+    if ticket:
+        process_ticket(agent, ticket)
+    return False
+
+
+# Command aliases -> handler. Handlers return True to exit the main loop.
+_COMMANDS: dict[str, Callable[["TriageAgent"], bool]] = {
+    alias: handler
+    for aliases, handler in (
+        (("quit", "exit", "q"), _cmd_quit),
+        (("help", "h", "?"), _cmd_help),
+        (("new", "n", "create"), _cmd_new),
+        (("quick", "qk", "fast"), _cmd_quick),
+        (("sample", "s", "demo"), _cmd_sample),
+        (("json", "j"), _cmd_json),
+    )
+    for alias in aliases
+}
+
+
 def main():
     """Main chat loop."""
+    from rich.prompt import Prompt
+
+    from src.triage_agent.core.agent import TriageAgent
+
     # Initialize
-    config = Config()
+    config = get_config()
     setup_logging(config)
     agent = TriageAgent(config)
+    console = _get_console()
+    gc.freeze()
     
     display_welcome()
     
@@ -335,35 +519,12 @@ def main():
                 default="help"
             ).strip().lower()
             
-            if command in ["quit", "exit", "q"]:
-                console.print("\n[blue]Goodbye! 👋[/blue]\n")
-                break
-                
-            elif command in ["help", "h", "?"]:
-                display_help()
-                
-            elif command in ["new", "n", "create"]:
-                ticket = get_ticket_interactive()
-                if ticket:
-                    process_ticket(agent, ticket)
-                    
-            elif command in ["quick", "qk", "fast"]:
-                ticket = get_ticket_quick()
-                if ticket:
-                    process_ticket(agent, ticket)
-                    
-            elif command in ["sample", "s", "demo"]:
-                ticket = get_sample_ticket()
-                process_ticket(agent, ticket)
-                
-            elif command in ["json", "j"]:
-                ticket = get_ticket_json()
-                if ticket:
-                    process_ticket(agent, ticket)
-                    
-            else:
+            handler = _COMMANDS.get(command)
+            if handler is None:
                 console.print(f"[yellow]Unknown command: '{command}'[/yellow]")
                 console.print("Type [green]'help'[/green] for available commands")
+            elif handler(agent):
+                break
                 
         except KeyboardInterrupt:
             console.print("\n[dim]Press Ctrl+C again or type 'quit' to exit[/dim]")
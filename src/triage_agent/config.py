@@ -9,16 +9,27 @@ Environment Variables:
     OPENAI_API_KEY: Required. Your OpenAI API key.
     OPENAI_MODEL: Optional. Model to use (default: gpt-4o).
     OPENAI_TEMPERATURE: Optional. Model temperature (default: 0.1).
+    MAX_CONTEXT_TOKENS: Optional. Model context window for tool-loop budgeting (default: 128000).
     LOG_LEVEL: Optional. Logging verbosity (default: INFO).
     MAX_RETRIES: Optional. API retry attempts (default: 3).
+    MAX_CONCURRENCY: Optional. Concurrent tickets for batch triage (default: 5).
+    MAX_REQUESTS_PER_MINUTE: Optional. Client-side OpenAI request limit (default: unset, no limit).
+    MAX_TOKENS_PER_MINUTE: Optional. Client-side OpenAI token limit (default: unset, no limit).
+    ENABLE_RESULT_CACHE: Optional. Cache chat triage results on disk (default: false).
+    RESULT_CACHE_DIR: Optional. Result cache location (default: ~/.cache/triage_agent).
+    TRIAGE_CACHE_MAX_ENTRIES: Optional. In-memory LLM result cache size, 0 disables (default: 1024).
+    TRIAGE_CACHE_TTL_SECONDS: Optional. In-memory LLM result lifetime (default: 3600).
+    ENABLE_SEMANTIC_CACHE: Optional. Reuse results for near-duplicate tickets (default: false).
+    SEMANTIC_CACHE_THRESHOLD: Optional. Cosine similarity for a semantic hit (default: 0.92).
+    EMBEDDING_MODEL: Optional. Embedding model for the semantic cache (default: text-embedding-3-small).
 """
 
 import logging
 import os
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Literal, Optional
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -30,9 +41,20 @@ class Config(BaseSettings):
         openai_api_key: OpenAI API key for authentication.
         openai_model: The OpenAI model to use for triage.
         openai_temperature: Temperature setting for model responses.
+        max_context_tokens: Context window of the model; tool use stops at 80% of it.
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         max_retries: Maximum number of API retry attempts.
         timeout_seconds: Request timeout in seconds.
+        max_concurrency: Maximum number of tickets triaged concurrently.
+        max_requests_per_minute: Client-side cap on OpenAI requests per minute, if any.
+        max_tokens_per_minute: Client-side cap on OpenAI tokens per minute, if any.
+        enable_result_cache: Whether the chat CLI reuses cached triage results.
+        result_cache_dir: Directory holding the on-disk result cache.
+        triage_cache_max_entries: Capacity of the in-memory LLM result cache.
+        triage_cache_ttl_seconds: Lifetime of in-memory LLM cache entries.
+        enable_semantic_cache: Whether near-duplicate tickets reuse cached results.
+        semantic_cache_threshold: Minimum cosine similarity for a semantic hit.
+        embedding_model: Embedding model used by the semantic cache.
     """
     
     model_config = SettingsConfigDict(
@@ -57,9 +79,14 @@ class Config(BaseSettings):
         le=2.0,
         description="Temperature for model responses (lower = more deterministic)"
     )
+    max_context_tokens: int = Field(
+        default=128_000,
+        ge=1_000,
+        description="Model context window; the tool loop stops calling tools at 80% of it"
+    )
     
     # Application Configuration
-    log_level: str = Field(
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO",
         description="Logging verbosity level"
     )
@@ -75,6 +102,22 @@ class Config(BaseSettings):
         le=120,
         description="Request timeout in seconds"
     )
+    max_concurrency: int = Field(
+        default=5,
+        ge=1,
+        le=100,
+        description="Maximum tickets triaged concurrently by triage_many and the runner"
+    )
+    max_requests_per_minute: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Client-side limit on OpenAI requests per minute (unset or 0 disables)"
+    )
+    max_tokens_per_minute: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Client-side limit on OpenAI tokens per minute (unset or 0 disables)"
+    )
     
     # Feature Flags
     enable_knowledge_base: bool = Field(
@@ -90,28 +133,60 @@ class Config(BaseSettings):
         description="Enable region status tool"
     )
     
-    @field_validator("log_level")
-    @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """Validate that log level is a valid Python logging level."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        upper_v = v.upper()
-        if upper_v not in valid_levels:
-            raise ValueError(f"log_level must be one of {valid_levels}")
-        return upper_v
-    
-    @field_validator("openai_api_key")
+    # Result Cache
+    enable_result_cache: bool = Field(
+        default=False,
+        description="Reuse stored triage results for identical tickets in the chat CLI"
+    )
+    result_cache_dir: str = Field(
+        default="~/.cache/triage_agent",
+        description="Directory for the on-disk triage result cache"
+    )
+    triage_cache_max_entries: int = Field(
+        default=1024,
+        ge=0,
+        description="Maximum LLM triage results kept in memory (0 disables the cache)"
+    )
+    triage_cache_ttl_seconds: int = Field(
+        default=3600,
+        ge=1,
+        description="Seconds an in-memory LLM triage result stays valid"
+    )
+    enable_semantic_cache: bool = Field(
+        default=False,
+        description="Reuse cached LLM results for near-duplicate tickets via embeddings"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.92,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity for a semantic cache hit"
+    )
+    embedding_model: str = Field(
+        default="text-embedding-3-small",
+        description="OpenAI embedding model used by the semantic cache"
+    )
+    
+    _api_key_warned: bool = PrivateAttr(default=False)
+    
+    @model_validator(mode="before")
     @classmethod
-    def validate_api_key(cls, v: str) -> str:
-        """Validate API key format (basic check)."""
-        if v and not v.startswith("sk-"):
-            # Allow empty for testing, but warn if format looks wrong
-            logging.warning("OpenAI API key format may be incorrect")
-        return v
+    def normalize_log_level(cls, data: Any) -> Any:
+        """Uppercase the raw log level so the Literal check is case-insensitive."""
+        if isinstance(data, dict):
+            level = data.get("log_level")
+            if isinstance(level, str):
+                data = {**data, "log_level": level.upper()}
+        return data
     
     def is_api_key_set(self) -> bool:
         """Check if a valid API key is configured."""
-        return bool(self.openai_api_key and len(self.openai_api_key) > 10)
+        key = self.openai_api_key
+        if key and not key.startswith("sk-") and not self._api_key_warned:
+            # Allow any format, but warn (once) if it looks wrong
+            logging.warning("OpenAI API key format may be incorrect")
+            self._api_key_warned = True
+        return bool(key and len(key) > 10)
 
 
 @lru_cache()
@@ -143,13 +218,18 @@ def setup_logging(config: Optional[Config] = None) -> logging.Logger:
     if config is None:
         config = get_config()
     
+    level = getattr(logging, config.log_level)
+    logger = logging.getLogger("triage_agent")
+    
+    # Already configured at this level - nothing to do
+    if logger.level == level:
+        return logger
+    
     logging.basicConfig(
-        level=getattr(logging, config.log_level),
+        level=level,
         format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    
-    logger = logging.getLogger("triage_agent")
-    logger.setLevel(getattr(logging, config.log_level))
+    logger.setLevel(level)
     
     return logger
\ No newline at end of file
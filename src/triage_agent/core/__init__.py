@@ -6,14 +6,18 @@ Contains the core agent logic and orchestration components.
 
 Modules:
     agent: Main triage agent orchestrator
+    batch: OpenAI Batch API helpers for offline triage
+    cache: In-memory cache of LLM triage results
     classifier: Classification utilities
     triage_logic: Business rule decision logic
 """
 
 from src.triage_agent.core.agent import TriageAgent
+from src.triage_agent.core.cache import TriageCache
 from src.triage_agent.core.triage_logic import TriageLogic
 
 __all__ = [
     "TriageAgent",
+    "TriageCache",
     "TriageLogic",
 ]
\ No newline at end of file
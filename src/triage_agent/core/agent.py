@@ -11,21 +11,47 @@ This module coordinates:
 - Business rule application
 """
 
+import asyncio
+import importlib.util
 import json
 import logging
-from typing import Any, Optional
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional
 
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
+from pydantic import ValidationError
 
 from src.triage_agent.config import Config
+from src.triage_agent.core.batch import (
+    build_batch_line,
+    download_batch_results,
+    submit_batch,
+    wait_for_batch,
+)
+from src.triage_agent.core.cache import TriageCache, make_cache_key
+from src.triage_agent.core.rate_limiter import RateLimiter, estimate_tokens
 from src.triage_agent.core.triage_logic import TriageLogic
 from src.triage_agent.models.ticket import SupportTicket
+from src.triage_agent.models.tools import CustomerHistoryInput, KnowledgeBaseInput
 from src.triage_agent.models.triage_output import (
+    ACTION_BY_VALUE,
+    ISSUE_BY_VALUE,
+    QUEUE_BY_VALUE,
+    RISK_BY_VALUE,
+    SENTIMENT_BY_VALUE,
+    URGENCY_BY_VALUE,
     CustomerSentiment,
     IssueType,
     KnowledgeBaseResult,
     RecommendedAction,
-    RiskSignal,
     SpecialistQueue,
     ToolCallRecord,
     TriageOutput,
@@ -34,13 +60,207 @@ from src.triage_agent.models.triage_output import (
 from src.triage_agent.prompts.system_prompt import (
     get_json_schema_prompt,
     get_system_prompt,
+    get_system_prompt_cache_key,
     get_tool_usage_prompt,
 )
 from src.triage_agent.tools import ToolRegistry, create_tool_registry
 from src.triage_agent.tools.base import BaseTool, ToolExecutionError
+from src.triage_agent.tools.customer_history import CustomerHistoryTool
+from src.triage_agent.tools.knowledge_base import KnowledgeBaseTool
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates, filled with str.format_map per ticket
+_TICKET_DETAILS_TEMPLATE = """TICKET ID: {ticket_id}
+SUBJECT: {subject}
+CUSTOMER EMAIL: {customer_email}
+CUSTOMER NAME: {customer_name}
+CUSTOMER TIER: {customer_tier}
+CUSTOMER REGION: {customer_region}
+CHANNEL: {channel}
+TIMESTAMP: {timestamp}
+
+TICKET BODY:
+{body}"""
+
+_TICKET_PROMPT_TEMPLATE = """Please triage the following support ticket:
+
+---
+""" + _TICKET_DETAILS_TEMPLATE + """
+---
+
+{tool_reminder}
+
+After using the tools, provide your final triage assessment.
+
+{json_reminder}
+"""
+
+_BATCH_TICKET_TEMPLATE = "TICKET[{index}]\n---\n" + _TICKET_DETAILS_TEMPLATE + "\n---"
+
+_BATCH_PROMPT_TEMPLATE = """Please triage each of the following {count} support tickets independently.
+
+{blocks}
+
+Tools are not available for this request; base each assessment on the ticket content.
+
+{json_reminder}
+
+Return a JSON object {{"results": [...]}} with one triage object per ticket, in the same order as the tickets above (TICKET[0] first).
+"""
+
+
+# Reasoning set on outputs that did not come from a successful LLM answer
+RULE_BASED_REASONING = "Rule-based triage (LLM unavailable)"
+FALLBACK_REASONING_PREFIX = "Fallback triage due to parsing error: "
+
+# Sent when the tool loop nears the context budget
+_FINAL_ANSWER_MESSAGE = {
+    "role": "system",
+    "content": "You have gathered enough context. Emit the final JSON now.",
+}
+
+
+@lru_cache(maxsize=1)
+def _build_response_format() -> dict[str, Any]:
+    """
+    Build the structured output format for single-ticket triage responses.
+    
+    The schema is TriageOutput without the agent-managed tool call log.
+    It is not strict: strict mode requires every property to be required.
+    The schema never changes, so it is generated once and shared by all
+    agents; callers must not modify it.
+    
+    Returns:
+        dict: The `response_format` argument for chat completions.
+    """
+    schema = TriageOutput.model_json_schema()
+    schema.pop("example", None)
+    schema["properties"].pop("tool_calls")
+    schema["$defs"].pop("ToolCallRecord")
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": "TriageOutput", "schema": schema, "strict": False},
+    }
+
+
+def _build_async_http_client(config: Config) -> Any:
+    """
+    Build a pooled HTTP client for the async OpenAI client.
+    
+    Concurrent requests reuse kept-alive connections instead of paying
+    a TLS handshake each, and share multiplexed HTTP/2 connections when
+    the optional `h2` package is installed.
+    
+    Args:
+        config: Application configuration.
+    
+    Returns:
+        httpx.AsyncClient: The configured HTTP client.
+    """
+    # Only needed once an API key is configured
+    import httpx
+    
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=httpx.Timeout(config.timeout_seconds, connect=5.0),
+    )
+
+
+# API errors retried by the agent. The SDK's own retries are disabled so
+# that every 429 reaches the rate limiter; timeouts are connection errors
+_RETRYABLE_ERRORS = (
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Get the seconds to wait before retrying a failed API request.
+    
+    A 429 with a numeric `Retry-After` header is honored; anything else
+    backs off exponentially.
+    
+    Args:
+        error: The retryable error that was raised.
+        attempt: Zero-based index of the failed attempt.
+    
+    Returns:
+        float: Seconds to sleep before the next attempt.
+    """
+    if isinstance(error, RateLimitError):
+        retry_after = error.response.headers.get("retry-after", "")
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+    return float(2 ** attempt)
+
+
+def _call_outcome(tool: BaseTool, input_data: Any) -> Any:
+    """Execute a tool, returning its output or the exception it raised."""
+    try:
+        return tool.execute(input_data)
+    except Exception as e:
+        return e
+
+
+def _merge_stream_chunk(
+    chunk: Any,
+    content_parts: list[str],
+    tool_calls: dict[int, dict[str, Any]]
+) -> None:
+    """
+    Fold one streamed completion chunk into the message being assembled.
+    
+    Args:
+        chunk: A `ChatCompletionChunk`.
+        content_parts: Content fragments received so far.
+        tool_calls: Partial tool calls keyed by their stream index.
+    """
+    if not chunk.choices:
+        return
+    delta = chunk.choices[0].delta
+    if delta.content:
+        content_parts.append(delta.content)
+    for call in delta.tool_calls or ():
+        entry = tool_calls.setdefault(call.index, {
+            "id": "",
+            "type": "function",
+            "function": {"name": "", "arguments": ""},
+        })
+        if call.id:
+            entry["id"] = call.id
+        if call.function:
+            if call.function.name:
+                entry["function"]["name"] += call.function.name
+            if call.function.arguments:
+                entry["function"]["arguments"] += call.function.arguments
+
+
+def _assistant_message(
+    content_parts: list[str],
+    tool_calls: dict[int, dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Build an assistant message from streamed fragments.
+    
+    Args:
+        content_parts: Content fragments in arrival order.
+        tool_calls: Tool calls keyed by their stream index.
+    
+    Returns:
+        dict: Assistant message usable in the next request's `messages`.
+    """
+    message: dict[str, Any] = {"role": "assistant", "content": "".join(content_parts) or None}
+    if tool_calls:
+        message["tool_calls"] = [tool_calls[index] for index in sorted(tool_calls)]
+    return message
+
 
 class TriageAgent:
     """
@@ -55,8 +275,12 @@ class TriageAgent:
     Attributes:
         config: Application configuration.
         client: OpenAI client instance.
+        aclient: Async OpenAI client used by `triage_async`/`triage_many`,
+            created on first use. Close it with `aclose()`.
         tool_registry: Registry of available tools.
         triage_logic: Business rule logic handler.
+        cache: In-memory cache of LLM triage results.
+        limiter: Shared request/token rate limiter for OpenAI calls.
     
     Example:
         >>> agent = TriageAgent(Config())
@@ -68,7 +292,8 @@ class TriageAgent:
         self,
         config: Config,
         tool_registry: Optional[ToolRegistry] = None,
-        client: Optional[OpenAI] = None
+        client: Optional[OpenAI] = None,
+        async_client: Optional[AsyncOpenAI] = None
     ):
         """
         Initialize the triage agent.
@@ -77,18 +302,91 @@ class TriageAgent:
             config: Application configuration.
             tool_registry: Optional custom tool registry.
             client: Optional OpenAI client (for testing).
+            async_client: Optional async OpenAI client (for testing).
         """
         self.config = config
         self.tool_registry = tool_registry or create_tool_registry()
         self.triage_logic = TriageLogic()
         
+        # Tools used directly by the rule-based fallback
+        self._kb_tool = KnowledgeBaseTool()
+        self._history_tool = CustomerHistoryTool()
+        self.cache = TriageCache(
+            max_entries=config.triage_cache_max_entries,
+            ttl_seconds=config.triage_cache_ttl_seconds
+        )
+        self.limiter = RateLimiter(
+            config.max_requests_per_minute or None,
+            config.max_tokens_per_minute or None
+        )
+        
+        # Prompts and tool schemas are identical for every ticket
+        self._system_msg = {"role": "system", "content": get_system_prompt()}
+        self._prompt_cache_key = get_system_prompt_cache_key()
+        self._tools_schema = self.tool_registry.get_schemas()
+        self._tool_reminder = get_tool_usage_prompt(self.tool_registry.get_names())
+        self._json_reminder = get_json_schema_prompt()
+        self._response_format = _build_response_format()
+        
+        # Leave room for the final answer within the model's context window
+        self._context_budget = int(config.max_context_tokens * 0.8)
+        
         # Initialize OpenAI client if API key is available
+        # The async client (and its connection pool) is only built when an
+        # async method first needs it, so sync-only callers never open one.
+        # SDK retries are off; _request and _request_async retry instead
+        self._aclient: Optional[AsyncOpenAI] = None
+        self._owns_aclient = False
         if config.is_api_key_set():
-            self.client = client or OpenAI(api_key=config.openai_api_key)
+            self.client = client or OpenAI(api_key=config.openai_api_key, max_retries=0)
+            self._aclient = async_client
         else:
             self.client = None
             logger.warning("OpenAI API key not set - using mock mode")
     
+    @property
+    def aclient(self) -> Optional[AsyncOpenAI]:
+        """Async OpenAI client, built on first access when an API key is set."""
+        if self._aclient is None and self.client is not None:
+            self._aclient = AsyncOpenAI(
+                api_key=self.config.openai_api_key,
+                max_retries=0,
+                http_client=_build_async_http_client(self.config)
+            )
+            self._owns_aclient = True
+        return self._aclient
+    
+    @aclient.setter
+    def aclient(self, value: Optional[AsyncOpenAI]) -> None:
+        self._aclient = value
+        self._owns_aclient = False
+    
+    def _require_aclient(self) -> AsyncOpenAI:
+        """
+        Get the async OpenAI client for a call that cannot run without it.
+        
+        Returns:
+            AsyncOpenAI: The async client.
+        
+        Raises:
+            RuntimeError: If no API key is configured.
+        """
+        aclient = self.aclient
+        if aclient is None:
+            raise RuntimeError("Async LLM calls require an OpenAI API key")
+        return aclient
+    
+    async def aclose(self) -> None:
+        """
+        Close the async client's connection pool if this agent created it.
+        
+        A later async call builds a fresh client.
+        """
+        if self._owns_aclient and self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
+            self._owns_aclient = False
+    
     def triage(self, ticket: SupportTicket) -> TriageOutput:
         """
         Triage a support ticket.
@@ -101,22 +399,421 @@ class TriageAgent:
         Returns:
             TriageOutput: Complete triage output with classifications and recommendations.
         """
-        logger.info(f"Starting triage for ticket: {ticket.ticket_id}")
+        logger.info("Starting triage for ticket: %s", ticket.ticket_id)
         
         # If no API key, use rule-based fallback
         if not self.client:
             logger.info("Using rule-based fallback (no API key)")
             return self._rule_based_triage(ticket)
         
+        key = make_cache_key(
+            ticket, self.config.openai_model, self.config.openai_temperature
+        )
+        cached = self.cache.get(key)
+        embedding = None
+        if cached is None and self.config.enable_semantic_cache:
+            embedding = self._embed_ticket(ticket)
+            if embedding is not None:
+                similar = self.cache.get_similar(
+                    embedding,
+                    self.config.semantic_cache_threshold,
+                    scope=ticket.customer_tier
+                )
+                if similar is not None:
+                    # The match came from another ticket, so re-check its
+                    # rules against this one
+                    logger.info("Semantic cache hit for ticket: %s", ticket.ticket_id)
+                    return self._apply_business_rules(
+                        similar.model_copy(update={"ticket_id": ticket.ticket_id}),
+                        ticket
+                    )
+        if cached is not None:
+            logger.info("Cache hit for ticket: %s", ticket.ticket_id)
+            return cached.model_copy(update={"ticket_id": ticket.ticket_id})
+        
         try:
-            return self._llm_triage(ticket)
+            triage_output = self._llm_triage(ticket)
         except Exception as e:
-            logger.error(f"LLM triage failed: {e}, falling back to rules")
+            logger.error("LLM triage failed: %s, falling back to rules", e)
             return self._rule_based_triage(ticket)
+        
+        # Parse-failure fallbacks must not be served to later tickets
+        if not self.is_fallback_output(triage_output):
+            self.cache.put(key, triage_output, embedding, scope=ticket.customer_tier)
+        return triage_output
+    
+    async def triage_async(self, ticket: SupportTicket) -> TriageOutput:
+        """
+        Triage a support ticket without blocking the event loop.
+        
+        Async counterpart of `triage()`. Tool calls requested in the
+        same LLM turn are executed concurrently.
+        
+        Args:
+            ticket: The support ticket to triage.
+        
+        Returns:
+            TriageOutput: Complete triage output with classifications and recommendations.
+        """
+        logger.info("Starting async triage for ticket: %s", ticket.ticket_id)
+        
+        # If no API key, use rule-based fallback
+        if not self.aclient:
+            logger.info("Using rule-based fallback (no API key)")
+            return await self._rule_based_triage_async(ticket)
+        
+        key = make_cache_key(
+            ticket, self.config.openai_model, self.config.openai_temperature
+        )
+        cached = self.cache.get(key)
+        embedding = None
+        if cached is None and self.config.enable_semantic_cache:
+            embedding = await self._embed_ticket_async(ticket)
+            if embedding is not None:
+                similar = self.cache.get_similar(
+                    embedding,
+                    self.config.semantic_cache_threshold,
+                    scope=ticket.customer_tier
+                )
+                if similar is not None:
+                    # The match came from another ticket, so re-check its
+                    # rules against this one
+                    logger.info("Semantic cache hit for ticket: %s", ticket.ticket_id)
+                    return self._apply_business_rules(
+                        similar.model_copy(update={"ticket_id": ticket.ticket_id}),
+                        ticket
+                    )
+        if cached is not None:
+            logger.info("Cache hit for ticket: %s", ticket.ticket_id)
+            return cached.model_copy(update={"ticket_id": ticket.ticket_id})
+        
+        try:
+            triage_output = await self._llm_triage_async(ticket)
+        except Exception as e:
+            logger.error("LLM triage failed: %s, falling back to rules", e)
+            return await self._rule_based_triage_async(ticket)
+        
+        # Parse-failure fallbacks must not be served to later tickets
+        if not self.is_fallback_output(triage_output):
+            self.cache.put(key, triage_output, embedding, scope=ticket.customer_tier)
+        return triage_output
+    
+    @staticmethod
+    def is_fallback_output(output: TriageOutput) -> bool:
+        """
+        Check whether an output came from a fallback instead of the LLM.
+        
+        Args:
+            output: A triage output returned by this agent.
+        
+        Returns:
+            bool: True for rule-based and error fallback outputs.
+        """
+        reasoning = output.reasoning or ""
+        return reasoning == RULE_BASED_REASONING or reasoning.startswith(
+            FALLBACK_REASONING_PREFIX
+        )
+    
+    async def triage_many(self, tickets: list[SupportTicket]) -> list[TriageOutput]:
+        """
+        Triage several tickets concurrently.
+        
+        At most `config.max_concurrency` tickets are in flight at once.
+        
+        Args:
+            tickets: The support tickets to triage.
+        
+        Returns:
+            list[TriageOutput]: Triage outputs in the same order as `tickets`.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        
+        async def _bounded(ticket: SupportTicket) -> TriageOutput:
+            async with semaphore:
+                return await self.triage_async(ticket)
+        
+        return list(await asyncio.gather(*(_bounded(t) for t in tickets)))
+    
+    def triage_batch(
+        self,
+        tickets: list[SupportTicket],
+        batch_size: int = 8
+    ) -> list[TriageOutput]:
+        """
+        Triage tickets in groups, one LLM request per group.
+        
+        Each group is sent as a single multi-task prompt so the system
+        prompt and request overhead are paid once per group. Batched
+        requests do not use tools; business rules are still applied to
+        every ticket. Groups that fail fall back to rule-based triage.
+        
+        Args:
+            tickets: The support tickets to triage.
+            batch_size: Maximum tickets per LLM request.
+        
+        Returns:
+            list[TriageOutput]: Triage outputs in the same order as `tickets`.
+        """
+        if not self.client:
+            logger.info("Using rule-based fallback (no API key)")
+            return [self._rule_based_triage(ticket) for ticket in tickets]
+        
+        outputs: list[TriageOutput] = []
+        for start in range(0, len(tickets), batch_size):
+            batch = tickets[start:start + batch_size]
+            logger.info("Starting batch triage for %s tickets", len(batch))
+            try:
+                response = self._create_completion(
+                    model=self.config.openai_model,
+                    messages=[
+                        self._system_msg,
+                        {"role": "user", "content": self._format_batch_prompt(batch)}
+                    ],
+                    temperature=self.config.openai_temperature,
+                    max_tokens=min(1024 * len(batch), 16384),
+                    extra_body={"prompt_cache_key": self._prompt_cache_key}
+                )
+                results = self._parse_llm_batch_response(
+                    response.choices[0].message.content, batch
+                )
+            except Exception as e:
+                logger.error("LLM batch triage failed: %s, falling back to rules", e)
+                outputs.extend(self._rule_based_triage(ticket) for ticket in batch)
+                continue
+            
+            outputs.extend(
+                self._apply_business_rules(output, ticket)
+                for output, ticket in zip(results, batch)
+            )
+        return outputs
+    
+    def submit_batch(self, tickets: list[SupportTicket]) -> str:
+        """
+        Submit tickets for offline triage via the OpenAI Batch API.
+        
+        Each ticket becomes one chat completion request (without tools).
+        Use `collect_batch` to retrieve the results.
+        
+        Args:
+            tickets: The support tickets to triage. Ticket IDs must be unique.
+        
+        Returns:
+            str: ID of the created batch job.
+        
+        Raises:
+            RuntimeError: If no API key is configured.
+            ValueError: If ticket IDs are not unique.
+        """
+        if not self.client:
+            raise RuntimeError("Batch triage requires an OpenAI API key")
+        
+        ticket_ids = [ticket.ticket_id for ticket in tickets]
+        if len(set(ticket_ids)) != len(ticket_ids):
+            raise ValueError("Ticket IDs must be unique within a batch")
+        
+        lines = [
+            build_batch_line(ticket.ticket_id, {
+                "model": self.config.openai_model,
+                "messages": [
+                    self._system_msg,
+                    {"role": "user", "content": self._format_batch_prompt([ticket])}
+                ],
+                "temperature": self.config.openai_temperature,
+                "max_tokens": 4096,
+                "prompt_cache_key": self._prompt_cache_key
+            })
+            for ticket in tickets
+        ]
+        return submit_batch(self.client, lines)
+    
+    def collect_batch(
+        self,
+        batch_id: str,
+        tickets: list[SupportTicket],
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None
+    ) -> list[TriageOutput]:
+        """
+        Wait for a batch job and turn its results into triage outputs.
+        
+        Tickets without a successful result get a fallback output.
+        
+        Args:
+            batch_id: ID returned by `submit_batch`.
+            tickets: The tickets that were submitted.
+            poll_interval: Seconds between status checks.
+            timeout: Optional maximum seconds to wait.
+        
+        Returns:
+            list[TriageOutput]: Triage outputs in the same order as `tickets`.
+        
+        Raises:
+            RuntimeError: If no API key is configured.
+        """
+        if not self.client:
+            raise RuntimeError("Batch triage requires an OpenAI API key")
+        
+        batch = wait_for_batch(self.client, batch_id, poll_interval, timeout)
+        contents = download_batch_results(self.client, batch)
+        
+        outputs = []
+        for ticket in tickets:
+            content = contents.get(ticket.ticket_id)
+            if content is None:
+                output = self._create_fallback_output(ticket, [], "No batch result returned")
+            else:
+                output = self._parse_llm_batch_response(content, [ticket])[0]
+            outputs.append(self._apply_business_rules(output, ticket))
+        return outputs
+    
+    def _embed_ticket(self, ticket: SupportTicket) -> Optional[list[float]]:
+        """
+        Embed a ticket's text for semantic cache lookups.
+        
+        Args:
+            ticket: The support ticket.
+        
+        Returns:
+            Optional[list[float]]: The embedding, or None if the request failed.
+        """
+        try:
+            response = self._request(
+                self.client.embeddings.create,
+                model=self.config.embedding_model,
+                input=ticket.get_full_text()
+            )
+        except Exception as e:
+            logger.warning("Embedding request failed: %s", e)
+            return None
+        embedding: list[float] = response.data[0].embedding
+        return embedding
+    
+    async def _embed_ticket_async(self, ticket: SupportTicket) -> Optional[list[float]]:
+        """
+        Embed a ticket's text for semantic cache lookups (async).
+        
+        Args:
+            ticket: The support ticket.
+        
+        Returns:
+            Optional[list[float]]: The embedding, or None if the request failed.
+        """
+        try:
+            response = await self._request_async(
+                self._require_aclient().embeddings.create,
+                model=self.config.embedding_model,
+                input=ticket.get_full_text()
+            )
+        except Exception as e:
+            logger.warning("Embedding request failed: %s", e)
+            return None
+        embedding: list[float] = response.data[0].embedding
+        return embedding
+    
+    def _request(
+        self,
+        create: Callable[..., Any],
+        tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Call an OpenAI endpoint, retrying transient errors.
+        
+        Rate limits, connection errors, timeouts and 5xx responses are
+        retried up to `config.max_retries` times. A 429 also lowers the
+        limiter's capacity and waits for its `Retry-After` when given.
+        
+        Args:
+            create: The SDK method to call.
+            tokens: Estimated tokens to reserve from the rate limiter per
+                attempt, or None to bypass the limiter.
+            **kwargs: Arguments for `create`.
+        
+        Returns:
+            Any: The API response.
+        """
+        for attempt in range(self.config.max_retries + 1):
+            if tokens is not None:
+                self.limiter.acquire(tokens)
+            try:
+                return create(**kwargs)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == self.config.max_retries:
+                    raise
+                if isinstance(e, RateLimitError):
+                    self.limiter.record_rate_limit()
+                delay = _retry_delay(e, attempt)
+                logger.warning("OpenAI request failed: %s, retrying in %.1fs", e, delay)
+                time.sleep(delay)
+    
+    async def _request_async(
+        self,
+        create: Callable[..., Awaitable[Any]],
+        tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Call an async OpenAI endpoint, retrying transient errors.
+        
+        Async counterpart of `_request()`.
+        
+        Args:
+            create: The async SDK method to call.
+            tokens: Estimated tokens to reserve from the rate limiter per
+                attempt, or None to bypass the limiter.
+            **kwargs: Arguments for `create`.
+        
+        Returns:
+            Any: The API response.
+        """
+        for attempt in range(self.config.max_retries + 1):
+            if tokens is not None:
+                await self.limiter.acquire_async(tokens)
+            try:
+                return await create(**kwargs)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == self.config.max_retries:
+                    raise
+                if isinstance(e, RateLimitError):
+                    self.limiter.record_rate_limit()
+                delay = _retry_delay(e, attempt)
+                logger.warning("OpenAI request failed: %s, retrying in %.1fs", e, delay)
+                await asyncio.sleep(delay)
+    
+    def _create_completion(self, **kwargs: Any) -> Any:
+        """
+        Create a chat completion under the shared rate limiter.
+        
+        Args:
+            **kwargs: Arguments for `chat.completions.create`.
+        
+        Returns:
+            ChatCompletion: The API response.
+        """
+        tokens = estimate_tokens(kwargs["messages"], kwargs.get("max_tokens", 0))
+        return self._request(self.client.chat.completions.create, tokens, **kwargs)
+    
+    async def _create_completion_async(self, **kwargs: Any) -> Any:
+        """
+        Create a chat completion with the async client under the shared rate limiter.
+        
+        Args:
+            **kwargs: Arguments for `chat.completions.create`.
+        
+        Returns:
+            ChatCompletion: The API response.
+        """
+        tokens = estimate_tokens(kwargs["messages"], kwargs.get("max_tokens", 0))
+        return await self._request_async(
+            self._require_aclient().chat.completions.create, tokens, **kwargs
+        )
     
     def _llm_triage(self, ticket: SupportTicket) -> TriageOutput:
         """
-        Triage using the LLM with tool calls.
+        Triage using the LLM with tool calling.
+        
+        Completions are streamed so the response body is received while
+        the model is still generating.
         
         Args:
             ticket: The support ticket.
@@ -128,43 +825,42 @@ class TriageAgent:
         
         # Prepare the initial messages
         messages = [
-            {"role": "system", "content": get_system_prompt()},
+            self._system_msg,
             {"role": "user", "content": self._format_ticket_prompt(ticket)}
         ]
         
-        # Get tool schemas
-        tools = self.tool_registry.get_schemas()
+        # Results of tool calls already made for this ticket, keyed by
+        # (name, raw arguments), so repeated calls are not re-executed
+        tool_results: dict[tuple[str, str], tuple[dict[str, Any], bool, Optional[str]]] = {}
         
         # Initial API call
-        response = self.client.chat.completions.create(
-            model=self.config.openai_model,
-            messages=messages,
-            tools=tools,
-            tool_choice="auto",
-            temperature=self.config.openai_temperature,
-            max_tokens=4096
-        )
+        message = self._stream_completion(messages=messages)
         
         # Handle tool calls in a loop
         max_iterations = 10
         iteration = 0
         
-        while response.choices[0].message.tool_calls and iteration < max_iterations:
+        while message.get("tool_calls") and iteration < max_iterations:
             iteration += 1
-            assistant_message = response.choices[0].message
-            messages.append(assistant_message)
+            messages.append(message)
             
             # Process each tool call
-            for tool_call in assistant_message.tool_calls:
-                tool_name = tool_call.function.name
-                tool_args = json.loads(tool_call.function.arguments)
+            for tool_call in message["tool_calls"]:
+                tool_name = tool_call["function"]["name"]
+                arguments = tool_call["function"]["arguments"]
+                tool_args = json.loads(arguments)
+                key = (tool_name, arguments)
                 
-                logger.info(f"Executing tool: {tool_name} with args: {tool_args}")
-                
-                # Execute the tool
-                tool_result, success, error_msg = self._execute_tool(
-                    tool_name, tool_args
-                )
+                if key in tool_results:
+                    logger.info("Reusing result for repeated tool call: %s", tool_name)
+                    tool_result, success, error_msg = tool_results[key]
+                else:
+                    logger.info("Executing tool: %s with args: %s", tool_name, tool_args)
+                    
+                    # Execute the tool
+                    tool_result, success, error_msg = tool_results[key] = self._execute_tool(
+                        tool_name, tool_args
+                    )
                 
                 # Record the tool call
                 tool_calls_made.append(ToolCallRecord(
@@ -178,22 +874,118 @@ class TriageAgent:
                 # Add tool result to messages
                 messages.append({
                     "role": "tool",
-                    "tool_call_id": tool_call.id,
+                    "tool_call_id": tool_call["id"],
                     "content": json.dumps(tool_result)
                 })
             
+            # Once the conversation nears the context budget, stop tool
+            # use and ask for the final answer instead of re-sending it again
+            if estimate_tokens(messages) > self._context_budget:
+                logger.info("Context budget reached after %s tool rounds", iteration)
+                messages.append(_FINAL_ANSWER_MESSAGE)
+                message = self._stream_completion(messages=messages, tool_choice="none")
+                break
+            
             # Continue the conversation
-            response = self.client.chat.completions.create(
-                model=self.config.openai_model,
-                messages=messages,
-                tools=tools,
-                tool_choice="auto",
-                temperature=self.config.openai_temperature,
-                max_tokens=4096
-            )
+            message = self._stream_completion(messages=messages)
+        
+        # Parse the final response
+        final_content = message["content"]
+        triage_output = self._parse_llm_response(
+            final_content, ticket, tool_calls_made
+        )
+        
+        # Apply business rule overrides
+        triage_output = self._apply_business_rules(triage_output, ticket)
+        
+        return triage_output
+    
+    async def _llm_triage_async(self, ticket: SupportTicket) -> TriageOutput:
+        """
+        Triage using the async LLM client with concurrent tool calls.
+        
+        Args:
+            ticket: The support ticket.
+        
+        Returns:
+            TriageOutput: LLM-generated triage output.
+        """
+        tool_calls_made: list[ToolCallRecord] = []
+        
+        # Prepare the initial messages
+        messages = [
+            self._system_msg,
+            {"role": "user", "content": self._format_ticket_prompt(ticket)}
+        ]
+        
+        # Results of tool calls already made for this ticket, keyed by
+        # (name, raw arguments), so repeated calls are not re-executed
+        tool_results: dict[tuple[str, str], tuple[dict[str, Any], bool, Optional[str]]] = {}
+        
+        # Initial API call
+        message = await self._stream_completion_async(messages=messages)
+        
+        # Handle tool calls in a loop
+        max_iterations = 10
+        iteration = 0
+        
+        while message.get("tool_calls") and iteration < max_iterations:
+            iteration += 1
+            messages.append(message)
+            
+            calls = [
+                (
+                    tool_call,
+                    tool_call["function"]["name"],
+                    json.loads(tool_call["function"]["arguments"]),
+                    (tool_call["function"]["name"], tool_call["function"]["arguments"]),
+                )
+                for tool_call in message["tool_calls"]
+            ]
+            
+            # Execute each distinct new tool call in this turn concurrently
+            pending = {
+                key: (tool_name, tool_args)
+                for _, tool_name, tool_args, key in calls
+                if key not in tool_results
+            }
+            results = await asyncio.gather(*(
+                self._execute_tool_async(tool_name, tool_args)
+                for tool_name, tool_args in pending.values()
+            ))
+            tool_results.update(zip(pending, results))
+            
+            # Record calls and add results to messages in the original order
+            for tool_call, tool_name, tool_args, key in calls:
+                tool_result, success, error_msg = tool_results[key]
+                tool_calls_made.append(ToolCallRecord(
+                    tool_name=tool_name,
+                    inputs=tool_args,
+                    outputs=tool_result if success else {},
+                    success=success,
+                    error_message=error_msg
+                ))
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call["id"],
+                    "content": json.dumps(tool_result)
+                })
+            
+            # Once the conversation nears the context budget, stop tool
+            # use and ask for the final answer instead of re-sending it again
+            if estimate_tokens(messages) > self._context_budget:
+                logger.info("Context budget reached after %s tool rounds", iteration)
+                messages.append(_FINAL_ANSWER_MESSAGE)
+                message = await self._stream_completion_async(
+                    messages=messages, tool_choice="none"
+                )
+                break
+            
+            # Continue the conversation
+            message = await self._stream_completion_async(messages=messages)
         
         # Parse the final response
-        final_content = response.choices[0].message.content
+        final_content = message["content"]
         triage_output = self._parse_llm_response(
             final_content, ticket, tool_calls_made
         )
@@ -203,6 +995,64 @@ class TriageAgent:
         
         return triage_output
     
+    def _stream_completion(self, messages: list[Any], **overrides: Any) -> dict[str, Any]:
+        """
+        Stream a tool-enabled triage completion and reassemble the message.
+        
+        Args:
+            messages: Conversation so far.
+            **overrides: Request options replacing the shared defaults.
+        
+        Returns:
+            dict: Assistant message with `content` and any `tool_calls`.
+        """
+        stream = self._create_completion(
+            messages=messages, stream=True, **{**self._triage_completion_kwargs(), **overrides}
+        )
+        content_parts: list[str] = []
+        tool_calls: dict[int, dict[str, Any]] = {}
+        for chunk in stream:
+            _merge_stream_chunk(chunk, content_parts, tool_calls)
+        return _assistant_message(content_parts, tool_calls)
+    
+    async def _stream_completion_async(self, messages: list[Any], **overrides: Any) -> dict[str, Any]:
+        """
+        Stream a tool-enabled triage completion with the async client.
+        
+        Args:
+            messages: Conversation so far.
+            **overrides: Request options replacing the shared defaults.
+        
+        Returns:
+            dict: Assistant message with `content` and any `tool_calls`.
+        """
+        stream = await self._create_completion_async(
+            messages=messages, stream=True, **{**self._triage_completion_kwargs(), **overrides}
+        )
+        content_parts: list[str] = []
+        tool_calls: dict[int, dict[str, Any]] = {}
+        async for chunk in stream:
+            _merge_stream_chunk(chunk, content_parts, tool_calls)
+        return _assistant_message(content_parts, tool_calls)
+    
+    def _triage_completion_kwargs(self) -> dict[str, Any]:
+        """
+        Get the request options shared by every single-ticket completion.
+        
+        Returns:
+            dict: Keyword arguments for `chat.completions.create`.
+        """
+        return {
+            "model": self.config.openai_model,
+            "tools": self._tools_schema,
+            "tool_choice": "auto",
+            "response_format": self._response_format,
+            "temperature": self.config.openai_temperature,
+            "max_tokens": 4096,
+            # Sent as extra_body so older SDK versions accept it
+            "extra_body": {"prompt_cache_key": self._prompt_cache_key},
+        }
+    
     def _execute_tool(
         self,
         tool_name: str,
@@ -229,12 +1079,30 @@ class TriageAgent:
             return result.model_dump(), True, None
             
         except ToolExecutionError as e:
-            logger.error(f"Tool execution error: {e}")
+            logger.error("Tool execution error: %s", e)
             return {"error": str(e)}, False, str(e)
         except Exception as e:
-            logger.error(f"Unexpected tool error: {e}")
+            logger.error("Unexpected tool error: %s", e)
             return {"error": str(e)}, False, str(e)
     
+    async def _execute_tool_async(
+        self,
+        tool_name: str,
+        tool_args: dict[str, Any]
+    ) -> tuple[dict[str, Any], bool, Optional[str]]:
+        """
+        Execute a (synchronous) tool in a worker thread.
+        
+        Args:
+            tool_name: Name of the tool to execute.
+            tool_args: Arguments to pass to the tool.
+        
+        Returns:
+            Tuple of (result_dict, success_bool, error_message_or_none)
+        """
+        logger.info("Executing tool: %s with args: %s", tool_name, tool_args)
+        return await asyncio.to_thread(self._execute_tool, tool_name, tool_args)
+    
     def _format_ticket_prompt(self, ticket: SupportTicket) -> str:
         """
         Format the ticket as a prompt for the LLM.
@@ -245,31 +1113,53 @@ class TriageAgent:
         Returns:
             str: Formatted prompt text.
         """
-        tool_reminder = get_tool_usage_prompt(self.tool_registry.get_names())
-        json_reminder = get_json_schema_prompt()
+        fields = self._ticket_fields(ticket)
+        fields["tool_reminder"] = self._tool_reminder
+        fields["json_reminder"] = self._json_reminder
+        return _TICKET_PROMPT_TEMPLATE.format_map(fields)
+    
+    def _format_batch_prompt(self, tickets: list[SupportTicket]) -> str:
+        """
+        Format several tickets as a single multi-task prompt.
         
-        return f"""Please triage the following support ticket:
-
-        ---
-        TICKET ID: {ticket.ticket_id}
-        SUBJECT: {ticket.subject}
-        CUSTOMER EMAIL: {ticket.customer_email}
-        CUSTOMER NAME: {ticket.customer_name or 'Not provided'}
-        CUSTOMER TIER: {ticket.customer_tier}
-        CUSTOMER REGION: {ticket.customer_region or 'Not specified'}
-        CHANNEL: {ticket.channel}
-        TIMESTAMP: {ticket.timestamp or 'Not provided'}
-
-        TICKET BODY:
-        {ticket.body}
-        ---
-
-        {tool_reminder}
-
-        After using the tools, provide your final triage assessment.
-
-        {json_reminder}
+        Args:
+            tickets: The support tickets, in result order.
+        
+        Returns:
+            str: Formatted prompt text.
+        """
+        blocks = "\n\n".join(
+            _BATCH_TICKET_TEMPLATE.format_map({**self._ticket_fields(ticket), "index": index})
+            for index, ticket in enumerate(tickets)
+        )
+        return _BATCH_PROMPT_TEMPLATE.format_map({
+            "count": len(tickets),
+            "blocks": blocks,
+            "json_reminder": self._json_reminder,
+        })
+    
+    @staticmethod
+    def _ticket_fields(ticket: SupportTicket) -> dict[str, Any]:
+        """
+        Collect the ticket values substituted into prompt templates.
+        
+        Args:
+            ticket: The support ticket.
+        
+        Returns:
+            dict: Template field values.
         """
+        return {
+            "ticket_id": ticket.ticket_id,
+            "subject": ticket.subject,
+            "customer_email": ticket.customer_email,
+            "customer_name": ticket.customer_name or "Not provided",
+            "customer_tier": ticket.customer_tier,
+            "customer_region": ticket.customer_region or "Not specified",
+            "channel": ticket.channel,
+            "timestamp": ticket.timestamp.isoformat() if ticket.timestamp else "Not provided",
+            "body": ticket.body,
+        }
     
     def _parse_llm_response(
         self,
@@ -288,59 +1178,142 @@ class TriageAgent:
         Returns:
             TriageOutput: Parsed triage output.
         """
+        # Structured outputs normally match the TriageOutput schema exactly
         try:
-            # Clean up the response (remove markdown code blocks if present)
-            content = content.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-            content = content.strip()
-            
-            # Parse JSON
-            data = json.loads(content)
-            
-            # Extract KB results
-            kb_results = []
-            for kb in data.get("knowledge_base_results", []):
-                kb_results.append(KnowledgeBaseResult(
-                    id=kb.get("id", ""),
-                    title=kb.get("title", ""),
-                    url=kb.get("url", ""),
-                    relevance_score=float(kb.get("relevance_score", 0.0)),
-                    snippet=kb.get("snippet")
-                ))
-            
-            # Parse risk signals
-            risk_signals = []
-            for signal in data.get("customer_risk_signals", []):
-                try:
-                    risk_signals.append(RiskSignal(signal))
-                except ValueError:
-                    logger.warning(f"Unknown risk signal: {signal}")
-            
-            return TriageOutput(
-                ticket_id=ticket.ticket_id,
-                urgency=UrgencyLevel(data.get("urgency", "medium")),
-                product=data.get("product"),
-                issue_type=IssueType(data.get("issue_type", "other")),
-                customer_sentiment=CustomerSentiment(data.get("customer_sentiment", "neutral")),
-                customer_risk_signals=risk_signals,
-                recommended_action=RecommendedAction(data.get("recommended_action", "route_to_specialist")),
-                recommended_specialist_queue=SpecialistQueue(data.get("recommended_specialist_queue", "none")),
-                knowledge_base_results=kb_results,
-                suggested_reply=data.get("suggested_reply"),
-                tool_calls=tool_calls,
-                confidence_score=float(data.get("confidence_score", 0.8)),
-                reasoning=data.get("reasoning")
+            parsed = TriageOutput.model_validate_json(content)
+        except ValidationError:
+            pass
+        else:
+            return parsed.model_copy(
+                update={"ticket_id": ticket.ticket_id, "tool_calls": tool_calls}
             )
+        
+        # Otherwise parse leniently, filling defaults for missing fields
+        try:
+            content = self._strip_code_fence(content)
+            data = json.loads(content)
+            return self._output_from_data(data, ticket, tool_calls)
             
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            logger.error(f"Failed to parse LLM response: {e}")
-            logger.debug(f"Raw content: {content}")
+        except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+            logger.error("Failed to parse LLM response: %s", e)
+            logger.debug("Raw content: %s", content)
             # Return a safe fallback
             return self._create_fallback_output(ticket, tool_calls, str(e))
     
+    def _parse_llm_batch_response(
+        self,
+        content: str,
+        tickets: list[SupportTicket]
+    ) -> list[TriageOutput]:
+        """
+        Parse a multi-ticket LLM response into one TriageOutput per ticket.
+        
+        Entries that are missing or malformed get a fallback output
+        without affecting the rest of the batch.
+        
+        Args:
+            content: Raw LLM response content.
+            tickets: The tickets in the order they were sent.
+        
+        Returns:
+            list[TriageOutput]: Parsed triage outputs, in ticket order.
+        """
+        try:
+            results = json.loads(self._strip_code_fence(content))["results"]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.error("Failed to parse LLM batch response: %s", e)
+            logger.debug("Raw content: %s", content)
+            return [self._create_fallback_output(t, [], str(e)) for t in tickets]
+        
+        outputs = []
+        for index, ticket in enumerate(tickets):
+            try:
+                outputs.append(self._output_from_data(results[index], ticket, []))
+            except (IndexError, KeyError, ValueError, TypeError, AttributeError) as e:
+                logger.error("Failed to parse batch entry %s: %s", index, e)
+                outputs.append(self._create_fallback_output(ticket, [], str(e)))
+        return outputs
+    
+    @staticmethod
+    def _strip_code_fence(content: str) -> str:
+        """
+        Remove a surrounding markdown code block from an LLM response.
+        
+        Args:
+            content: Raw LLM response content.
+        
+        Returns:
+            str: The response with any code fence removed.
+        """
+        content = content.strip()
+        if content.startswith("```"):
+            content = content.split("```")[1]
+            if content.startswith("json"):
+                content = content[4:]
+        return content.strip()
+    
+    def _output_from_data(
+        self,
+        data: dict[str, Any],
+        ticket: SupportTicket,
+        tool_calls: list[ToolCallRecord]
+    ) -> TriageOutput:
+        """
+        Build a TriageOutput from a decoded LLM JSON object.
+        
+        Args:
+            data: Decoded triage object.
+            ticket: The original ticket.
+            tool_calls: List of tool calls made.
+        
+        Returns:
+            TriageOutput: Parsed triage output.
+        
+        Raises:
+            ValueError: If a score is not numeric.
+        """
+        # Extract KB results
+        kb_results = []
+        for kb in data.get("knowledge_base_results", []):
+            kb_results.append(KnowledgeBaseResult(
+                id=kb.get("id", ""),
+                title=kb.get("title", ""),
+                url=kb.get("url", ""),
+                relevance_score=float(kb.get("relevance_score", 0.0)),
+                snippet=kb.get("snippet")
+            ))
+        
+        # Parse risk signals
+        risk_signals = []
+        for signal in data.get("customer_risk_signals", []):
+            risk = RISK_BY_VALUE.get(signal)
+            if risk is None:
+                logger.warning("Unknown risk signal: %s", signal)
+                continue
+            risk_signals.append(risk)
+        
+        return TriageOutput(
+            ticket_id=ticket.ticket_id,
+            urgency=URGENCY_BY_VALUE.get(data.get("urgency", ""), UrgencyLevel.MEDIUM),
+            product=data.get("product"),
+            issue_type=ISSUE_BY_VALUE.get(data.get("issue_type", ""), IssueType.OTHER),
+            customer_sentiment=SENTIMENT_BY_VALUE.get(
+                data.get("customer_sentiment", ""), CustomerSentiment.NEUTRAL
+            ),
+            customer_risk_signals=risk_signals,
+            recommended_action=ACTION_BY_VALUE.get(
+                data.get("recommended_action", ""), RecommendedAction.ROUTE_TO_SPECIALIST
+            ),
+            recommended_specialist_queue=QUEUE_BY_VALUE.get(
+                data.get("recommended_specialist_queue", ""), SpecialistQueue.NONE
+            ),
+            knowledge_base_results=kb_results,
+            suggested_reply=data.get("suggested_reply"),
+            tool_calls=tool_calls,
+            confidence_score=float(data.get("confidence_score", 0.8)),
+            reasoning=data.get("reasoning")
+        )
+    
     def _create_fallback_output(
         self,
         ticket: SupportTicket,
@@ -358,7 +1331,8 @@ class TriageAgent:
         Returns:
             TriageOutput: Safe fallback output.
         """
-        return TriageOutput(
+        # Every value is a known-valid constant, so skip validation
+        return TriageOutput.model_construct(
             ticket_id=ticket.ticket_id,
             urgency=UrgencyLevel.MEDIUM,
             product=None,
@@ -371,7 +1345,7 @@ class TriageAgent:
             suggested_reply=None,
             tool_calls=tool_calls,
             confidence_score=0.3,
-            reasoning=f"Fallback triage due to parsing error: {error}"
+            reasoning=FALLBACK_REASONING_PREFIX + error
         )
     
     def _apply_business_rules(
@@ -389,44 +1363,55 @@ class TriageAgent:
         Returns:
             TriageOutput: Output with business rules applied.
         """
+        # Scan the ticket text once for every keyword rule below
+        tags = self.triage_logic.scan(ticket.full_text_lower)
+        
         # Check for urgency override
+        urgency = output.urgency
         urgency_override = self.triage_logic.calculate_urgency_override(
-            ticket, output.urgency.value
+            ticket, urgency.value, tags
         )
         if urgency_override:
-            output.urgency = urgency_override
+            urgency = urgency_override
         
         # Add any missed risk signals
-        detected_signals = self.triage_logic.detect_risk_signals(ticket)
-        for signal in detected_signals:
-            if signal not in output.customer_risk_signals:
-                output.customer_risk_signals.append(signal)
+        risk_signals = list(output.customer_risk_signals)
+        for signal in self.triage_logic.detect_risk_signals(ticket, tags):
+            if signal not in risk_signals:
+                risk_signals.append(signal)
         
         # Recalculate action based on updated urgency and signals
         has_kb = len(output.knowledge_base_results) > 0
+        action = output.recommended_action
         new_action = self.triage_logic.determine_action(
-            output.urgency,
+            urgency,
             output.customer_sentiment,
             output.issue_type,
-            output.customer_risk_signals,
+            risk_signals,
             ticket,
             has_kb
         )
         
         # Only override if our rules say to escalate/route
-        if new_action.value != output.recommended_action.value:
+        if new_action.value != action.value:
             if new_action in [RecommendedAction.ESCALATE_TO_HUMAN, RecommendedAction.ROUTE_TO_SPECIALIST]:
-                output.recommended_action = new_action
+                action = new_action
         
         # Update specialist queue
-        output.recommended_specialist_queue = self.triage_logic.determine_specialist_queue(
+        queue = self.triage_logic.determine_specialist_queue(
             output.issue_type,
-            output.urgency,
+            urgency,
             ticket,
-            output.customer_risk_signals
+            risk_signals
         )
         
-        return output
+        # Outputs are frozen, so return an updated copy
+        return output.model_copy(update={
+            "urgency": urgency,
+            "customer_risk_signals": risk_signals,
+            "recommended_action": action,
+            "recommended_specialist_queue": queue,
+        })
     
     def _rule_based_triage(self, ticket: SupportTicket) -> TriageOutput:
         """
@@ -440,87 +1425,141 @@ class TriageAgent:
         Returns:
             TriageOutput: Rule-based triage output.
         """
-        logger.info(f"Performing rule-based triage for: {ticket.ticket_id}")
+        logger.info("Performing rule-based triage for: %s", ticket.ticket_id)
+        kb_input, history_input = self._rule_based_tool_inputs(ticket)
         
-        tool_calls: list[ToolCallRecord] = []
-        kb_results: list[KnowledgeBaseResult] = []
+        # Both lookups are in-memory and cached, so a thread hop would cost
+        # more than it saves; only the async path runs them concurrently
+        return self._build_rule_based_output(
+            ticket,
+            kb_input, _call_outcome(self._kb_tool, kb_input),
+            history_input, _call_outcome(self._history_tool, history_input)
+        )
+    
+    async def _rule_based_triage_async(self, ticket: SupportTicket) -> TriageOutput:
+        """
+        Perform rule-based triage without LLM (async).
+        
+        Args:
+            ticket: The support ticket.
         
-        # Execute tools manually
-        # 1. Search knowledge base
-        from src.triage_agent.tools.knowledge_base import KnowledgeBaseTool
-        from src.triage_agent.models.tools import KnowledgeBaseInput
+        Returns:
+            TriageOutput: Rule-based triage output.
+        """
+        logger.info("Performing rule-based triage for: %s", ticket.ticket_id)
+        kb_input, history_input = self._rule_based_tool_inputs(ticket)
+        
+        kb_outcome, history_outcome = await asyncio.gather(
+            self._kb_tool.execute_async(kb_input),
+            self._history_tool.execute_async(history_input),
+            return_exceptions=True
+        )
+        
+        return self._build_rule_based_output(
+            ticket, kb_input, kb_outcome, history_input, history_outcome
+        )
+    
+    @staticmethod
+    def _rule_based_tool_inputs(
+        ticket: SupportTicket
+    ) -> tuple[KnowledgeBaseInput, CustomerHistoryInput]:
+        """
+        Build the tool inputs used by the rule-based fallback.
         
-        kb_tool = KnowledgeBaseTool()
+        Args:
+            ticket: The support ticket.
+        
+        Returns:
+            Tuple of (knowledge_base_input, customer_history_input)
+        """
         query_terms = ticket.subject.lower().split()[:4]
-        kb_input = KnowledgeBaseInput(query=" ".join(query_terms))
+        return (
+            KnowledgeBaseInput(query=" ".join(query_terms)),
+            CustomerHistoryInput(customer_email=ticket.customer_email),
+        )
+    
+    def _build_rule_based_output(
+        self,
+        ticket: SupportTicket,
+        kb_input: KnowledgeBaseInput,
+        kb_outcome: Any,
+        history_input: CustomerHistoryInput,
+        history_outcome: Any
+    ) -> TriageOutput:
+        """
+        Combine tool results and keyword rules into a triage output.
         
-        try:
-            kb_output = kb_tool.execute(kb_input)
+        Args:
+            ticket: The support ticket.
+            kb_input: Knowledge base search input.
+            kb_outcome: Knowledge base output, or the exception it raised.
+            history_input: Customer history input.
+            history_outcome: Customer history output, or the exception it raised.
+        
+        Returns:
+            TriageOutput: Rule-based triage output.
+        """
+        tool_calls: list[ToolCallRecord] = []
+        kb_results: list[KnowledgeBaseResult] = []
+        
+        # 1. Knowledge base results
+        if isinstance(kb_outcome, BaseException):
+            logger.error("KB search failed: %s", kb_outcome)
+        else:
             tool_calls.append(ToolCallRecord(
                 tool_name="knowledge_base_search",
                 inputs=kb_input.model_dump(),
-                outputs=kb_output.model_dump(),
+                outputs=kb_outcome.model_dump(),
                 success=True
             ))
             
-            for article in kb_output.results[:3]:
-                kb_results.append(KnowledgeBaseResult(
+            for article in kb_outcome.results[:3]:
+                # Articles were already validated by the KB tool
+                kb_results.append(KnowledgeBaseResult.model_construct(
                     id=article.id,
                     title=article.title,
                     url=article.url,
                     relevance_score=article.relevance_score
                 ))
-        except Exception as e:
-            logger.error(f"KB search failed: {e}")
-        
-        # 2. Check customer history
-        from src.triage_agent.tools.customer_history import CustomerHistoryTool
-        from src.triage_agent.models.tools import CustomerHistoryInput
-        
-        history_tool = CustomerHistoryTool()
-        history_input = CustomerHistoryInput(customer_email=ticket.customer_email)
         
-        customer_tier = ticket.customer_tier
-        try:
-            history_output = history_tool.execute(history_input)
+        # 2. Customer history
+        if isinstance(history_outcome, BaseException):
+            logger.error("Customer history lookup failed: %s", history_outcome)
+        else:
             tool_calls.append(ToolCallRecord(
                 tool_name="customer_history",
                 inputs=history_input.model_dump(),
-                outputs=history_output.model_dump(),
+                outputs=history_outcome.model_dump(),
                 success=True
             ))
-            customer_tier = history_output.account_tier
-        except Exception as e:
-            logger.error(f"Customer history lookup failed: {e}")
+        
+        # Scan the ticket text once for every keyword rule below
+        tags = self.triage_logic.scan(ticket.full_text_lower)
         
         # Detect issue type from keywords
-        issue_type = self.triage_logic.detect_issue_type_from_keywords(ticket)
+        issue_type = self.triage_logic.detect_issue_type_from_keywords(ticket, tags)
         if not issue_type:
             issue_type = IssueType.OTHER
         
         # Determine urgency
         urgency = UrgencyLevel.MEDIUM
-        text = ticket.get_full_text().lower()
         
-        if any(kw in text for kw in ["urgent", "critical", "emergency", "down", "asap"]):
+        if "fallback_urgent" in tags:
             urgency = UrgencyLevel.HIGH
-        if ticket.is_enterprise() and "down" in text:
+        if ticket.is_enterprise() and "down" in tags:
             urgency = UrgencyLevel.CRITICAL
         if issue_type == IssueType.FEATURE_REQUEST:
             urgency = UrgencyLevel.LOW
         
         # Detect sentiment (simple keyword-based)
         sentiment = CustomerSentiment.NEUTRAL
-        negative_words = ["frustrated", "angry", "terrible", "worst", "unacceptable", "disappointed"]
-        positive_words = ["thanks", "great", "love", "amazing", "appreciate"]
-        
-        if any(w in text for w in negative_words):
+        if "sentiment_negative" in tags:
             sentiment = CustomerSentiment.NEGATIVE
-        if any(w in text for w in positive_words):
+        if "sentiment_positive" in tags:
             sentiment = CustomerSentiment.POSITIVE
         
         # Detect risk signals
-        risk_signals = self.triage_logic.detect_risk_signals(ticket)
+        risk_signals = self.triage_logic.detect_risk_signals(ticket, tags)
         
         # Determine action
         action = self.triage_logic.determine_action(
@@ -532,7 +1571,8 @@ class TriageAgent:
             issue_type, urgency, ticket, risk_signals
         )
         
-        return TriageOutput(
+        # All fields come from TriageLogic enums or validated tool output
+        return TriageOutput.model_construct(
             ticket_id=ticket.ticket_id,
             urgency=urgency,
             product=None,
@@ -545,5 +1585,5 @@ class TriageAgent:
             suggested_reply=None,
             tool_calls=tool_calls,
             confidence_score=0.6,
-            reasoning="Rule-based triage (LLM unavailable)"
+            reasoning=RULE_BASED_REASONING
         )
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""
+Batch Job Module
+=================
+
+Helpers for triaging large ticket backlogs with the OpenAI Batch API.
+
+Batch jobs trade latency (up to 24 hours) for lower cost and higher
+throughput, which suits overnight or bulk-import triage. Requests are
+written as JSONL, uploaded, and processed asynchronously by OpenAI;
+results are downloaded once the job completes.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Optional
+
+from openai import OpenAI
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+class BatchJobError(Exception):
+    """
+    Exception raised when a batch job does not complete successfully.
+
+    Attributes:
+        batch_id: ID of the batch job.
+        status: Final status reported by the API.
+    """
+
+    def __init__(self, batch_id: str, status: str):
+        self.batch_id = batch_id
+        self.status = status
+        super().__init__(f"Batch '{batch_id}' ended with status: {status}")
+
+
+def build_batch_line(custom_id: str, body: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build one JSONL request entry for the Batch API.
+
+    Args:
+        custom_id: Identifier used to match the result to its request.
+        body: Chat completion request body.
+
+    Returns:
+        dict: The batch request entry.
+    """
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": body,
+    }
+
+
+def submit_batch(client: OpenAI, lines: list[dict[str, Any]]) -> str:
+    """
+    Upload batch requests and start a batch job.
+
+    Args:
+        client: OpenAI client.
+        lines: Request entries from `build_batch_line`.
+
+    Returns:
+        str: ID of the created batch job.
+    """
+    payload = "\n".join(json.dumps(line) for line in lines).encode("utf-8")
+    input_file = client.files.create(
+        file=("triage_batch.jsonl", payload),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window="24h"
+    )
+    logger.info("Submitted batch %s with %s requests", batch.id, len(lines))
+    return batch.id
+
+
+def wait_for_batch(
+    client: OpenAI,
+    batch_id: str,
+    poll_interval: float = 30.0,
+    timeout: Optional[float] = None
+) -> Any:
+    """
+    Poll a batch job until it reaches a terminal status.
+
+    Args:
+        client: OpenAI client.
+        batch_id: ID of the batch job.
+        poll_interval: Seconds between status checks.
+        timeout: Optional maximum seconds to wait.
+
+    Returns:
+        Batch: The completed batch job.
+
+    Raises:
+        BatchJobError: If the job fails, expires, or is cancelled.
+        TimeoutError: If `timeout` elapses first.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in TERMINAL_STATUSES:
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(f"Batch '{batch_id}' still {batch.status} after {timeout}s")
+        logger.debug("Batch %s status: %s", batch_id, batch.status)
+        time.sleep(poll_interval)
+
+    if batch.status != "completed":
+        raise BatchJobError(batch_id, batch.status)
+    return batch
+
+
+def download_batch_results(client: OpenAI, batch: Any) -> dict[str, str]:
+    """
+    Download the message content of each successful batch request.
+
+    Args:
+        client: OpenAI client.
+        batch: A completed batch job.
+
+    Returns:
+        dict[str, str]: Response content keyed by custom_id.
+    """
+    if not batch.output_file_id:
+        return {}
+
+    results: dict[str, str] = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        response = entry.get("response") or {}
+        if response.get("status_code") != 200:
+            logger.warning(
+                "Batch request %s failed: %s", entry.get("custom_id"), entry.get("error")
+            )
+            continue
+        results[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+    return results
@@ -0,0 +1,210 @@
+"""
+Triage Cache Module
+====================
+
+In-memory cache of LLM triage results.
+
+Support tickets are highly repetitive (password resets, billing
+questions), so identical or near-identical tickets can reuse an
+earlier LLM result instead of paying for another round-trip.
+
+Two lookup tiers are provided:
+    1. Exact: SHA-256 over the model settings and normalized ticket content.
+    2. Semantic (optional): cosine similarity between ticket embeddings,
+       only among entries stored under the same scope (customer tier).
+"""
+
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.triage_agent.models.ticket import SupportTicket
+from src.triage_agent.models.triage_output import TriageOutput
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(ticket: SupportTicket, model: str, temperature: float) -> str:
+    """
+    Build the exact-match cache key for a ticket.
+
+    Every ticket field the LLM or its tools can see is part of the key, so
+    tickets from different customers never share an entry. Only the ticket
+    ID and timestamp are left out, and subject and body are compared
+    case- and whitespace-insensitively.
+
+    Args:
+        ticket: The support ticket.
+        model: Model name used for triage.
+        temperature: Sampling temperature used for triage.
+
+    Returns:
+        str: Hex SHA-256 digest identifying the ticket content and settings.
+    """
+    fields = ticket.model_dump(mode="json", exclude={"ticket_id", "timestamp"})
+    fields["subject"] = ticket.subject.strip().lower()
+    fields["body"] = ticket.body.strip().lower()
+    raw = f"{model}|{temperature}|{json.dumps(fields, sort_keys=True)}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def cosine_similarity(a: list[float], b: list[float]) -> float:
+    """
+    Compute the cosine similarity of two vectors.
+
+    Args:
+        a: First vector.
+        b: Second vector.
+
+    Returns:
+        float: Similarity in [-1, 1], or 0.0 if either vector is zero.
+    """
+    norm_a = math.sqrt(math.fsum(x * x for x in a))
+    norm_b = math.sqrt(math.fsum(y * y for y in b))
+    if not norm_a or not norm_b:
+        return 0.0
+    return math.fsum(x * y for x, y in zip(a, b)) / (norm_a * norm_b)
+
+
+class TriageCache:
+    """
+    Thread-safe LRU cache of triage outputs with per-entry expiry.
+
+    Entries are keyed by `make_cache_key`. When an embedding is stored
+    alongside an entry, `get_similar` can return it for tickets in the
+    same scope whose embedding is close enough.
+
+    Attributes:
+        max_entries: Maximum number of entries kept (0 disables the cache).
+        ttl_seconds: Seconds an entry remains valid.
+
+    Example:
+        >>> cache = TriageCache(max_entries=128, ttl_seconds=600)
+        >>> cache.put(key, output)
+        >>> cache.get(key)
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept (0 disables the cache).
+            ttl_seconds: Seconds an entry remains valid.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[
+            str, tuple[float, TriageOutput, Optional[list[float]], Optional[str]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[TriageOutput]:
+        """
+        Look up an exact-match entry.
+
+        Args:
+            key: Cache key from `make_cache_key`.
+
+        Returns:
+            Optional[TriageOutput]: The cached output, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, output, _, _ = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return output
+
+    def get_similar(
+        self,
+        embedding: list[float],
+        threshold: float,
+        scope: Optional[str] = None
+    ) -> Optional[TriageOutput]:
+        """
+        Look up the closest entry by embedding similarity.
+
+        Args:
+            embedding: Embedding of the incoming ticket.
+            threshold: Minimum cosine similarity for a hit.
+            scope: Only entries stored under this scope are considered.
+
+        Returns:
+            Optional[TriageOutput]: The most similar cached output, or None.
+        """
+        now = time.monotonic()
+        best_key: Optional[str] = None
+        best_score = threshold
+
+        # Score a snapshot without the lock so exact lookups and stores
+        # from other threads are not blocked behind the full scan
+        with self._lock:
+            candidates = [
+                (key, stored)
+                for key, (expires_at, _, stored, stored_scope) in self._entries.items()
+                if stored is not None and stored_scope == scope and expires_at >= now
+            ]
+
+        for key, stored in candidates:
+            score = cosine_similarity(embedding, stored)
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(best_key)
+            if entry is None:
+                return None
+
+            logger.debug("Semantic cache hit (similarity %.3f)", best_score)
+            self._entries.move_to_end(best_key)
+            return entry[1]
+
+    def put(
+        self,
+        key: str,
+        output: TriageOutput,
+        embedding: Optional[list[float]] = None,
+        scope: Optional[str] = None
+    ) -> None:
+        """
+        Store a triage output.
+
+        Args:
+            key: Cache key from `make_cache_key`.
+            output: Triage output to store.
+            embedding: Optional ticket embedding for semantic lookups.
+            scope: Scope that semantic lookups must match to return this entry.
+        """
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + self.ttl_seconds, output, embedding, scope
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,199 @@
+"""
+Rate Limiter Module
+====================
+
+Client-side throttling for OpenAI requests.
+
+Requests reserve capacity from two token buckets, one for requests per
+minute and one for tokens per minute, before they are sent. This keeps
+bulk triage under the account limits instead of relying on 429 errors
+and blind retries. When a 429 still happens, the buckets are drained
+and their capacity reduced so the whole client backs off together.
+Capacity then recovers toward the configured limits while no further
+429s arrive. Either limit may be None to leave that dimension unthrottled.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio for English text
+CHARS_PER_TOKEN = 4
+
+# Fraction of capacity kept after each rate limit error
+BACKOFF_FACTOR = 0.9
+
+# Fraction of the configured limit regained per minute without a 429
+RECOVERY_PER_MINUTE = 0.1
+
+
+def estimate_tokens(messages: list[Any], max_tokens: int = 0) -> int:
+    """
+    Estimate the tokens a chat completion request will consume.
+
+    Args:
+        messages: Chat messages (dicts or message objects).
+        max_tokens: Completion token limit of the request.
+
+    Returns:
+        int: Estimated prompt plus completion tokens.
+    """
+    chars = 0
+    for message in messages:
+        content = message.get("content") if isinstance(message, dict) else getattr(message, "content", None)
+        if content:
+            chars += len(content)
+    return chars // CHARS_PER_TOKEN + max_tokens
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket for requests and tokens per minute.
+
+    Both sync and async callers share the same buckets. A limit of None
+    disables that bucket; with both disabled every request goes straight
+    through.
+
+    Attributes:
+        max_requests_per_minute: Current request capacity per minute, or None.
+        max_tokens_per_minute: Current token capacity per minute, or None.
+
+    Example:
+        >>> limiter = RateLimiter(500, 800_000)
+        >>> limiter.acquire(estimate_tokens(messages, 4096))
+    """
+
+    def __init__(
+        self,
+        max_requests_per_minute: Optional[float],
+        max_tokens_per_minute: Optional[float]
+    ):
+        """
+        Initialize the limiter with full buckets.
+
+        Args:
+            max_requests_per_minute: Requests allowed per minute (None for no limit).
+            max_tokens_per_minute: Tokens allowed per minute (None for no limit).
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self._request_limit = max_requests_per_minute
+        self._token_limit = max_tokens_per_minute
+        self._available_requests = float(max_requests_per_minute or 0)
+        self._available_tokens = float(max_tokens_per_minute or 0)
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether either bucket is limited."""
+        return self._request_limit is not None or self._token_limit is not None
+
+    def _refill(self) -> None:
+        """Add capacity and recover lowered limits for the elapsed time."""
+        now = time.monotonic()
+        minutes = (now - self._last_update) / 60
+        self._last_update = now
+
+        if self._request_limit is not None:
+            self.max_requests_per_minute = min(
+                self._request_limit,
+                self.max_requests_per_minute + minutes * RECOVERY_PER_MINUTE * self._request_limit
+            )
+            self._available_requests = min(
+                self.max_requests_per_minute,
+                self._available_requests + minutes * self.max_requests_per_minute
+            )
+        if self._token_limit is not None:
+            self.max_tokens_per_minute = min(
+                self._token_limit,
+                self.max_tokens_per_minute + minutes * RECOVERY_PER_MINUTE * self._token_limit
+            )
+            self._available_tokens = min(
+                self.max_tokens_per_minute,
+                self._available_tokens + minutes * self.max_tokens_per_minute
+            )
+
+    def try_acquire(self, tokens: int) -> float:
+        """
+        Reserve capacity for one request if available.
+
+        Args:
+            tokens: Estimated tokens for the request.
+
+        Returns:
+            float: 0.0 if reserved, otherwise seconds to wait before retrying.
+        """
+        if not self.enabled:
+            return 0.0
+
+        with self._lock:
+            self._refill()
+            requests_ok = self._request_limit is None or self._available_requests >= 1
+            # A request larger than the whole bucket would never fit
+            if self._token_limit is not None:
+                tokens = min(tokens, self.max_tokens_per_minute)
+            tokens_ok = self._token_limit is None or self._available_tokens >= tokens
+            if requests_ok and tokens_ok:
+                if self._request_limit is not None:
+                    self._available_requests -= 1
+                if self._token_limit is not None:
+                    self._available_tokens -= tokens
+                return 0.0
+
+            request_wait = token_wait = 0.0
+            if not requests_ok:
+                request_wait = (1 - self._available_requests) * 60 / self.max_requests_per_minute
+            if not tokens_ok:
+                token_wait = (tokens - self._available_tokens) * 60 / self.max_tokens_per_minute
+            return max(request_wait, token_wait, 0.01)
+
+    def acquire(self, tokens: int) -> None:
+        """
+        Block until capacity for one request is reserved.
+
+        Args:
+            tokens: Estimated tokens for the request.
+        """
+        while wait := self.try_acquire(tokens):
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: int) -> None:
+        """
+        Wait without blocking the event loop until capacity is reserved.
+
+        Args:
+            tokens: Estimated tokens for the request.
+        """
+        while wait := self.try_acquire(tokens):
+            await asyncio.sleep(wait)
+
+    def record_rate_limit(self) -> None:
+        """
+        Drain the buckets and lower capacity after a 429 response.
+
+        The lowered capacity climbs back to the configured limits by
+        `RECOVERY_PER_MINUTE` of each limit per minute.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._refill()
+            if self._request_limit is not None:
+                self.max_requests_per_minute = max(1.0, self.max_requests_per_minute * BACKOFF_FACTOR)
+            if self._token_limit is not None:
+                self.max_tokens_per_minute = max(1.0, self.max_tokens_per_minute * BACKOFF_FACTOR)
+            self._available_requests = 0.0
+            self._available_tokens = 0.0
+            self._last_update = time.monotonic()
+        logger.warning(
+            "Rate limited; capacity lowered to %.0f RPM, %.0f TPM",
+            self.max_requests_per_minute or math.inf,
+            self.max_tokens_per_minute or math.inf
+        )
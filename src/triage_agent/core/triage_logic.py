@@ -10,7 +10,8 @@ LLM decisions with rule-based overrides and validation.
 
 import logging
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Sequence
 
 from src.triage_agent.models.ticket import SupportTicket
 from src.triage_agent.models.triage_output import (
@@ -25,6 +26,55 @@ from src.triage_agent.models.triage_output import (
 logger = logging.getLogger(__name__)
 
 
+class _KeywordScanner:
+    """
+    Reports which keyword groups occur in a text using one regex pass.
+    
+    All keywords are compiled into a single lookahead alternation
+    (longest first), so every start position is tried once. A matched
+    keyword also reports the groups of any keyword it contains, which
+    keeps the result identical to plain substring checks per group.
+    """
+    
+    def __init__(self, groups: dict[str, Sequence[str]]):
+        """
+        Build the scanner.
+        
+        Args:
+            groups: Mapping of group tag to its keywords.
+        """
+        tags_by_keyword: dict[str, set[str]] = {}
+        for tag, keywords in groups.items():
+            for keyword in keywords:
+                tags_by_keyword.setdefault(keyword, set()).add(tag)
+        
+        self._tags = {
+            keyword: frozenset().union(*(
+                tags for other, tags in tags_by_keyword.items() if other in keyword
+            ))
+            for keyword in tags_by_keyword
+        }
+        alternation = "|".join(
+            re.escape(keyword)
+            for keyword in sorted(tags_by_keyword, key=len, reverse=True)
+        )
+        self._pattern = re.compile(f"(?=({alternation}))")
+    
+    def scan(self, text: str) -> frozenset[str]:
+        """
+        Find the keyword groups present in a text.
+        
+        Args:
+            text: Lowercased text to scan.
+        
+        Returns:
+            frozenset[str]: Tags of every group with at least one match.
+        """
+        return frozenset().union(*(
+            self._tags[keyword] for keyword in set(self._pattern.findall(text))
+        ))
+
+
 class TriageLogic:
     """
     Business logic layer for triage decisions.
@@ -41,40 +91,75 @@ class TriageLogic:
     """
     
     # Keywords indicating high urgency
-    CRITICAL_KEYWORDS = [
+    CRITICAL_KEYWORDS: tuple[str, ...] = (
         "production down", "system down", "completely down",
         "security breach", "data leak", "data loss",
         "all users affected", "cannot access",
         "losing money", "losing customers", "urgent",
         "emergency", "critical", "asap", "immediately"
-    ]
+    )
     
     # Keywords indicating potential churn risk
-    CHURN_KEYWORDS = [
+    CHURN_KEYWORDS: tuple[str, ...] = (
         "cancel", "canceling", "cancellation",
         "switch provider", "switching", "competitor",
         "leaving", "frustrated", "disappointed",
         "not worth", "waste of money", "refund"
-    ]
+    )
     
     # Keywords indicating legal/dispute risk
-    LEGAL_KEYWORDS = [
+    LEGAL_KEYWORDS: tuple[str, ...] = (
         "lawyer", "attorney", "legal action",
         "lawsuit", "sue", "court",
         "dispute", "chargeback", "fraud"
-    ]
+    )
     
     # Keywords indicating social media threat
-    SOCIAL_MEDIA_KEYWORDS = [
+    SOCIAL_MEDIA_KEYWORDS: tuple[str, ...] = (
         "twitter", "tweet", "post about",
         "tell everyone", "review", "public",
         "social media", "linkedin", "facebook"
-    ]
+    )
+    
+    # Keywords indicating a charge dispute
+    DISPUTE_KEYWORDS: tuple[str, ...] = ("chargeback", "dispute", "unauthorized charge", "fraud")
+    
+    # Outage indicators that make an enterprise ticket critical
+    OUTAGE_INDICATORS: tuple[str, ...] = ("down", "outage", "unavailable", "503", "500")
+    
+    # Issue type indicators, checked in this order
+    BILLING_KEYWORDS: tuple[str, ...] = ("billing", "invoice", "charge", "payment", "subscription", "refund", "price")
+    OUTAGE_KEYWORDS: tuple[str, ...] = ("down", "outage", "unavailable", "503", "500", "not working", "cant access")
+    BUG_KEYWORDS: tuple[str, ...] = ("bug", "error", "broken", "doesn't work", "crash", "issue")
+    FEATURE_KEYWORDS: tuple[str, ...] = ("feature", "request", "suggestion", "would be nice", "add support for", "idea")
+    ACCOUNT_KEYWORDS: tuple[str, ...] = ("account", "login", "password", "access", "permission", "locked")
+    
+    # Rule-based fallback urgency and sentiment indicators
+    FALLBACK_URGENCY_KEYWORDS: tuple[str, ...] = ("urgent", "critical", "emergency", "down", "asap")
+    NEGATIVE_SENTIMENT_WORDS: tuple[str, ...] = ("frustrated", "angry", "terrible", "worst", "unacceptable", "disappointed")
+    POSITIVE_SENTIMENT_WORDS: tuple[str, ...] = ("thanks", "great", "love", "amazing", "appreciate")
+    
+    def scan(self, text: str) -> frozenset[str]:
+        """
+        Find every keyword group present in a text in a single pass.
+        
+        Groups: critical, churn, legal, social, dispute, outage_indicator,
+        billing, outage, bug, feature, account, fallback_urgent, down,
+        sentiment_negative, sentiment_positive.
+        
+        Args:
+            text: Lowercased text to scan (e.g. `ticket.full_text_lower`).
+        
+        Returns:
+            frozenset[str]: Tags of the groups with at least one match.
+        """
+        return _keyword_tags(text)
     
     def calculate_urgency_override(
         self,
         ticket: SupportTicket,
-        llm_urgency: str
+        llm_urgency: str,
+        tags: Optional[frozenset[str]] = None
     ) -> Optional[UrgencyLevel]:
         """
         Calculate if urgency should be overridden based on business rules.
@@ -82,60 +167,66 @@ class TriageLogic:
         Args:
             ticket: The support ticket.
             llm_urgency: The LLM-suggested urgency level.
+            tags: Optional result of `scan()` for this ticket, to avoid rescanning.
         
         Returns:
             Optional[UrgencyLevel]: Override urgency if rules apply, None otherwise.
         """
-        text = ticket.get_full_text().lower()
+        if tags is None:
+            tags = _keyword_tags(ticket.full_text_lower)
         
         # Rule 1: Enterprise customers with outage indicators = CRITICAL
         if ticket.is_enterprise():
-            outage_indicators = ["down", "outage", "unavailable", "503", "500"]
-            if any(indicator in text for indicator in outage_indicators):
-                logger.info(f"Urgency override: Enterprise + outage = CRITICAL")
+            if "outage_indicator" in tags:
+                logger.info("Urgency override: Enterprise + outage = CRITICAL")
                 return UrgencyLevel.CRITICAL
         
         # Rule 2: Critical keywords always bump to at least HIGH
-        if any(kw in text for kw in self.CRITICAL_KEYWORDS):
+        if "critical" in tags:
             if llm_urgency in ["low", "medium"]:
-                logger.info(f"Urgency override: Critical keywords found = HIGH")
+                logger.info("Urgency override: Critical keywords found = HIGH")
                 return UrgencyLevel.HIGH
         
         # Rule 3: Enterprise customer + negative sentiment = at least HIGH
         if ticket.is_enterprise() and llm_urgency == "low":
-            logger.info(f"Urgency override: Enterprise customer = at least MEDIUM")
+            logger.info("Urgency override: Enterprise customer = at least MEDIUM")
             return UrgencyLevel.MEDIUM
         
         return None
     
-    def detect_risk_signals(self, ticket: SupportTicket) -> list[RiskSignal]:
+    def detect_risk_signals(
+        self,
+        ticket: SupportTicket,
+        tags: Optional[frozenset[str]] = None
+    ) -> list[RiskSignal]:
         """
         Detect customer risk signals from ticket content.
         
         Args:
             ticket: The support ticket.
+            tags: Optional result of `scan()` for this ticket, to avoid rescanning.
         
         Returns:
             list[RiskSignal]: List of detected risk signals.
         """
-        text = ticket.get_full_text().lower()
+        if tags is None:
+            tags = _keyword_tags(ticket.full_text_lower)
         signals = []
         
         # Check for churn risk
-        if any(kw in text for kw in self.CHURN_KEYWORDS):
+        if "churn" in tags:
             signals.append(RiskSignal.CHURN_RISK)
         
         # Check for legal threat
-        if any(kw in text for kw in self.LEGAL_KEYWORDS):
+        if "legal" in tags:
             signals.append(RiskSignal.LEGAL_THREAT)
         
         # Check for social media threat
-        if any(kw in text for kw in self.SOCIAL_MEDIA_KEYWORDS):
+        if "social" in tags:
             signals.append(RiskSignal.SOCIAL_MEDIA_THREAT)
         
         # Check for charge dispute indicators
-        dispute_keywords = ["chargeback", "dispute", "unauthorized charge", "fraud"]
-        if any(kw in text for kw in dispute_keywords):
+        if "dispute" in tags:
             signals.append(RiskSignal.CHARGE_DISPUTE)
         
         # High-value account risk
@@ -250,7 +341,11 @@ class TriageLogic:
         # Default to routing to specialist for safety
         return RecommendedAction.ROUTE_TO_SPECIALIST
     
-    def detect_issue_type_from_keywords(self, ticket: SupportTicket) -> Optional[IssueType]:
+    def detect_issue_type_from_keywords(
+        self,
+        ticket: SupportTicket,
+        tags: Optional[frozenset[str]] = None
+    ) -> Optional[IssueType]:
         """
         Detect issue type based on keyword matching.
         
@@ -258,35 +353,57 @@ class TriageLogic:
         
         Args:
             ticket: The support ticket.
+            tags: Optional result of `scan()` for this ticket, to avoid rescanning.
         
         Returns:
             Optional[IssueType]: Detected issue type or None.
         """
-        text = ticket.get_full_text().lower()
+        if tags is None:
+            tags = _keyword_tags(ticket.full_text_lower)
         
         # Billing indicators
-        billing_keywords = ["billing", "invoice", "charge", "payment", "subscription", "refund", "price"]
-        if any(kw in text for kw in billing_keywords):
+        if "billing" in tags:
             return IssueType.BILLING
         
         # Outage indicators
-        outage_keywords = ["down", "outage", "unavailable", "503", "500", "not working", "cant access"]
-        if any(kw in text for kw in outage_keywords):
+        if "outage" in tags:
             return IssueType.OUTAGE
         
         # Bug indicators
-        bug_keywords = ["bug", "error", "broken", "doesn't work", "crash", "issue"]
-        if any(kw in text for kw in bug_keywords):
+        if "bug" in tags:
             return IssueType.BUG
         
         # Feature request indicators
-        feature_keywords = ["feature", "request", "suggestion", "would be nice", "add support for", "idea"]
-        if any(kw in text for kw in feature_keywords):
+        if "feature" in tags:
             return IssueType.FEATURE_REQUEST
         
         # Account indicators
-        account_keywords = ["account", "login", "password", "access", "permission", "locked"]
-        if any(kw in text for kw in account_keywords):
+        if "account" in tags:
             return IssueType.ACCOUNT
         
-        return None
\ No newline at end of file
+        return None
+
+
+_SCANNER = _KeywordScanner({
+    "critical": TriageLogic.CRITICAL_KEYWORDS,
+    "churn": TriageLogic.CHURN_KEYWORDS,
+    "legal": TriageLogic.LEGAL_KEYWORDS,
+    "social": TriageLogic.SOCIAL_MEDIA_KEYWORDS,
+    "dispute": TriageLogic.DISPUTE_KEYWORDS,
+    "outage_indicator": TriageLogic.OUTAGE_INDICATORS,
+    "billing": TriageLogic.BILLING_KEYWORDS,
+    "outage": TriageLogic.OUTAGE_KEYWORDS,
+    "bug": TriageLogic.BUG_KEYWORDS,
+    "feature": TriageLogic.FEATURE_KEYWORDS,
+    "account": TriageLogic.ACCOUNT_KEYWORDS,
+    "fallback_urgent": TriageLogic.FALLBACK_URGENCY_KEYWORDS,
+    "down": ("down",),
+    "sentiment_negative": TriageLogic.NEGATIVE_SENTIMENT_WORDS,
+    "sentiment_positive": TriageLogic.POSITIVE_SENTIMENT_WORDS,
+})
+
+
+@lru_cache(maxsize=128)
+def _keyword_tags(text: str) -> frozenset[str]:
+    """Scan a ticket's lowercased text once; repeat checks reuse the result."""
+    return _SCANNER.scan(text)
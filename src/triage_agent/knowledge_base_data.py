@@ -6,16 +6,29 @@ Contains mock knowledge base articles for demonstration purposes.
 
 In production, this would be replaced with a real search backend
 integration (Elasticsearch, Algolia, vector database, etc.).
+
+Search runs against an inverted index built once, on the first search,
+so a query only touches the postings for its own terms instead of
+scanning every article, and processes that never search skip the build.
+The index is keyed by every substring of every indexed word, so matching
+all keywords of all articles against a query costs one dict lookup per
+query term.
 """
 
-# Mock knowledge base articles
-KNOWLEDGE_BASE_ARTICLES = [
+import heapq
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+# Mock knowledge base articles, as authored
+_RAW_ARTICLES: list[dict[str, Any]] = [
     {
         "id": "KB-AUTH-001",
         "title": "How to Reset Your Password",
         "url": "https://help.example.com/articles/password-reset",
         "category": "authentication",
-        "keywords": ["password", "reset", "forgot", "login", "access", "locked"],
+        "keywords": ("password", "reset", "forgot", "login", "access", "locked"),
         "content": """
         If you've forgotten your password or need to reset it, follow these steps:
         
@@ -34,7 +47,9 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "Two-Factor Authentication Setup Guide",
         "url": "https://help.example.com/articles/2fa-setup",
         "category": "authentication",
-        "keywords": ["2fa", "two-factor", "authentication", "security", "mfa", "authenticator"],
+        "keywords": (
+            "2fa", "two-factor", "authentication", "security", "mfa", "authenticator",
+        ),
         "content": """
         Two-factor authentication adds an extra layer of security to your account.
         
@@ -53,7 +68,7 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "Account Locked - Troubleshooting",
         "url": "https://help.example.com/articles/account-locked",
         "category": "authentication",
-        "keywords": ["locked", "account", "blocked", "access", "denied", "suspended"],
+        "keywords": ("locked", "account", "blocked", "access", "denied", "suspended"),
         "content": """
         Your account may be locked for several reasons:
         
@@ -75,7 +90,9 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "Understanding Your Billing Cycle",
         "url": "https://help.example.com/articles/billing-cycle",
         "category": "billing",
-        "keywords": ["billing", "cycle", "payment", "invoice", "subscription", "charge", "renew"],
+        "keywords": (
+            "billing", "cycle", "payment", "invoice", "subscription", "charge", "renew",
+        ),
         "content": """
         Your billing cycle starts on the day you first subscribed or upgraded.
         
@@ -95,7 +112,7 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "How to Update Payment Information",
         "url": "https://help.example.com/articles/update-payment",
         "category": "billing",
-        "keywords": ["payment", "credit card", "update", "billing", "method", "change"],
+        "keywords": ("payment", "credit card", "update", "billing", "method", "change"),
         "content": """
         To update your payment method:
         
@@ -118,7 +135,9 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "Requesting a Refund",
         "url": "https://help.example.com/articles/refund-policy",
         "category": "billing",
-        "keywords": ["refund", "money back", "cancel", "dispute", "charge", "chargeback"],
+        "keywords": (
+            "refund", "money back", "cancel", "dispute", "charge", "chargeback",
+        ),
         "content": """
         Our refund policy:
         
@@ -139,7 +158,9 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "Service Status and Incident Response",
         "url": "https://help.example.com/articles/service-status",
         "category": "outage",
-        "keywords": ["outage", "down", "status", "incident", "unavailable", "503", "error"],
+        "keywords": (
+            "outage", "down", "status", "incident", "unavailable", "503", "error",
+        ),
         "content": """
         Check current service status: status.example.com
         
@@ -162,7 +183,7 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "Regional Connectivity Issues",
         "url": "https://help.example.com/articles/regional-issues",
         "category": "outage",
-        "keywords": ["region", "latency", "slow", "connectivity", "network", "timeout"],
+        "keywords": ("region", "latency", "slow", "connectivity", "network", "timeout"),
         "content": """
         If you're experiencing slow performance or connectivity issues:
         
@@ -187,7 +208,7 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "API Rate Limits and Quotas",
         "url": "https://help.example.com/articles/api-rate-limits",
         "category": "api",
-        "keywords": ["api", "rate limit", "quota", "429", "throttle", "exceeded"],
+        "keywords": ("api", "rate limit", "quota", "429", "throttle", "exceeded"),
         "content": """
         API rate limits by plan:
         
@@ -211,7 +232,7 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "Submitting Feature Requests",
         "url": "https://help.example.com/articles/feature-requests",
         "category": "product",
-        "keywords": ["feature", "request", "suggestion", "idea", "roadmap", "feedback"],
+        "keywords": ("feature", "request", "suggestion", "idea", "roadmap", "feedback"),
         "content": """
         We love hearing your ideas! Here's how to submit feature requests:
         
@@ -231,7 +252,7 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "Managing Team Members",
         "url": "https://help.example.com/articles/team-management",
         "category": "account",
-        "keywords": ["team", "member", "invite", "user", "admin", "permission", "role"],
+        "keywords": ("team", "member", "invite", "user", "admin", "permission", "role"),
         "content": """
         To manage your team (Pro and Enterprise plans):
         
@@ -255,7 +276,7 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "Canceling Your Subscription",
         "url": "https://help.example.com/articles/cancel-subscription",
         "category": "account",
-        "keywords": ["cancel", "subscription", "close", "delete", "account", "end"],
+        "keywords": ("cancel", "subscription", "close", "delete", "account", "end"),
         "content": """
         To cancel your subscription:
         
@@ -278,7 +299,9 @@ KNOWLEDGE_BASE_ARTICLES = [
         "title": "Dashboard Customization Options",
         "url": "https://help.example.com/articles/dashboard-customization",
         "category": "product",
-        "keywords": ["dashboard", "customize", "theme", "dark mode", "layout", "display"],
+        "keywords": (
+            "dashboard", "customize", "theme", "dark mode", "layout", "display",
+        ),
         "content": """
         Customize your dashboard experience:
         
@@ -297,4 +320,145 @@ KNOWLEDGE_BASE_ARTICLES = [
         We're actively working on additional theme options.
         """
     },
-]
\ No newline at end of file
+]
+
+# Snippet length shown in search results
+SNIPPET_LENGTH = 200
+
+# Freeze the articles so the indexes below cannot drift from the data, and
+# precompute each search result snippet once instead of per query
+KNOWLEDGE_BASE_ARTICLES: tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType({
+        **article,
+        "snippet": article["content"][:SNIPPET_LENGTH] + "...",
+    })
+    for article in _RAW_ARTICLES
+)
+
+# Relevance weights per matched field
+TITLE_WEIGHT = 0.4
+KEYWORD_WEIGHT = 0.3
+CONTENT_WEIGHT = 0.15
+
+# Minimum normalized score for an article to be returned
+MIN_RELEVANCE = 0.1
+
+
+def _word_substrings(text: str) -> set[str]:
+    """
+    Collect every substring of every whitespace-separated word in text.
+
+    Query terms never contain whitespace, so a term occurs in the text
+    exactly when it is one of these substrings.
+
+    Args:
+        text: Text to index.
+
+    Returns:
+        set[str]: Lowercased word substrings.
+    """
+    return {
+        word[start:end]
+        for word in text.lower().split()
+        for start in range(len(word))
+        for end in range(start + 1, len(word) + 1)
+    }
+
+
+# Column-oriented copies of the searched fields. KNOWLEDGE_BASE_ARTICLES
+# stays the row view; index builds and filters read one column at a time.
+_TITLES = tuple(article["title"] for article in KNOWLEDGE_BASE_ARTICLES)
+_KEYWORDS = tuple(" ".join(article["keywords"]) for article in KNOWLEDGE_BASE_ARTICLES)
+_CONTENT = tuple(article["content"] for article in KNOWLEDGE_BASE_ARTICLES)
+_CATEGORIES = tuple(article["category"].lower() for article in KNOWLEDGE_BASE_ARTICLES)
+
+# Lowercased category -> positions of its articles
+_BY_CATEGORY: dict[str, tuple[int, ...]] = {}
+for _position, _category in enumerate(_CATEGORIES):
+    _BY_CATEGORY[_category] = _BY_CATEGORY.get(_category, ()) + (_position,)
+
+# Columns searched by a query term, with their relevance weights
+_WEIGHTED_COLUMNS = (
+    (_TITLES, TITLE_WEIGHT),
+    (_KEYWORDS, KEYWORD_WEIGHT),
+    (_CONTENT, CONTENT_WEIGHT),
+)
+
+
+@lru_cache(maxsize=1)
+def _term_index() -> dict[str, tuple[tuple[int, float], ...]]:
+    """
+    Build the term postings for all articles on first search.
+
+    Each posting is a compact (article position, field weight) pair, so a
+    single lookup returns every field hit for a term without touching the
+    article dicts. Postings are ordered by article, then by field.
+
+    Returns:
+        dict[str, tuple[tuple[int, float], ...]]: Postings keyed by term.
+    """
+    postings: dict[str, list[tuple[int, float]]] = defaultdict(list)
+    for position in range(len(KNOWLEDGE_BASE_ARTICLES)):
+        for column, weight in _WEIGHTED_COLUMNS:
+            for term in _word_substrings(column[position]):
+                postings[term].append((position, weight))
+    return {term: tuple(entries) for term, entries in postings.items()}
+
+
+def search_kb(
+    query: str,
+    category: Optional[str] = None,
+    limit: Optional[int] = None
+) -> tuple[int, list[tuple[float, Mapping[str, Any]]]]:
+    """
+    Score knowledge base articles against a query.
+
+    Each query term adds TITLE_WEIGHT, KEYWORD_WEIGHT and CONTENT_WEIGHT
+    for the fields it occurs in; the total is normalized to 0-1. Only the
+    top `limit` matches are ranked, so a search never sorts the full
+    match list.
+
+    Args:
+        query: Free-text search query.
+        category: Optional category to restrict results to.
+        limit: Optional maximum number of results to return.
+
+    Returns:
+        tuple: Total number of matches above MIN_RELEVANCE, and the
+            best (score, article) pairs, best first.
+    """
+    query_terms = set(query.lower().split())
+    if not query_terms:
+        return 0, []
+
+    category = category.lower() if category else None
+    if category is not None and category not in _BY_CATEGORY:
+        return 0, []
+
+    term_index = _term_index()
+    scores: dict[int, float] = {}
+    for term in query_terms:
+        for position, weight in term_index.get(term, ()):
+            scores[position] = scores.get(position, 0.0) + weight
+
+    max_possible = len(query_terms) * (TITLE_WEIGHT + KEYWORD_WEIGHT + CONTENT_WEIGHT)
+    matches = []
+    candidates = scores if category is None else _BY_CATEGORY[category]
+    for position in candidates:
+        score = scores.get(position)
+        if score is None:
+            continue
+        score = min(score / max_possible, 1.0)
+        if score > MIN_RELEVANCE:
+            matches.append((score, position))
+
+    # Ties keep the original article order
+    ranked = heapq.nsmallest(
+        len(matches) if limit is None else limit,
+        matches,
+        key=lambda item: (-item[0], item[1])
+    )
+
+    return len(matches), [
+        (score, KNOWLEDGE_BASE_ARTICLES[position]) for score, position in ranked
+    ]
@@ -8,15 +8,17 @@ Modules:
     ticket: Input ticket schema definitions
     triage_output: Agent output schema definitions  
     tools: Tool input/output schema definitions
+    types: Shared Annotated field types
 """
 
-from src.triage_agent.models.ticket import SupportTicket
+from src.triage_agent.models.ticket import SupportTicket, load_tickets, load_tickets_json
 from src.triage_agent.models.triage_output import (
     CustomerSentiment,
     IssueType,
     KnowledgeBaseResult,
     RecommendedAction,
     RiskSignal,
+    RiskSignalMask,
     SpecialistQueue,
     ToolCallRecord,
     TriageOutput,
@@ -30,16 +32,20 @@ from src.triage_agent.models.tools import (
     RegionStatusInput,
     RegionStatusOutput,
 )
+from src.triage_agent.models.types import EmailAddress, LookupEmail, ShortText, UnitScore
 
 __all__ = [
     # Ticket models
     "SupportTicket",
+    "load_tickets",
+    "load_tickets_json",
     # Output models
     "TriageOutput",
     "UrgencyLevel",
     "IssueType",
     "CustomerSentiment",
     "RiskSignal",
+    "RiskSignalMask",
     "RecommendedAction",
     "SpecialistQueue",
     "KnowledgeBaseResult",
@@ -51,4 +57,9 @@ __all__ = [
     "CustomerHistoryOutput",
     "RegionStatusInput",
     "RegionStatusOutput",
+    # Field types
+    "EmailAddress",
+    "LookupEmail",
+    "ShortText",
+    "UnitScore",
 ]
\ No newline at end of file
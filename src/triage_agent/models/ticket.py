@@ -8,11 +8,21 @@ This module provides the `SupportTicket` Pydantic model that represents
 a customer support ticket with all relevant metadata for triage processing.
 """
 
+import sys
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    field_validator,
+)
 
+from src.triage_agent.models.types import EmailAddress, ShortText
 
 class SupportTicket(BaseModel):
     """
@@ -21,6 +31,9 @@ class SupportTicket(BaseModel):
     This model captures all relevant information about a support request
     that the triage agent needs to process and classify.
     
+    Tickets are frozen but not hashable, since `attachments` and `metadata`
+    are mutable containers.
+    
     Attributes:
         ticket_id: Unique identifier for the ticket.
         subject: The ticket subject/title.
@@ -44,6 +57,8 @@ class SupportTicket(BaseModel):
         ... )
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     ticket_id: str = Field(
         ...,
         min_length=1,
@@ -52,10 +67,8 @@ class SupportTicket(BaseModel):
         examples=["T-12345", "TICKET-001"]
     )
     
-    subject: str = Field(
+    subject: ShortText = Field(
         ...,
-        min_length=1,
-        max_length=500,
         description="The ticket subject line",
         examples=["Cannot login to my account", "Billing discrepancy"]
     )
@@ -68,7 +81,7 @@ class SupportTicket(BaseModel):
         examples=["I've been trying to access my dashboard but keep getting an error..."]
     )
     
-    customer_email: str = Field(
+    customer_email: EmailAddress = Field(
         ...,
         description="Customer's email address",
         examples=["customer@example.com"]
@@ -93,7 +106,7 @@ class SupportTicket(BaseModel):
         examples=["us-east", "eu-west", "apac"]
     )
     
-    timestamp: Optional[str] = Field(
+    timestamp: Optional[datetime] = Field(
         default=None,
         description="ISO 8601 timestamp when ticket was created",
         examples=["2024-01-15T10:30:00Z"]
@@ -117,13 +130,17 @@ class SupportTicket(BaseModel):
         examples=[{"browser": "Chrome", "os": "Windows 11"}]
     )
     
-    @field_validator("customer_email")
-    @classmethod
-    def validate_email(cls, v: str) -> str:
-        """Basic email format validation."""
-        if "@" not in v or "." not in v:
-            raise ValueError("Invalid email format")
-        return v.lower().strip()
+    _full_text_cache: Optional[tuple[str, str, str]] = PrivateAttr(default=None)
+    _full_text_lower_cache: Optional[tuple[str, str, str]] = PrivateAttr(default=None)
+    
+    def __eq__(self, other: object) -> bool:
+        # Compare fields only, so a filled text cache does not make
+        # otherwise identical tickets unequal
+        if not isinstance(other, SupportTicket):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+    
+    __hash__ = None  # type: ignore[assignment]
     
     @field_validator("customer_tier")
     @classmethod
@@ -131,20 +148,16 @@ class SupportTicket(BaseModel):
         """Normalize customer tier to lowercase."""
         if v is None:
             return "unknown"
-        return v.lower().strip()
+        # Few distinct tiers exist; interning shares one string per value
+        return sys.intern(v.lower().strip())
     
-    @field_validator("timestamp")
+    @field_validator("channel", "customer_region")
     @classmethod
-    def validate_timestamp(cls, v: Optional[str]) -> Optional[str]:
-        """Validate timestamp format if provided."""
+    def intern_label(cls, v: Optional[str]) -> Optional[str]:
+        """Intern low-cardinality labels so tickets share one string per value."""
         if v is None:
             return None
-        try:
-            # Attempt to parse ISO format
-            datetime.fromisoformat(v.replace("Z", "+00:00"))
-        except ValueError:
-            raise ValueError("Timestamp must be in ISO 8601 format")
-        return v
+        return sys.intern(v)
     
     def get_full_text(self) -> str:
         """
@@ -153,7 +166,42 @@ class SupportTicket(BaseModel):
         Returns:
             str: Combined ticket text.
         """
-        return f"{self.subject}\n\n{self.body}"
+        return self.full_text
+    
+    @property
+    def full_text(self) -> str:
+        """
+        Get the combined subject and body, built once per subject/body.
+        
+        Like `full_text_lower`, the cache is keyed on the identity of the
+        subject and body strings rather than using `cached_property`, which
+        would go stale after `model_copy(update=...)`.
+        
+        Returns:
+            str: Combined ticket text.
+        """
+        cached = self._full_text_cache
+        if cached is None or cached[0] is not self.subject or cached[1] is not self.body:
+            cached = (self.subject, self.body, f"{self.subject}\n\n{self.body}")
+            self._full_text_cache = cached
+        return cached[2]
+    
+    @property
+    def full_text_lower(self) -> str:
+        """
+        Get the lowercased combined text, computed once per subject/body.
+        
+        The cache is keyed on the identity of the subject and body strings,
+        so it stays correct after `model_copy(update=...)`.
+        
+        Returns:
+            str: Lowercased `get_full_text()`.
+        """
+        cached = self._full_text_lower_cache
+        if cached is None or cached[0] is not self.subject or cached[1] is not self.body:
+            cached = (self.subject, self.body, self.full_text.lower())
+            self._full_text_lower_cache = cached
+        return cached[2]
     
     def is_enterprise(self) -> bool:
         """
@@ -162,7 +210,8 @@ class SupportTicket(BaseModel):
         Returns:
             bool: True if enterprise customer.
         """
-        return self.customer_tier.lower() == "enterprise"
+        # normalize_tier already lowercased (and interned) the tier
+        return self.customer_tier == "enterprise"
     
     def has_attachments(self) -> bool:
         """
@@ -171,12 +220,48 @@ class SupportTicket(BaseModel):
         Returns:
             bool: True if attachments present.
         """
-        return len(self.attachments) > 0
+        return bool(self.attachments)
+
 
+# Validates a whole list of tickets in a single pydantic-core call
+_TICKETS_ADAPTER = TypeAdapter(list[SupportTicket])
 
-# Sample tickets for demonstration
-SAMPLE_TICKETS = [
-    SupportTicket(
+
+def load_tickets(raw: Sequence[dict[str, Any]]) -> list[SupportTicket]:
+    """
+    Validate a batch of raw ticket dicts.
+    
+    Args:
+        raw: Ticket data, e.g. parsed from a JSON file or request body.
+    
+    Returns:
+        list[SupportTicket]: The validated tickets.
+    
+    Raises:
+        ValidationError: If any ticket is invalid.
+    """
+    return _TICKETS_ADAPTER.validate_python(raw)
+
+
+def load_tickets_json(raw: Union[bytes, str]) -> list[SupportTicket]:
+    """
+    Parse and validate a JSON array of tickets in one pass.
+    
+    Args:
+        raw: JSON text of a list of ticket objects.
+    
+    Returns:
+        list[SupportTicket]: The validated tickets.
+    
+    Raises:
+        ValidationError: If the JSON is malformed or any ticket is invalid.
+    """
+    return _TICKETS_ADAPTER.validate_json(raw)
+
+
+# Raw sample ticket data, validated lazily by get_sample_tickets()
+_SAMPLE_TICKET_DATA: tuple[dict[str, Any], ...] = (
+    dict(
         ticket_id="T-001",
         subject="URGENT: Production system completely down",
         body="""Our entire production environment has been down for the past 2 hours. 
@@ -198,7 +283,7 @@ SAMPLE_TICKETS = [
         channel="web",
         metadata={"account_value": 500000, "employees": 5000}
     ),
-    SupportTicket(
+    dict(
         ticket_id="T-002", 
         subject="Question about billing cycle",
         body="""Hi there,
@@ -218,7 +303,7 @@ SAMPLE_TICKETS = [
         timestamp="2024-01-15T09:15:00Z",
         channel="email"
     ),
-    SupportTicket(
+    dict(
         ticket_id="T-003",
         subject="Feature request: Dark mode",
         body="""Hello,
@@ -238,4 +323,24 @@ SAMPLE_TICKETS = [
         timestamp="2024-01-15T22:45:00Z",
         channel="web"
     ),
-]
\ No newline at end of file
+)
+
+
+@lru_cache(maxsize=1)
+def get_sample_tickets() -> list[SupportTicket]:
+    """
+    Get the sample tickets used for demos and tests.
+    
+    The tickets are validated on first call rather than at import time.
+    
+    Returns:
+        list[SupportTicket]: The sample tickets.
+    """
+    return load_tickets(_SAMPLE_TICKET_DATA)
+
+
+def __getattr__(name: str) -> Any:
+    """Build the legacy `SAMPLE_TICKETS` constant on first access."""
+    if name == "SAMPLE_TICKETS":
+        return get_sample_tickets()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
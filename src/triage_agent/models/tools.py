@@ -8,9 +8,11 @@ Each tool has a dedicated input and output model to ensure
 type safety and validation at tool boundaries.
 """
 
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.triage_agent.models.types import LookupEmail, ShortText, UnitScore
 
 
 # =============================================================================
@@ -26,10 +28,10 @@ class KnowledgeBaseInput(BaseModel):
         max_results: Maximum number of results to return
         category_filter: Optional category to filter by
     """
-    query: str = Field(
+    model_config = ConfigDict(frozen=True)
+    
+    query: ShortText = Field(
         ...,
-        min_length=1,
-        max_length=500,
         description="Search query for the knowledge base",
         examples=["password reset", "billing cycle"]
     )
@@ -58,15 +60,15 @@ class KnowledgeBaseArticle(BaseModel):
         content_snippet: Brief excerpt of article content
         relevance_score: Computed relevance to the query
     """
+    model_config = ConfigDict(frozen=True)
+    
     id: str = Field(..., description="Unique article identifier")
     title: str = Field(..., description="Article title")
     url: str = Field(..., description="Full URL to the article")
     category: str = Field(..., description="Article category")
     content_snippet: str = Field(..., description="Brief excerpt of content")
-    relevance_score: float = Field(
+    relevance_score: UnitScore = Field(
         ...,
-        ge=0.0,
-        le=1.0,
         description="Relevance score (0.0-1.0)"
     )
 
@@ -80,6 +82,8 @@ class KnowledgeBaseOutput(BaseModel):
         total_matches: Total number of matches found
         query_processed: The processed query string
     """
+    model_config = ConfigDict(frozen=True)
+    
     results: list[KnowledgeBaseArticle] = Field(
         default_factory=list,
         description="List of matching articles"
@@ -107,7 +111,9 @@ class CustomerHistoryInput(BaseModel):
         include_tickets: Whether to include past ticket history
         include_billing: Whether to include billing history
     """
-    customer_email: str = Field(
+    model_config = ConfigDict(frozen=True)
+    
+    customer_email: LookupEmail = Field(
         ...,
         description="Customer email address to look up",
         examples=["customer@example.com"]
@@ -124,6 +130,8 @@ class CustomerHistoryInput(BaseModel):
 
 class PastTicketSummary(BaseModel):
     """Summary of a past support ticket."""
+    model_config = ConfigDict(frozen=True)
+    
     ticket_id: str
     date: str
     subject: str
@@ -147,6 +155,8 @@ class CustomerHistoryOutput(BaseModel):
         is_at_risk: Whether customer is flagged as at-risk
         notes: Internal notes about the customer
     """
+    model_config = ConfigDict(frozen=True)
+    
     customer_email: str = Field(..., description="Customer email")
     customer_name: Optional[str] = Field(None, description="Customer name")
     account_tier: str = Field(..., description="Subscription tier")
@@ -179,6 +189,8 @@ class RegionStatusInput(BaseModel):
         region: Region identifier to check
         check_services: Specific services to check (empty for all)
     """
+    model_config = ConfigDict(frozen=True)
+    
     region: str = Field(
         ...,
         description="Region identifier",
@@ -193,8 +205,10 @@ class RegionStatusInput(BaseModel):
 
 class ServiceStatus(BaseModel):
     """Status of an individual service."""
+    model_config = ConfigDict(frozen=True)
+    
     service_name: str = Field(..., description="Name of the service")
-    status: str = Field(
+    status: Literal["operational", "degraded", "outage"] = Field(
         ...,
         description="Service status",
         examples=["operational", "degraded", "outage"]
@@ -214,8 +228,10 @@ class RegionStatusOutput(BaseModel):
         active_incidents: List of active incident IDs
         last_updated: When status was last updated
     """
+    model_config = ConfigDict(frozen=True)
+    
     region: str = Field(..., description="Region identifier")
-    overall_status: str = Field(
+    overall_status: Literal["healthy", "degraded", "outage", "unknown"] = Field(
         ...,
         description="Overall region status",
         examples=["healthy", "degraded", "outage"]
@@ -244,6 +260,8 @@ class ToolError(BaseModel):
         error_message: Human-readable error description
         recoverable: Whether the error is recoverable
     """
+    model_config = ConfigDict(frozen=True)
+    
     error_code: str = Field(..., description="Machine-readable error code")
     error_message: str = Field(..., description="Human-readable error description")
     recoverable: bool = Field(
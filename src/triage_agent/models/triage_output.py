@@ -8,10 +8,12 @@ This module provides comprehensive type definitions for the structured output
 that the triage agent produces after processing a support ticket.
 """
 
-from enum import Enum
-from typing import Any, Optional
+from enum import Enum, IntFlag
+from typing import Any, Mapping, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.triage_agent.models.types import UnitScore
 
 
 class UrgencyLevel(str, Enum):
@@ -90,6 +92,11 @@ class RiskSignal(str, Enum):
     COMPLIANCE_ISSUE = "compliance_issue"
 
 
+# One bit per RiskSignal, for compact storage and set tests in analytics
+RiskSignalMask = IntFlag("RiskSignalMask", [signal.name for signal in RiskSignal])
+_RISK_BITS = {signal: RiskSignalMask[signal.name].value for signal in RiskSignal}
+
+
 class RecommendedAction(str, Enum):
     """
     Recommended next action for the ticket.
@@ -124,6 +131,59 @@ class SpecialistQueue(str, Enum):
     NONE = "none"
 
 
+# Enum members by value for each classification field of TriageOutput.
+# A dict lookup avoids Enum.__call__, and .get() lets callers fall back to
+# a default instead of catching ValueError.
+URGENCY_BY_VALUE: dict[str, UrgencyLevel] = {e.value: e for e in UrgencyLevel}
+ISSUE_BY_VALUE: dict[str, IssueType] = {e.value: e for e in IssueType}
+SENTIMENT_BY_VALUE: dict[str, CustomerSentiment] = {
+    e.value: e for e in CustomerSentiment
+}
+RISK_BY_VALUE: dict[str, RiskSignal] = {e.value: e for e in RiskSignal}
+ACTION_BY_VALUE: dict[str, RecommendedAction] = {e.value: e for e in RecommendedAction}
+QUEUE_BY_VALUE: dict[str, SpecialistQueue] = {e.value: e for e in SpecialistQueue}
+CLASSIFICATIONS: dict[str, Mapping[str, Enum]] = {
+    "urgency": URGENCY_BY_VALUE,
+    "issue_type": ISSUE_BY_VALUE,
+    "customer_sentiment": SENTIMENT_BY_VALUE,
+    "customer_risk_signals": RISK_BY_VALUE,
+    "recommended_action": ACTION_BY_VALUE,
+    "recommended_specialist_queue": QUEUE_BY_VALUE,
+}
+
+
+# Example shown in the TriageOutput JSON schema
+TRIAGE_OUTPUT_EXAMPLE: dict[str, Any] = {
+    "ticket_id": "T-001",
+    "urgency": "high",
+    "product": "authentication",
+    "issue_type": "account",
+    "customer_sentiment": "negative",
+    "customer_risk_signals": ["churn_risk"],
+    "recommended_action": "route_to_specialist",
+    "recommended_specialist_queue": "tier_2",
+    "knowledge_base_results": [
+        {
+            "id": "KB-AUTH-001",
+            "title": "Account Recovery Steps",
+            "url": "https://help.example.com/account-recovery",
+            "relevance_score": 0.92
+        }
+    ],
+    "suggested_reply": "I understand how frustrating it must be...",
+    "tool_calls": [
+        {
+            "tool_name": "knowledge_base_search",
+            "inputs": {"query": "account locked"},
+            "outputs": {"results": []},
+            "success": True
+        }
+    ],
+    "confidence_score": 0.85,
+    "reasoning": "High urgency due to enterprise customer with account access issue"
+}
+
+
 class KnowledgeBaseResult(BaseModel):
     """
     A single knowledge base search result.
@@ -135,32 +195,27 @@ class KnowledgeBaseResult(BaseModel):
         relevance_score: How relevant this article is (0.0-1.0)
         snippet: Brief excerpt from the article
     """
+    model_config = ConfigDict(frozen=True)
+    
     id: str = Field(
         ...,
-        description="Unique identifier of the KB article",
-        examples=["KB-001", "DOC-AUTH-005"]
+        description="Unique identifier of the KB article"
     )
     title: str = Field(
         ...,
-        description="Title of the knowledge base article",
-        examples=["How to Reset Your Password"]
+        description="Title of the knowledge base article"
     )
     url: str = Field(
         ...,
-        description="URL to the full article",
-        examples=["https://help.example.com/articles/password-reset"]
+        description="URL to the full article"
     )
-    relevance_score: float = Field(
+    relevance_score: UnitScore = Field(
         ...,
-        ge=0.0,
-        le=1.0,
-        description="Relevance score from 0.0 to 1.0",
-        examples=[0.95]
+        description="Relevance score from 0.0 to 1.0"
     )
     snippet: Optional[str] = Field(
         default=None,
-        description="Brief excerpt from the article",
-        examples=["To reset your password, go to Settings > Security..."]
+        description="Brief excerpt from the article"
     )
 
 
@@ -175,20 +230,19 @@ class ToolCallRecord(BaseModel):
         success: Whether the tool call succeeded
         error_message: Error message if the call failed
     """
+    model_config = ConfigDict(frozen=True)
+    
     tool_name: str = Field(
         ...,
-        description="Name of the tool that was called",
-        examples=["knowledge_base_search", "customer_history"]
+        description="Name of the tool that was called"
     )
     inputs: dict[str, Any] = Field(
         ...,
-        description="Input parameters passed to the tool",
-        examples=[{"query": "password reset"}]
+        description="Input parameters passed to the tool"
     )
     outputs: dict[str, Any] = Field(
         default_factory=dict,
-        description="Output returned by the tool",
-        examples=[{"results": []}]
+        description="Output returned by the tool"
     )
     success: bool = Field(
         default=True,
@@ -238,6 +292,10 @@ class TriageOutput(BaseModel):
         ...     tool_calls=[]
         ... )
     """
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={"example": TRIAGE_OUTPUT_EXAMPLE}
+    )
     
     ticket_id: str = Field(
         ...,
@@ -251,8 +309,7 @@ class TriageOutput(BaseModel):
     
     product: Optional[str] = Field(
         default=None,
-        description="Detected product or feature area",
-        examples=["authentication", "billing", "api", "dashboard"]
+        description="Detected product or feature area (e.g. authentication, billing, api, dashboard)"
     )
     
     issue_type: IssueType = Field(
@@ -295,10 +352,8 @@ class TriageOutput(BaseModel):
         description="Record of all tool calls made during triage"
     )
     
-    confidence_score: float = Field(
+    confidence_score: UnitScore = Field(
         default=0.8,
-        ge=0.0,
-        le=1.0,
         description="Overall confidence in triage decisions"
     )
     
@@ -307,36 +362,27 @@ class TriageOutput(BaseModel):
         description="Brief explanation of triage decisions"
     )
     
-    class Config:
-        """Pydantic model configuration."""
-        json_schema_extra = {
-            "example": {
-                "ticket_id": "T-001",
-                "urgency": "high",
-                "product": "authentication",
-                "issue_type": "account",
-                "customer_sentiment": "negative",
-                "customer_risk_signals": ["churn_risk"],
-                "recommended_action": "route_to_specialist",
-                "recommended_specialist_queue": "tier_2",
-                "knowledge_base_results": [
-                    {
-                        "id": "KB-AUTH-001",
-                        "title": "Account Recovery Steps",
-                        "url": "https://help.example.com/account-recovery",
-                        "relevance_score": 0.92
-                    }
-                ],
-                "suggested_reply": "I understand how frustrating it must be...",
-                "tool_calls": [
-                    {
-                        "tool_name": "knowledge_base_search",
-                        "inputs": {"query": "account locked"},
-                        "outputs": {"results": []},
-                        "success": True
-                    }
-                ],
-                "confidence_score": 0.85,
-                "reasoning": "High urgency due to enterprise customer with account access issue"
-            }
-        }
\ No newline at end of file
+    @property
+    def risk_signal_mask(self) -> RiskSignalMask:
+        """
+        Get the risk signals as a bitmask.
+        
+        Returns:
+            RiskSignalMask: One bit set per signal in `customer_risk_signals`.
+        """
+        mask = 0
+        for signal in self.customer_risk_signals:
+            mask |= _RISK_BITS[signal]
+        return RiskSignalMask(mask)
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the output to compact UTF-8 JSON.
+        
+        Same content as `model_dump_json()`, but returned as the bytes the
+        serializer produces, without decoding them to `str` first.
+        
+        Returns:
+            bytes: The JSON document.
+        """
+        return self.__pydantic_serializer__.to_json(self)
@@ -0,0 +1,37 @@
+"""
+Shared Field Types
+===================
+
+Reusable `Annotated` aliases for constraints that appear on several
+models.
+
+Declaring each constraint once means pydantic builds and stores a single
+metadata object for it, instead of one identical `FieldInfo` per field.
+Per-field descriptions and examples are still given with `Field(...)`.
+"""
+
+from typing import Annotated
+
+from pydantic import Field, StringConstraints
+
+# Normalized email address, validated entirely inside pydantic-core:
+# stripped, lowercased, then one "@", no whitespace, a dot in the domain
+EmailAddress = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        to_lower=True,
+        pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
+    ),
+]
+
+# Lookup key compared against normalized addresses; only stripped and
+# lowercased, so a malformed value from the LLM finds no match instead of
+# failing the tool call
+LookupEmail = Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True)]
+
+# Short, non-empty free text such as a ticket subject or search query
+ShortText = Annotated[str, Field(min_length=1, max_length=500)]
+
+# Score normalized to the 0.0-1.0 range
+UnitScore = Annotated[float, Field(ge=0.0, le=1.0)]
@@ -6,16 +6,33 @@ Contains system prompts and prompt templates for the triage agent.
 
 Modules:
     system_prompt: Main system prompt for the triage agent
+    system_prompt.txt: Prompt text, loaded on first use
 """
 
+from typing import Any
+
 from src.triage_agent.prompts.system_prompt import (
-    SYSTEM_PROMPT,
+    JSON_SCHEMA_PROMPT,
+    build_system_prompt,
     get_system_prompt,
+    get_system_prompt_cache_key,
+    get_system_prompt_sections,
     get_tool_usage_prompt,
 )
 
 __all__ = [
+    "JSON_SCHEMA_PROMPT",
     "SYSTEM_PROMPT",
+    "build_system_prompt",
     "get_system_prompt",
+    "get_system_prompt_cache_key",
+    "get_system_prompt_sections",
     "get_tool_usage_prompt",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Load the legacy `SYSTEM_PROMPT` constant on first access."""
+    if name == "SYSTEM_PROMPT":
+        return get_system_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,67 +10,159 @@ and outputs results as JSON.
 Usage:
     python -m src.triage_agent.runner
     python -m src.triage_agent.runner --input tickets.json
+    python -m src.triage_agent.runner --input tickets.ndjson
     python -m src.triage_agent.runner --output results.json
 """
 
-import json
+import gc
 import logging
+import re
 import sys
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Sized
 
 import click
-from rich.console import Console
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.pretty import Pretty
 from rich.table import Table
 
 from src.triage_agent.config import Config, setup_logging
 from src.triage_agent.core.agent import TriageAgent
-from src.triage_agent.models.ticket import SAMPLE_TICKETS, SupportTicket
-from src.triage_agent.models.triage_output import TriageOutput
+from src.triage_agent.models.ticket import (
+    SupportTicket,
+    get_sample_tickets,
+    load_tickets,
+    load_tickets_json,
+)
+from src.triage_agent.models.triage_output import (
+    RecommendedAction,
+    TriageOutput,
+    UrgencyLevel,
+)
 
-console = Console()
 logger = logging.getLogger(__name__)
 
+# Serializes a whole list of results in a single pydantic-core call
+_RESULTS_ADAPTER = TypeAdapter(list[TriageOutput])
+
+# Input files read one ticket per line instead of as a single document
+NDJSON_SUFFIXES = frozenset({".ndjson", ".jsonl"})
+
+# Bold markup for the emphasized table cells, formatted once per member
+_URGENCY_CELLS = {u: f"[bold]{u.value.upper()}[/bold]" for u in UrgencyLevel}
+_ACTION_CELLS = {a: f"[bold]{a.value}[/bold]" for a in RecommendedAction}
+
+# Matches a JSON array at the start of a file without copying the buffer
+_JSON_ARRAY_START = re.compile(rb"\s*\[")
+
+
+def _make_console(quiet: bool = False) -> Console:
+    """
+    Build the console used for CLI output.
+    
+    Piped and quiet runs skip Rich's syntax highlighting and emoji code
+    substitution, since nothing renders the styling. Quiet runs also
+    write to stderr so stdout carries only the JSON results.
+    
+    Args:
+        quiet: Whether the CLI runs in quiet mode.
+    
+    Returns:
+        Console: The configured console.
+    """
+    plain = quiet or not sys.stdout.isatty()
+    return Console(stderr=quiet, highlight=not plain, emoji=not plain)
+
+
+console = _make_console()
+
+
+def _triage_one(agent: TriageAgent, ticket: SupportTicket) -> Optional[TriageOutput]:
+    """
+    Triage a single ticket, reporting failures instead of raising.
+    
+    Args:
+        agent: The triage agent instance.
+        ticket: The ticket to process.
+    
+    Returns:
+        Optional[TriageOutput]: The triage result, or None if it failed.
+    """
+    try:
+        return agent.triage(ticket)
+    except Exception as e:
+        logger.error("Failed to process ticket %s: %s", ticket.ticket_id, e)
+        console.print(f"[red]Error processing {ticket.ticket_id}: {e}[/red]")
+        return None
+
 
 def process_tickets(
     agent: TriageAgent,
-    tickets: list[SupportTicket],
+    tickets: Iterable[SupportTicket],
     verbose: bool = False
 ) -> list[TriageOutput]:
     """
-    Process a list of tickets through the triage agent.
+    Process tickets through the triage agent.
+    
+    With an API key configured, tickets are triaged on up to
+    `config.max_concurrency` threads, since each one mostly waits on
+    OpenAI. At most that many tickets are read ahead of the oldest
+    unfinished one, so a lazy stream is not pulled into memory up front.
+    Verbose runs stay sequential so output appears in order.
     
     Args:
         agent: The triage agent instance.
-        tickets: List of tickets to process.
+        tickets: Tickets to process; may be a lazy stream.
         verbose: Whether to print detailed output.
     
     Returns:
-        list[TriageOutput]: List of triage results.
+        list[TriageOutput]: List of triage results, in ticket order.
     """
+    if not verbose and agent.client is not None and agent.config.max_concurrency > 1:
+        window = agent.config.max_concurrency
+        results = []
+        ticket_iter = iter(tickets)
+        with ThreadPoolExecutor(
+            max_workers=window,
+            thread_name_prefix="triage-runner"
+        ) as pool:
+            pending = deque(
+                pool.submit(_triage_one, agent, ticket)
+                for ticket in islice(ticket_iter, window)
+            )
+            while pending:
+                result = pending.popleft().result()
+                if result is not None:
+                    results.append(result)
+                for ticket in islice(ticket_iter, 1):
+                    pending.append(pool.submit(_triage_one, agent, ticket))
+        return results
+    
     results = []
+    total = f"/{len(tickets)}" if isinstance(tickets, Sized) else ""
     
     for i, ticket in enumerate(tickets, 1):
         if verbose:
-            console.print(f"\n[bold blue]Processing ticket {i}/{len(tickets)}:[/bold blue]")
+            console.print(f"\n[bold blue]Processing ticket {i}{total}:[/bold blue]")
             console.print(Panel(
                 f"[bold]{ticket.subject}[/bold]\n\n{ticket.body[:200]}...",
                 title=f"Ticket: {ticket.ticket_id}",
                 subtitle=f"Customer: {ticket.customer_email}"
             ))
         
-        try:
-            result = agent.triage(ticket)
+        result = _triage_one(agent, ticket)
+        if result is not None:
             results.append(result)
             
             if verbose:
                 display_result(result)
-                
-        except Exception as e:
-            logger.error(f"Failed to process ticket {ticket.ticket_id}: {e}")
-            console.print(f"[red]Error processing {ticket.ticket_id}: {e}[/red]")
     
     return results
 
@@ -87,38 +179,41 @@ def display_result(result: TriageOutput) -> None:
     table.add_column("Field", style="cyan")
     table.add_column("Value", style="green")
     
-    table.add_row("Urgency", f"[bold]{result.urgency.value.upper()}[/bold]")
+    table.add_row("Urgency", _URGENCY_CELLS[result.urgency])
     table.add_row("Issue Type", result.issue_type.value)
     table.add_row("Sentiment", result.customer_sentiment.value)
     table.add_row("Product", result.product or "N/A")
     table.add_row("Risk Signals", ", ".join([s.value for s in result.customer_risk_signals]) or "None")
-    table.add_row("Recommended Action", f"[bold]{result.recommended_action.value}[/bold]")
+    table.add_row("Recommended Action", _ACTION_CELLS[result.recommended_action])
     table.add_row("Specialist Queue", result.recommended_specialist_queue.value)
     table.add_row("Confidence", f"{result.confidence_score:.0%}")
     
-    console.print(table)
+    # Collect everything and render it in a single print call
+    renderables: list = [table]
     
     # Tool calls
     if result.tool_calls:
-        console.print("\n[bold cyan]Tool Calls:[/bold cyan]")
+        renderables.append("\n[bold cyan]Tool Calls:[/bold cyan]")
         for call in result.tool_calls:
             status = "✓" if call.success else "✗"
-            console.print(f"  {status} {call.tool_name}")
+            renderables.append(f"  {status} {call.tool_name}")
     
     # KB Results
     if result.knowledge_base_results:
-        console.print("\n[bold cyan]Knowledge Base Results:[/bold cyan]")
+        renderables.append("\n[bold cyan]Knowledge Base Results:[/bold cyan]")
         for kb in result.knowledge_base_results[:3]:
-            console.print(f"  • {kb.title} (score: {kb.relevance_score:.2f})")
+            renderables.append(f"  • {kb.title} (score: {kb.relevance_score:.2f})")
     
     # Suggested reply
     if result.suggested_reply:
-        console.print("\n[bold cyan]Suggested Reply:[/bold cyan]")
-        console.print(Panel(result.suggested_reply, border_style="green"))
+        renderables.append("\n[bold cyan]Suggested Reply:[/bold cyan]")
+        renderables.append(Panel(result.suggested_reply, border_style="green"))
     
     # Reasoning
     if result.reasoning:
-        console.print(f"\n[dim]Reasoning: {result.reasoning}[/dim]")
+        renderables.append(f"\n[dim]Reasoning: {result.reasoning}[/dim]")
+    
+    console.print(Group(*renderables))
 
 
 def load_tickets_from_file(filepath: str) -> list[SupportTicket]:
@@ -131,24 +226,53 @@ def load_tickets_from_file(filepath: str) -> list[SupportTicket]:
     Returns:
         list[SupportTicket]: List of parsed tickets.
     """
-    with open(filepath, "r") as f:
-        data = json.load(f)
+    raw = Path(filepath).read_bytes()
     
     # Handle different input formats:
     # 1. List of tickets: [{"ticket_id": ...}, {"ticket_id": ...}]
     # 2. Single ticket: {"ticket_id": ...}
     # 3. Batch format: {"batch_id": ..., "tickets": [...]}
-    if isinstance(data, list):
-        # Format 1: Direct list of tickets
-        return [SupportTicket.model_validate(t) for t in data]
-    elif "tickets" in data:
+    if _JSON_ARRAY_START.match(raw):
+        # Format 1: Direct list of tickets, parsed and validated in one pass
+        return load_tickets_json(raw)
+    
+    data = from_json(raw)
+    if "tickets" in data:
         # Format 3: Batch format with nested tickets array
-        return [SupportTicket.model_validate(t) for t in data["tickets"]]
+        return load_tickets(data["tickets"])
     else:
         # Format 2: Single ticket object
         return [SupportTicket.model_validate(data)]
 
 
+def iter_tickets_ndjson(filepath: str) -> Iterator[SupportTicket]:
+    """
+    Stream tickets from a newline-delimited JSON file.
+    
+    Each non-blank line holds one ticket object. Tickets are validated as
+    they are read, so triage can start before the whole file is parsed
+    and memory stays bounded by one line. Lines that fail validation are
+    reported and skipped rather than ending the run.
+    
+    Args:
+        filepath: Path to the NDJSON file.
+    
+    Yields:
+        SupportTicket: The next validated ticket.
+    """
+    with open(filepath, "rb") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                ticket = SupportTicket.model_validate_json(line)
+            except ValidationError as e:
+                logger.error("Invalid ticket on line %d of %s: %s", lineno, filepath, e)
+                console.print(f"[red]Error reading line {lineno} of {filepath}: {e}[/red]")
+                continue
+            yield ticket
+
+
 def save_results(results: list[TriageOutput], filepath: str) -> None:
     """
     Save results to a JSON file.
@@ -157,9 +281,7 @@ def save_results(results: list[TriageOutput], filepath: str) -> None:
         results: List of triage outputs.
         filepath: Path to save to.
     """
-    data = [r.model_dump() for r in results]
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    Path(filepath).write_bytes(_RESULTS_ADAPTER.dump_json(results, indent=2))
     
     console.print(f"[green]Results saved to {filepath}[/green]")
 
@@ -168,7 +290,7 @@ def save_results(results: list[TriageOutput], filepath: str) -> None:
 @click.option(
     "--input", "-i", "input_file",
     type=click.Path(exists=True),
-    help="Input JSON file with tickets (uses sample tickets if not provided)"
+    help="Input JSON or NDJSON file with tickets (uses sample tickets if not provided)"
 )
 @click.option(
     "--output", "-o", "output_file",
@@ -198,12 +320,15 @@ def main(
     
     Process support tickets and output triage results.
     """
+    global console
+    
     # Setup
     config = Config()
     setup_logging(config)
     
     if quiet:
         verbose = False
+        console = _make_console(quiet=True)
     
     # Header
     if verbose:
@@ -215,18 +340,28 @@ def main(
             console.print("[yellow]⚠ OPENAI_API_KEY not set - using rule-based fallback[/yellow]\n")
     
     # Load tickets
-    if input_file:
-        tickets = load_tickets_from_file(input_file)
+    tickets: Iterable[SupportTicket]
+    if input_file and Path(input_file).suffix in NDJSON_SUFFIXES:
+        tickets = iter_tickets_ndjson(input_file)
         if verbose:
-            console.print(f"Loaded {len(tickets)} tickets from {input_file}")
+            console.print(f"Streaming tickets from {input_file}")
+    elif input_file:
+        loaded = load_tickets_from_file(input_file)
+        if verbose:
+            console.print(f"Loaded {len(loaded)} tickets from {input_file}")
+        tickets = loaded
     else:
-        tickets = SAMPLE_TICKETS
+        samples = get_sample_tickets()
         if verbose:
-            console.print(f"Using {len(tickets)} sample tickets")
+            console.print(f"Using {len(samples)} sample tickets")
+        tickets = samples
     
     # Initialize agent
     agent = TriageAgent(config)
     
+    # Startup objects live for the whole run, so keep the cyclic GC off them
+    gc.freeze()
+    
     if verbose:
         console.print(f"Agent initialized with {len(agent.tool_registry)} tools")
         console.print(f"Available tools: {', '.join(agent.tool_registry.get_names())}\n")
@@ -239,8 +374,7 @@ def main(
         save_results(results, output_file)
     elif quiet:
         # JSON output only
-        output = [r.model_dump() for r in results]
-        print(json.dumps(output, indent=2, default=str))
+        print(_RESULTS_ADAPTER.dump_json(results, indent=2).decode())
     
     # Summary
     if verbose:
@@ -248,14 +382,12 @@ def main(
         console.print(f"[bold]Processed {len(results)} tickets[/bold]")
         
         # Stats
-        urgency_counts = {}
-        action_counts = {}
-        for r in results:
-            urgency_counts[r.urgency.value] = urgency_counts.get(r.urgency.value, 0) + 1
-            action_counts[r.recommended_action.value] = action_counts.get(r.recommended_action.value, 0) + 1
+        # attrgetter resolves both attribute chains in C, with no generator frames
+        urgency_counts = Counter(map(attrgetter("urgency.value"), results))
+        action_counts = Counter(map(attrgetter("recommended_action.value"), results))
         
-        console.print(f"\nUrgency distribution: {urgency_counts}")
-        console.print(f"Action distribution: {action_counts}")
+        console.print(f"\nUrgency distribution: {dict(urgency_counts)}")
+        console.print(f"Action distribution: {dict(action_counts)}")
 
 
 if __name__ == "__main__":
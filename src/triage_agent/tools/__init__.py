@@ -24,6 +24,8 @@ All tools work together seamlessly - the agent uses them based on the
 situation to gather context, take actions, and route appropriately.
 """
 
+from functools import lru_cache
+
 from src.triage_agent.tools.base import BaseTool, ToolRegistry
 from src.triage_agent.tools.customer_history import CustomerHistoryTool
 from src.triage_agent.tools.knowledge_base import KnowledgeBaseTool
@@ -55,10 +57,32 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=1)
+def _native_tools() -> tuple[BaseTool, ...]:
+    """
+    Instantiate the native tools once.
+    
+    These tools only read module-level reference data and their own
+    lookup caches, so one instance of each can serve every registry.
+    
+    Returns:
+        tuple[BaseTool, ...]: Shared native tool instances.
+    """
+    return (
+        KnowledgeBaseTool(),
+        CustomerHistoryTool(),
+        RegionStatusTool(),
+    )
+
+
 def create_default_tools(include_mcp: bool = True) -> list[BaseTool]:
     """
     Create the default set of tools for the triage agent.
     
+    Native tools are created once and shared by every caller. MCP-style
+    tools create messages, issues and incidents in their backing services,
+    so they are not treated as shareable and each call gets new instances.
+    
     Args:
         include_mcp: Whether to include MCP-style tools (Slack, Jira, PagerDuty).
                      Defaults to True for full functionality.
@@ -67,11 +91,7 @@ def create_default_tools(include_mcp: bool = True) -> list[BaseTool]:
         list[BaseTool]: List of instantiated tool objects.
     """
     # Core native tools - always included
-    tools = [
-        KnowledgeBaseTool(),
-        CustomerHistoryTool(),
-        RegionStatusTool(),
-    ]
+    tools = list(_native_tools())
     
     # MCP-style integration tools - included by default
     if include_mcp:
@@ -8,9 +8,10 @@ This module implements the Strategy pattern for tools, allowing
 easy addition and removal of tools without modifying core agent logic.
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Type, TypeVar
+from typing import Any, Generic, Optional, Type, TypeVar
 
 from pydantic import BaseModel
 
@@ -21,6 +22,37 @@ InputT = TypeVar("InputT", bound=BaseModel)
 OutputT = TypeVar("OutputT", bound=BaseModel)
 
 
+def _build_function_schema(
+    name: str,
+    description: str,
+    input_model: Type[BaseModel]
+) -> dict[str, Any]:
+    """
+    Build the OpenAI function schema for a tool.
+    
+    Args:
+        name: Tool name.
+        description: Tool description for the agent.
+        input_model: Pydantic model describing the tool arguments.
+    
+    Returns:
+        dict: Function schema for OpenAI function calling.
+    """
+    input_schema = input_model.model_json_schema()
+    
+    # Remove title and description from top level (OpenAI doesn't use them)
+    input_schema.pop("title", None)
+    
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": description,
+            "parameters": input_schema
+        }
+    }
+
+
 class BaseTool(ABC, Generic[InputT, OutputT]):
     """
     Abstract base class for all triage agent tools.
@@ -50,6 +82,22 @@ class BaseTool(ABC, Generic[InputT, OutputT]):
     input_model: Type[InputT]
     output_model: Type[OutputT]
     
+    # Function schema, built at class definition for tools that declare
+    # name, description and input_model on the class, otherwise on the
+    # first get_schema() call
+    _schema: Optional[dict[str, Any]] = None
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        input_model = getattr(cls, "input_model", None)
+        if (
+            isinstance(input_model, type)
+            and issubclass(input_model, BaseModel)
+            and isinstance(getattr(cls, "name", None), str)
+            and isinstance(getattr(cls, "description", None), str)
+        ):
+            cls._schema = _build_function_schema(cls.name, cls.description, input_model)
+    
     def execute(self, input_data: InputT) -> OutputT:
         """
         Execute the tool with the given input.
@@ -66,19 +114,34 @@ class BaseTool(ABC, Generic[InputT, OutputT]):
         Raises:
             ToolExecutionError: If the tool fails to execute.
         """
-        logger.info(f"Executing tool '{self.name}' with input: {input_data}")
+        logger.info("Executing tool '%s' with input: %s", self.name, input_data)
         try:
             result = self._execute(input_data)
-            logger.info(f"Tool '{self.name}' completed successfully")
+            logger.info("Tool '%s' completed successfully", self.name)
             return result
         except Exception as e:
-            logger.error(f"Tool '{self.name}' failed: {e}")
+            logger.error("Tool '%s' failed: %s", self.name, e)
             raise ToolExecutionError(
                 tool_name=self.name,
                 message=str(e),
                 original_error=e
             ) from e
     
+    async def execute_async(self, input_data: InputT) -> OutputT:
+        """
+        Execute the tool in a worker thread without blocking the event loop.
+        
+        Args:
+            input_data: Validated input data matching input_model.
+        
+        Returns:
+            OutputT: Tool output matching output_model.
+        
+        Raises:
+            ToolExecutionError: If the tool fails to execute.
+        """
+        return await asyncio.to_thread(self.execute, input_data)
+    
     @abstractmethod
     def _execute(self, input_data: InputT) -> OutputT:
         """
@@ -111,22 +174,16 @@ class BaseTool(ABC, Generic[InputT, OutputT]):
         """
         Get the OpenAI-compatible function schema for this tool.
         
+        The schema is shared by all instances of a tool class (or built
+        once per instance for tools configured in `__init__`), so callers
+        must not modify it.
+        
         Returns:
             dict: Function schema for OpenAI function calling.
         """
-        input_schema = self.input_model.model_json_schema()
-        
-        # Remove title and description from top level (OpenAI doesn't use them)
-        input_schema.pop("title", None)
-        
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": input_schema
-            }
-        }
+        if self._schema is None:
+            self._schema = _build_function_schema(self.name, self.description, self.input_model)
+        return self._schema
     
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} name='{self.name}'>"
@@ -171,6 +228,7 @@ class ToolRegistry:
     def __init__(self):
         """Initialize an empty tool registry."""
         self._tools: dict[str, BaseTool] = {}
+        self._schemas: Optional[list[dict[str, Any]]] = None
     
     def register(self, tool: BaseTool) -> None:
         """
@@ -186,7 +244,8 @@ class ToolRegistry:
             raise ValueError(f"Tool '{tool.name}' is already registered")
         
         self._tools[tool.name] = tool
-        logger.debug(f"Registered tool: {tool.name}")
+        self._schemas = None
+        logger.debug("Registered tool: %s", tool.name)
     
     def unregister(self, tool_name: str) -> None:
         """
@@ -202,7 +261,8 @@ class ToolRegistry:
             raise KeyError(f"Tool '{tool_name}' is not registered")
         
         del self._tools[tool_name]
-        logger.debug(f"Unregistered tool: {tool_name}")
+        self._schemas = None
+        logger.debug("Unregistered tool: %s", tool_name)
     
     def get(self, tool_name: str) -> BaseTool:
         """
@@ -243,10 +303,15 @@ class ToolRegistry:
         """
         Get OpenAI function schemas for all registered tools.
         
+        The list is cached until a tool is registered or unregistered, so
+        callers must not modify it.
+        
         Returns:
             list[dict]: List of function schemas.
         """
-        return [tool.get_schema() for tool in self._tools.values()]
+        if self._schemas is None:
+            self._schemas = [tool.get_schema() for tool in self._tools.values()]
+        return self._schemas
     
     def has_tool(self, tool_name: str) -> bool:
         """
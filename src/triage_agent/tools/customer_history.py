@@ -11,7 +11,7 @@ In production, this would integrate with a real CRM
 """
 
 import logging
-from typing import Type
+from typing import Any, Type
 
 from src.triage_agent.models.tools import (
     CustomerHistoryInput,
@@ -110,6 +110,81 @@ MOCK_CUSTOMERS = {
 }
 
 
+def _build_history(
+    email: str,
+    customer: dict[str, Any],
+    include_tickets: bool
+) -> CustomerHistoryOutput:
+    """
+    Build the lookup result for a known customer.
+    
+    Args:
+        email: Customer email.
+        customer: The customer's record from `MOCK_CUSTOMERS`.
+        include_tickets: Whether to include past tickets.
+    
+    Returns:
+        CustomerHistoryOutput: Customer information and history.
+    """
+    # Build past tickets list if requested
+    past_tickets = []
+    if include_tickets and customer.get("past_tickets"):
+        past_tickets = [
+            PastTicketSummary(
+                ticket_id=t["ticket_id"],
+                date=t["date"],
+                subject=t["subject"],
+                resolution=t["resolution"],
+                satisfaction_score=t.get("satisfaction_score")
+            )
+            for t in customer["past_tickets"]
+        ]
+    
+    # Calculate average satisfaction
+    avg_satisfaction = None
+    if past_tickets:
+        scores = [t.satisfaction_score for t in past_tickets if t.satisfaction_score]
+        if scores:
+            avg_satisfaction = sum(scores) / len(scores)
+    
+    return CustomerHistoryOutput(
+        customer_email=email,
+        customer_name=customer["name"],
+        account_tier=customer["tier"],
+        account_created=customer["created"],
+        lifetime_value=customer["lifetime_value"],
+        past_tickets=past_tickets,
+        past_ticket_count=len(past_tickets),
+        average_satisfaction=avg_satisfaction,
+        is_at_risk=customer.get("is_at_risk", False),
+        notes=customer.get("notes")
+    )
+
+
+# The mock data never changes, so every lookup result is built once,
+# keyed by (email, include_tickets). Lookups return copies with their own
+# past_tickets list, since frozen models do not freeze list fields
+_CUSTOMER_OUTPUTS: dict[tuple[str, bool], CustomerHistoryOutput] = {
+    (email, include_tickets): _build_history(email, customer, include_tickets)
+    for email, customer in MOCK_CUSTOMERS.items()
+    for include_tickets in (True, False)
+}
+
+# Profile returned for unknown customers, copied with their email
+_UNKNOWN_CUSTOMER = CustomerHistoryOutput(
+    customer_email="",
+    customer_name=None,
+    account_tier="unknown",
+    account_created=None,
+    lifetime_value=0.0,
+    past_tickets=[],
+    past_ticket_count=0,
+    average_satisfaction=None,
+    is_at_risk=False,
+    notes="New customer - no history available"
+)
+
+
 class CustomerHistoryTool(BaseTool[CustomerHistoryInput, CustomerHistoryOutput]):
     """
     Tool for looking up customer history and risk indicators.
@@ -154,61 +229,16 @@ class CustomerHistoryTool(BaseTool[CustomerHistoryInput, CustomerHistoryOutput])
         Returns:
             CustomerHistoryOutput: Customer information and history.
         """
-        email = input_data.customer_email.lower()
-        logger.debug(f"Looking up customer: {email}")
+        email = input_data.customer_email
+        logger.debug("Looking up customer: %s", email)
         
-        # Check if customer exists in mock database
-        if email in MOCK_CUSTOMERS:
-            customer = MOCK_CUSTOMERS[email]
-            
-            # Build past tickets list if requested
-            past_tickets = []
-            if input_data.include_tickets and customer.get("past_tickets"):
-                past_tickets = [
-                    PastTicketSummary(
-                        ticket_id=t["ticket_id"],
-                        date=t["date"],
-                        subject=t["subject"],
-                        resolution=t["resolution"],
-                        satisfaction_score=t.get("satisfaction_score")
-                    )
-                    for t in customer["past_tickets"]
-                ]
-            
-            # Calculate average satisfaction
-            avg_satisfaction = None
-            if past_tickets:
-                scores = [t.satisfaction_score for t in past_tickets if t.satisfaction_score]
-                if scores:
-                    avg_satisfaction = sum(scores) / len(scores)
-            
-            logger.info(f"Found customer: {email} (tier: {customer['tier']})")
-            
-            return CustomerHistoryOutput(
-                customer_email=email,
-                customer_name=customer["name"],
-                account_tier=customer["tier"],
-                account_created=customer["created"],
-                lifetime_value=customer["lifetime_value"],
-                past_tickets=past_tickets,
-                past_ticket_count=len(past_tickets),
-                average_satisfaction=avg_satisfaction,
-                is_at_risk=customer.get("is_at_risk", False),
-                notes=customer.get("notes")
-            )
+        output = _CUSTOMER_OUTPUTS.get((email, input_data.include_tickets))
+        if output is not None:
+            logger.info("Found customer: %s (tier: %s)", email, output.account_tier)
+            return output.model_copy(update={"past_tickets": list(output.past_tickets)})
         
         # Customer not found - return minimal data
-        logger.info(f"Customer not found: {email}, returning default profile")
-        
-        return CustomerHistoryOutput(
-            customer_email=email,
-            customer_name=None,
-            account_tier="unknown",
-            account_created=None,
-            lifetime_value=0.0,
-            past_tickets=[],
-            past_ticket_count=0,
-            average_satisfaction=None,
-            is_at_risk=False,
-            notes="New customer - no history available"
-        )
\ No newline at end of file
+        logger.info("Customer not found: %s, returning default profile", email)
+        return _UNKNOWN_CUSTOMER.model_copy(
+            update={"customer_email": email, "past_tickets": []}
+        )
@@ -12,6 +12,7 @@ In production, these would connect to a real Jira MCP server.
 """
 
 import logging
+import threading
 from datetime import datetime, timezone
 from typing import Any, Optional, Type
 
@@ -97,6 +98,7 @@ MOCK_JIRA_ISSUES = [
 # Track created issues for demo
 MOCK_CREATED_ISSUES = []
 _issue_counter = 1300
+_issue_counter_lock = threading.Lock()
 
 
 # =============================================================================
@@ -326,10 +328,12 @@ class JiraCreateTool(BaseTool[JiraCreateInput, JiraCreateOutput]):
         """Create a mock Jira issue."""
         global _issue_counter
         
-        # Generate issue key
-        _issue_counter += 1
-        issue_key = f"{input_data.project}-{_issue_counter}"
-        issue_id = str(10000 + _issue_counter)
+        # Generate issue key; tickets may be triaged from several threads
+        with _issue_counter_lock:
+            _issue_counter += 1
+            issue_number = _issue_counter
+        issue_key = f"{input_data.project}-{issue_number}"
+        issue_id = str(10000 + issue_number)
         created_at = datetime.now(timezone.utc).isoformat()
         
         # Store the created issue
@@ -348,7 +352,7 @@ class JiraCreateTool(BaseTool[JiraCreateInput, JiraCreateOutput]):
         }
         MOCK_CREATED_ISSUES.append(new_issue)
         
-        logger.info(f"Created Jira issue: {issue_key} - {input_data.summary}")
+        logger.info("Created Jira issue: %s - %s", issue_key, input_data.summary)
         
         return JiraCreateOutput(
             success=True,
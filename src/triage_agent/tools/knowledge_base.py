@@ -11,9 +11,10 @@ In production, this would integrate with a real search backend
 """
 
 import logging
-from typing import Type
+from functools import lru_cache
+from typing import Optional, Type
 
-from src.triage_agent.knowledge_base_data import KNOWLEDGE_BASE_ARTICLES
+from src.triage_agent.knowledge_base_data import search_kb
 from src.triage_agent.models.tools import (
     KnowledgeBaseArticle,
     KnowledgeBaseInput,
@@ -24,13 +25,48 @@ from src.triage_agent.tools.base import BaseTool
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=2048)
+def _cached_search(
+    query: str,
+    category: Optional[str],
+    max_results: int
+) -> tuple[int, tuple[KnowledgeBaseArticle, ...]]:
+    """
+    Run a knowledge base search, memoized per normalized query.
+
+    The knowledge base is immutable at runtime and support queries repeat
+    heavily, so identical searches reuse the earlier result.
+
+    Args:
+        query: Lowercased query with whitespace collapsed.
+        category: Lowercased category filter, or None.
+        max_results: Maximum number of results to return.
+
+    Returns:
+        tuple: Total match count and the top articles.
+    """
+    total_matches, top_results = search_kb(query, category, max_results)
+    return total_matches, tuple(
+        KnowledgeBaseArticle(
+            id=article["id"],
+            title=article["title"],
+            url=article["url"],
+            category=article["category"],
+            content_snippet=article["snippet"],
+            relevance_score=round(score, 2)
+        )
+        for score, article in top_results
+    )
+
+
 class KnowledgeBaseTool(BaseTool[KnowledgeBaseInput, KnowledgeBaseOutput]):
     """
     Tool for searching the knowledge base.
     
     Searches through knowledge base articles to find relevant
     documentation for customer issues. Returns ranked results
-    based on keyword matching and category filtering.
+    based on keyword matching and category filtering, using the
+    inverted indexes in `knowledge_base_data`.
     
     Attributes:
         name: "knowledge_base_search"
@@ -67,90 +103,20 @@ class KnowledgeBaseTool(BaseTool[KnowledgeBaseInput, KnowledgeBaseOutput]):
             KnowledgeBaseOutput: Search results with relevance scores.
         """
         query = input_data.query.lower()
-        query_terms = set(query.split())
-        
-        logger.debug(f"Searching KB for: '{query}' (terms: {query_terms})")
-        
-        scored_results: list[tuple[float, dict]] = []
-        
-        for article in KNOWLEDGE_BASE_ARTICLES:
-            # Apply category filter if specified
-            if input_data.category_filter:
-                if article["category"].lower() != input_data.category_filter.lower():
-                    continue
-            
-            # Calculate relevance score based on keyword matching
-            score = self._calculate_relevance(query_terms, article)
-            
-            if score > 0.1:  # Minimum relevance threshold
-                scored_results.append((score, article))
-        
-        # Sort by relevance score descending
-        scored_results.sort(key=lambda x: x[0], reverse=True)
         
-        # Limit to max_results
-        top_results = scored_results[:input_data.max_results]
+        logger.debug("Searching KB for: '%s'", query)
         
-        # Convert to output format
-        results = [
-            KnowledgeBaseArticle(
-                id=article["id"],
-                title=article["title"],
-                url=article["url"],
-                category=article["category"],
-                content_snippet=article["content"][:200] + "...",
-                relevance_score=round(score, 2)
-            )
-            for score, article in top_results
-        ]
+        total_matches, results = _cached_search(
+            " ".join(query.split()),
+            input_data.category_filter.lower() if input_data.category_filter else None,
+            input_data.max_results
+        )
         
-        logger.info(f"KB search found {len(results)} relevant articles")
+        logger.info("KB search found %s relevant articles", len(results))
         
-        return KnowledgeBaseOutput(
-            results=results,
-            total_matches=len(scored_results),
+        # Articles come prevalidated from _cached_search, so skip validation
+        return KnowledgeBaseOutput.model_construct(
+            results=list(results),
+            total_matches=total_matches,
             query_processed=query
         )
-    
-    def _calculate_relevance(
-        self,
-        query_terms: set[str],
-        article: dict
-    ) -> float:
-        """
-        Calculate relevance score for an article.
-        
-        Uses a simple TF-based scoring with boosts for title matches.
-        
-        Args:
-            query_terms: Set of query terms.
-            article: Article dictionary.
-        
-        Returns:
-            float: Relevance score between 0 and 1.
-        """
-        title_lower = article["title"].lower()
-        content_lower = article["content"].lower()
-        keywords_lower = [k.lower() for k in article.get("keywords", [])]
-        
-        score = 0.0
-        
-        for term in query_terms:
-            # Title match (highest weight)
-            if term in title_lower:
-                score += 0.4
-            
-            # Keyword match (high weight)
-            if any(term in kw for kw in keywords_lower):
-                score += 0.3
-            
-            # Content match (lower weight)
-            if term in content_lower:
-                score += 0.15
-        
-        # Normalize to 0-1 range
-        max_possible = len(query_terms) * 0.85
-        if max_possible > 0:
-            score = min(score / max_possible, 1.0)
-        
-        return score
\ No newline at end of file
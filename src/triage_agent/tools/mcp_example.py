@@ -209,8 +209,8 @@ class MCPClient:
             try:
                 # SKELETON: Replace with actual MCP connection
                 # This is where you would use the MCP SDK to connect
-                logger.info(f"Connecting to MCP server: {name}")
-                logger.info(f"  Command: {config.command} {' '.join(config.args)}")
+                logger.info("Connecting to MCP server: %s", name)
+                logger.info("  Command: %s %s", config.command, " ".join(config.args))
                 
                 # Placeholder for actual connection
                 # self.connections[name] = await self._create_connection(config)
@@ -221,7 +221,7 @@ class MCPClient:
                 #     self.tools[f"{name}.{tool.name}"] = MCPToolDefinition(...)
                 
             except Exception as e:
-                logger.error(f"Failed to connect to {name}: {e}")
+                logger.error("Failed to connect to %s: %s", name, e)
         
         self._connected = True
     
@@ -231,9 +231,9 @@ class MCPClient:
             try:
                 # SKELETON: Close the connection
                 # await connection.close()
-                logger.info(f"Disconnected from MCP server: {name}")
+                logger.info("Disconnected from MCP server: %s", name)
             except Exception as e:
-                logger.error(f"Error disconnecting from {name}: {e}")
+                logger.error("Error disconnecting from %s: %s", name, e)
         
         self.connections.clear()
         self._connected = False
@@ -285,7 +285,7 @@ class MCPClient:
         # result = await self.connections[server].call_tool(tool, arguments)
         # return result.content
         
-        logger.info(f"Calling {server}.{tool} with args: {arguments}")
+        logger.info("Calling %s.%s with args: %s", server, tool, arguments)
         
         # Placeholder response
         return {
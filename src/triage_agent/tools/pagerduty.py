@@ -12,6 +12,7 @@ In production, these would connect to a real PagerDuty MCP server.
 """
 
 import logging
+import threading
 from datetime import datetime, timezone
 from typing import Any, Optional, Type
 
@@ -82,6 +83,7 @@ MOCK_ON_CALL_SCHEDULE = {
 # Track created incidents for demo
 MOCK_CREATED_INCIDENTS = []
 _incident_counter = 3
+_incident_counter_lock = threading.Lock()
 
 
 # =============================================================================
@@ -267,10 +269,12 @@ class PagerDutyCreateTool(BaseTool[PagerDutyCreateInput, PagerDutyCreateOutput])
         """Create a mock PagerDuty incident."""
         global _incident_counter
         
-        # Generate incident ID
-        _incident_counter += 1
+        # Generate incident ID; tickets may be triaged from several threads
+        with _incident_counter_lock:
+            _incident_counter += 1
+            incident_number = _incident_counter
         today = datetime.now().strftime("%Y-%m%d")
-        incident_id = f"P-INC-{today}-{_incident_counter:03d}"
+        incident_id = f"P-INC-{today}-{incident_number:03d}"
         created_at = datetime.now(timezone.utc).isoformat()
         
         # Determine on-call person based on service
@@ -298,8 +302,8 @@ class PagerDutyCreateTool(BaseTool[PagerDutyCreateInput, PagerDutyCreateOutput])
         }
         MOCK_CREATED_INCIDENTS.append(new_incident)
         
-        logger.info(f"Created PagerDuty incident: {incident_id} - {input_data.title}")
-        logger.info(f"Paging on-call: {assigned_to}")
+        logger.info("Created PagerDuty incident: %s - %s", incident_id, input_data.title)
+        logger.info("Paging on-call: %s", assigned_to)
         
         return PagerDutyCreateOutput(
             success=True,
@@ -12,7 +12,7 @@ monitoring system (DataDog, PagerDuty, etc.).
 
 import logging
 from datetime import datetime, timezone
-from typing import Type
+from typing import Any, Type
 
 from src.triage_agent.models.tools import (
     RegionStatusInput,
@@ -25,7 +25,7 @@ logger = logging.getLogger(__name__)
 
 
 # Mock region status data
-MOCK_REGION_STATUS = {
+MOCK_REGION_STATUS: dict[str, dict[str, Any]] = {
     "us-east": {
         "overall": "degraded",
         "services": [
@@ -149,6 +149,23 @@ MOCK_REGION_STATUS = {
 }
 
 
+# The mock data never changes and ServiceStatus is frozen, so each
+# region's service entries are built once and shared between lookups.
+# Only last_updated differs per call, so whole outputs are not cached.
+_REGION_SERVICES: dict[str, tuple[ServiceStatus, ...]] = {
+    region: tuple(
+        ServiceStatus(
+            service_name=s["service_name"],
+            status=s["status"],
+            latency_ms=s["latency_ms"],
+            last_incident=s.get("last_incident")
+        )
+        for s in region_data["services"]
+    )
+    for region, region_data in MOCK_REGION_STATUS.items()
+}
+
+
 class RegionStatusTool(BaseTool[RegionStatusInput, RegionStatusOutput]):
     """
     Tool for checking regional service health status.
@@ -192,14 +209,14 @@ class RegionStatusTool(BaseTool[RegionStatusInput, RegionStatusOutput]):
             RegionStatusOutput: Regional status information.
         """
         region = input_data.region.lower()
-        logger.debug(f"Checking status for region: {region}")
+        logger.debug("Checking status for region: %s", region)
         
         # Get current timestamp
         now = datetime.now(timezone.utc).isoformat()
         
         # Check if region exists
         if region not in MOCK_REGION_STATUS:
-            logger.warning(f"Unknown region requested: {region}")
+            logger.warning("Unknown region requested: %s", region)
             return RegionStatusOutput(
                 region=region,
                 overall_status="unknown",
@@ -211,33 +228,25 @@ class RegionStatusTool(BaseTool[RegionStatusInput, RegionStatusOutput]):
         region_data = MOCK_REGION_STATUS[region]
         
         # Filter services if specific ones requested
-        services_data = region_data["services"]
+        services = list(_REGION_SERVICES[region])
         if input_data.check_services:
-            services_data = [
-                s for s in services_data
-                if s["service_name"] in input_data.check_services
+            services = [
+                s for s in services
+                if s.service_name in input_data.check_services
             ]
         
-        # Convert to ServiceStatus objects
-        services = [
-            ServiceStatus(
-                service_name=s["service_name"],
-                status=s["status"],
-                latency_ms=s["latency_ms"],
-                last_incident=s.get("last_incident")
-            )
-            for s in services_data
-        ]
-        
         logger.info(
-            f"Region {region} status: {region_data['overall']} "
-            f"({len(services)} services checked)"
+            "Region %s status: %s (%s services checked)",
+            region,
+            region_data["overall"],
+            len(services)
         )
         
-        return RegionStatusOutput(
+        # Every value comes from the prebuilt mock tables, so skip validation
+        return RegionStatusOutput.model_construct(
             region=region,
             overall_status=region_data["overall"],
             services=services,
-            active_incidents=region_data.get("active_incidents", []),
+            active_incidents=list(region_data.get("active_incidents", ())),
             last_updated=now
         )
\ No newline at end of file
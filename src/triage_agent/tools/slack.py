@@ -265,7 +265,7 @@ class SlackPostTool(BaseTool[SlackPostInput, SlackPostOutput]):
             "posted_at": posted_at
         })
         
-        logger.info(f"Posted to {input_data.channel}: {input_data.message[:50]}...")
+        logger.info("Posted to %s: %s...", input_data.channel, input_data.message[:50])
         
         return SlackPostOutput(
             success=True,
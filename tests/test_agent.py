@@ -6,15 +6,27 @@ Tests for the TriageAgent class including initialization,
 ticket processing, and tool orchestration.
 """
 
+import httpx
 import pytest
+from openai import InternalServerError, RateLimitError
 
+from src.triage_agent.core import agent as agent_module
 from src.triage_agent.core.agent import TriageAgent
+from src.triage_agent.core.batch import build_batch_line
+from src.triage_agent.core.cache import TriageCache, make_cache_key
+from src.triage_agent.core import rate_limiter as rate_limiter_module
+from src.triage_agent.core.rate_limiter import RateLimiter, estimate_tokens
 from src.triage_agent.config import Config
 from src.triage_agent.models.triage_output import (
     UrgencyLevel,
     RecommendedAction,
     RiskSignal,
 )
+from src.triage_agent.prompts.system_prompt import (
+    build_system_prompt,
+    get_system_prompt,
+    get_system_prompt_sections,
+)
 
 
 class TestAgentInitialization:
@@ -83,6 +95,374 @@ class TestTicketProcessing:
             assert result.recommended_action is not None
 
 
+class TestAsyncTriage:
+    """Tests for the async triage path."""
+    
+    @pytest.mark.asyncio
+    async def test_triage_async_matches_sync(self, agent, billing_ticket):
+        """Test that async triage produces the same result as sync triage."""
+        result = await agent.triage_async(billing_ticket)
+        expected = agent.triage(billing_ticket)
+        
+        assert result.urgency == expected.urgency
+        assert result.recommended_action == expected.recommended_action
+    
+    @pytest.mark.asyncio
+    async def test_llm_failure_falls_back_without_blocking(self, agent, billing_ticket, monkeypatch):
+        """Test that an LLM failure in async triage uses the async rule-based path."""
+        async def failing_llm(ticket):
+            raise RuntimeError("LLM unavailable")
+        
+        def blocking_fallback(ticket):
+            raise AssertionError("sync fallback used in async triage")
+        
+        monkeypatch.setattr(agent, "aclient", object())
+        monkeypatch.setattr(agent, "_llm_triage_async", failing_llm)
+        monkeypatch.setattr(agent, "_rule_based_triage", blocking_fallback)
+        
+        result = await agent.triage_async(billing_ticket)
+        
+        assert result.ticket_id == billing_ticket.ticket_id
+        assert agent.is_fallback_output(result)
+    
+    @pytest.mark.asyncio
+    async def test_async_client_created_lazily_and_closed(self, monkeypatch):
+        """Test that the async client is only built on use and closed by aclose."""
+        class FakeAsyncClient:
+            def __init__(self, **kwargs):
+                self.closed = False
+            
+            async def close(self):
+                self.closed = True
+        
+        monkeypatch.setattr(agent_module, "AsyncOpenAI", FakeAsyncClient)
+        monkeypatch.setattr(agent_module, "_build_async_http_client", lambda config: None)
+        agent = TriageAgent(Config(openai_api_key="sk-test-key-123"), client=object())
+        
+        assert agent._aclient is None
+        aclient = agent.aclient
+        assert agent.aclient is aclient
+        
+        await agent.aclose()
+        
+        assert aclient.closed
+        assert agent._aclient is None
+    
+    @pytest.mark.asyncio
+    async def test_triage_many_preserves_order(self, agent, sample_tickets):
+        """Test that batch triage returns results in input order."""
+        results = await agent.triage_many(sample_tickets)
+        
+        assert [r.ticket_id for r in results] == [t.ticket_id for t in sample_tickets]
+
+
+class TestResponseParsing:
+    """Tests for parsing LLM triage responses."""
+    
+    def test_structured_response_validates_directly(self, agent, billing_ticket):
+        """Test that schema-conforming JSON is validated and tagged with the ticket."""
+        content = (
+            '{"ticket_id": "ignored", "urgency": "low", "issue_type": "billing", '
+            '"customer_sentiment": "neutral", "recommended_action": "auto_respond"}'
+        )
+        
+        result = agent._parse_llm_response(content, billing_ticket, [])
+        
+        assert result.ticket_id == billing_ticket.ticket_id
+        assert result.urgency == UrgencyLevel.LOW
+    
+    def test_fenced_partial_response_parsed_leniently(self, agent, billing_ticket):
+        """Test that non-conforming responses still parse with defaults."""
+        content = '```json\n{"urgency": "high", "customer_risk_signals": ["unknown"]}\n```'
+        
+        result = agent._parse_llm_response(content, billing_ticket, [])
+        
+        assert result.urgency == UrgencyLevel.HIGH
+        assert result.customer_risk_signals == []
+    
+    def test_unknown_enum_values_use_defaults(self, agent, billing_ticket):
+        """Test that unrecognized enum values fall back to field defaults."""
+        content = '{"urgency": "bogus", "recommended_action": "bogus"}'
+        
+        result = agent._parse_llm_response(content, billing_ticket, [])
+        
+        assert result.urgency == UrgencyLevel.MEDIUM
+        assert result.recommended_action == RecommendedAction.ROUTE_TO_SPECIALIST
+    
+    def test_response_format_omits_tool_calls(self, agent):
+        """Test that the structured output schema leaves tool calls to the agent."""
+        schema = agent._response_format["json_schema"]["schema"]
+        
+        assert "tool_calls" not in schema["properties"]
+        assert "urgency" in schema["required"]
+    
+    def test_response_format_is_shared(self, agent, config):
+        """Test that the schema is generated once for all agents."""
+        assert TriageAgent(config)._response_format is agent._response_format
+    
+    def test_prompt_variant_replaces_one_section(self):
+        """Test that prompt variants swap a single section."""
+        sections = get_system_prompt_sections()
+        variant = build_system_prompt({"EXAMPLES": "## EXAMPLES\nNone.\n"})
+        
+        assert "".join(sections) == get_system_prompt()
+        assert variant.endswith("## EXAMPLES\nNone.\n")
+        assert variant.startswith("".join(sections[:-1]))
+        with pytest.raises(KeyError):
+            build_system_prompt({"NO SUCH SECTION": ""})
+    
+    def test_requests_share_prompt_cache_key(self, agent):
+        """Test that completions carry a cache key tied to the system prompt."""
+        extra_body = agent._triage_completion_kwargs()["extra_body"]
+        
+        assert extra_body["prompt_cache_key"] == agent._prompt_cache_key
+        assert agent._prompt_cache_key.startswith("triage-system-")
+
+
+class TestBatchTriage:
+    """Tests for multi-ticket batch triage."""
+    
+    def test_triage_batch_preserves_order(self, agent, sample_tickets):
+        """Test that batch triage returns one result per ticket in order."""
+        results = agent.triage_batch(sample_tickets, batch_size=2)
+        
+        assert [r.ticket_id for r in results] == [t.ticket_id for t in sample_tickets]
+    
+    def test_parse_batch_response_falls_back_per_entry(self, agent, sample_tickets):
+        """Test that a malformed entry only affects its own ticket."""
+        tickets = sample_tickets[:2]
+        content = '{"results": [{"urgency": "high", "issue_type": "billing"}, "bogus"]}'
+        
+        results = agent._parse_llm_batch_response(content, tickets)
+        
+        assert results[0].urgency == UrgencyLevel.HIGH
+        assert results[0].ticket_id == tickets[0].ticket_id
+        assert results[1].confidence_score == 0.3
+        assert results[1].ticket_id == tickets[1].ticket_id
+    
+    def test_fallback_outputs_are_identified(self, agent, sample_tickets):
+        """Test that rule-based and error fallbacks are told apart from LLM output."""
+        content = '{"results": [{"urgency": "high", "issue_type": "billing"}, "bogus"]}'
+        parsed, fallback = agent._parse_llm_batch_response(content, sample_tickets[:2])
+        
+        assert not agent.is_fallback_output(parsed)
+        assert agent.is_fallback_output(fallback)
+        assert agent.is_fallback_output(agent.triage(sample_tickets[0]))
+    
+    def test_batch_line_targets_chat_completions(self):
+        """Test that Batch API entries use the chat completions endpoint."""
+        line = build_batch_line("T-001", {"model": "gpt-4o"})
+        
+        assert line["custom_id"] == "T-001"
+        assert line["method"] == "POST"
+        assert line["url"] == "/v1/chat/completions"
+        assert line["body"] == {"model": "gpt-4o"}
+    
+    def test_submit_batch_requires_api_key(self, agent, sample_tickets):
+        """Test that Batch API submission needs a configured client."""
+        with pytest.raises(RuntimeError):
+            agent.submit_batch(sample_tickets)
+    
+    def test_collect_batch_requires_api_key(self, agent, sample_tickets):
+        """Test that collecting Batch API results needs a configured client."""
+        with pytest.raises(RuntimeError):
+            agent.collect_batch("batch-123", sample_tickets)
+
+
+class TestTriageCache:
+    """Tests for the in-memory triage result cache."""
+    
+    def test_cache_key_ignores_case_and_whitespace(self, billing_ticket):
+        """Test that the exact-match key normalizes ticket text."""
+        variant = billing_ticket.model_copy(update={
+            "subject": f"  {billing_ticket.subject.upper()} ",
+        })
+        
+        assert make_cache_key(billing_ticket, "gpt-4o", 0.1) == make_cache_key(variant, "gpt-4o", 0.1)
+        assert make_cache_key(billing_ticket, "gpt-4o", 0.1) != make_cache_key(billing_ticket, "gpt-4o", 0.5)
+    
+    def test_cache_key_separates_customers(self, billing_ticket):
+        """Test that the same text from another customer gets its own key."""
+        other = billing_ticket.model_copy(update={
+            "ticket_id": "OTHER-1",
+            "customer_email": "someone.else@example.com",
+        })
+        resent = billing_ticket.model_copy(update={"ticket_id": "RESENT-1"})
+        
+        assert make_cache_key(billing_ticket, "gpt-4o", 0.1) != make_cache_key(other, "gpt-4o", 0.1)
+        assert make_cache_key(billing_ticket, "gpt-4o", 0.1) == make_cache_key(resent, "gpt-4o", 0.1)
+    
+    def test_fallback_outputs_are_not_cached(self, agent, billing_ticket, monkeypatch):
+        """Test that a parse-failure fallback is not reused for later tickets."""
+        def unparseable_llm(ticket):
+            return agent._create_fallback_output(ticket, [], "bad JSON")
+        
+        monkeypatch.setattr(agent, "client", object())
+        monkeypatch.setattr(agent, "_llm_triage", unparseable_llm)
+        
+        result = agent.triage(billing_ticket)
+        
+        assert agent.is_fallback_output(result)
+        assert len(agent.cache) == 0
+    
+    def test_cache_evicts_least_recently_used(self, agent, billing_ticket):
+        """Test that the cache keeps at most max_entries results."""
+        output = agent.triage(billing_ticket)
+        cache = TriageCache(max_entries=2)
+        cache.put("a", output)
+        cache.put("b", output)
+        cache.get("a")
+        cache.put("c", output)
+        
+        assert cache.get("a") is output
+        assert cache.get("b") is None
+        assert len(cache) == 2
+    
+    def test_semantic_lookup_uses_threshold(self, agent, billing_ticket):
+        """Test that similar embeddings hit and dissimilar ones miss."""
+        output = agent.triage(billing_ticket)
+        cache = TriageCache()
+        cache.put("a", output, embedding=[1.0, 0.0])
+        
+        assert cache.get_similar([0.99, 0.05], threshold=0.92) is output
+        assert cache.get_similar([0.0, 1.0], threshold=0.92) is None
+    
+    def test_semantic_lookup_stays_within_scope(self, agent, billing_ticket):
+        """Test that semantic hits only come from entries in the same scope."""
+        output = agent.triage(billing_ticket)
+        cache = TriageCache()
+        cache.put("a", output, embedding=[1.0, 0.0], scope="free")
+        
+        assert cache.get_similar([1.0, 0.0], threshold=0.92, scope="free") is output
+        assert cache.get_similar([1.0, 0.0], threshold=0.92, scope="enterprise") is None
+
+
+class TestRateLimiter:
+    """Tests for the client-side OpenAI rate limiter."""
+    
+    def test_estimate_tokens_includes_completion_budget(self):
+        """Test that estimates cover prompt text plus max_tokens."""
+        messages = [{"role": "user", "content": "x" * 400}]
+        
+        assert estimate_tokens(messages, max_tokens=100) == 200
+    
+    def test_requests_wait_when_bucket_empty(self):
+        """Test that requests beyond the per-minute budget must wait."""
+        limiter = RateLimiter(max_requests_per_minute=2, max_tokens_per_minute=1000)
+        
+        assert limiter.try_acquire(10) == 0.0
+        assert limiter.try_acquire(10) == 0.0
+        assert limiter.try_acquire(10) > 0.0
+    
+    def test_rate_limit_lowers_capacity(self):
+        """Test that a 429 drains the buckets and reduces capacity."""
+        limiter = RateLimiter(max_requests_per_minute=100, max_tokens_per_minute=1000)
+        limiter.record_rate_limit()
+        
+        assert limiter.max_requests_per_minute < 100
+        assert limiter.try_acquire(10) > 0.0
+    
+    def test_capacity_recovers_after_rate_limit(self, monkeypatch):
+        """Test that lowered capacity climbs back to the configured limits."""
+        clock = [1000.0]
+        monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: clock[0])
+        limiter = RateLimiter(max_requests_per_minute=100, max_tokens_per_minute=1000)
+        limiter.record_rate_limit()
+        limiter.record_rate_limit()
+        
+        clock[0] += 60
+        limiter.try_acquire(10)
+        assert 81 < limiter.max_requests_per_minute < 100
+        
+        clock[0] += 600
+        limiter.try_acquire(10)
+        assert limiter.max_requests_per_minute == 100
+        assert limiter.max_tokens_per_minute == 1000
+    
+    def test_unset_limits_disable_throttling(self):
+        """Test that a limiter without limits never makes requests wait."""
+        limiter = RateLimiter(max_requests_per_minute=None, max_tokens_per_minute=None)
+        limiter.record_rate_limit()
+        
+        assert all(limiter.try_acquire(100_000) == 0.0 for _ in range(1000))
+
+
+def _api_error(error_cls, status, headers=None):
+    """Build an OpenAI API error carrying a fake HTTP response."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status, headers=headers, request=request)
+    return error_cls("boom", response=response, body=None)
+
+
+class TestApiRetries:
+    """Tests for retrying transient OpenAI errors."""
+    
+    def _agent_with_failures(self, monkeypatch, *errors, max_retries=3):
+        """Build an agent whose completion call raises errors, then succeeds."""
+        failures = list(errors)
+        calls = []
+        sleeps = []
+        
+        def create(**kwargs):
+            calls.append(kwargs)
+            if failures:
+                raise failures.pop(0)
+            return "response"
+        
+        class FakeClient:
+            class chat:
+                class completions:
+                    pass
+        
+        FakeClient.chat.completions.create = staticmethod(create)
+        monkeypatch.setattr(agent_module.time, "sleep", sleeps.append)
+        agent = TriageAgent(
+            Config(openai_api_key="sk-test-key-123", max_retries=max_retries),
+            client=FakeClient()
+        )
+        return agent, calls, sleeps
+    
+    def test_server_error_is_retried(self, monkeypatch):
+        """Test that a 5xx response is retried and the next attempt succeeds."""
+        agent, calls, sleeps = self._agent_with_failures(
+            monkeypatch, _api_error(InternalServerError, 500)
+        )
+        
+        response = agent._create_completion(messages=[{"role": "user", "content": "hi"}])
+        
+        assert response == "response"
+        assert len(calls) == 2
+        assert sleeps == [1.0]
+    
+    def test_rate_limit_honors_retry_after(self, monkeypatch):
+        """Test that a 429 waits for Retry-After and lowers the limiter capacity."""
+        agent, calls, sleeps = self._agent_with_failures(
+            monkeypatch,
+            _api_error(RateLimitError, 429, {"retry-after": "7"}),
+            max_retries=1
+        )
+        recorded = []
+        monkeypatch.setattr(agent.limiter, "record_rate_limit", lambda: recorded.append(1))
+        
+        response = agent._create_completion(messages=[{"role": "user", "content": "hi"}])
+        
+        assert response == "response"
+        assert sleeps == [7.0]
+        assert recorded == [1]
+    
+    def test_retries_are_bounded(self, monkeypatch):
+        """Test that the last error is raised once retries run out."""
+        agent, calls, _ = self._agent_with_failures(
+            monkeypatch,
+            *[_api_error(InternalServerError, 503) for _ in range(3)],
+            max_retries=2
+        )
+        
+        with pytest.raises(InternalServerError):
+            agent._create_completion(messages=[{"role": "user", "content": "hi"}])
+        assert len(calls) == 3
+
+
 class TestToolCalls:
     """Tests for tool call recording."""
     
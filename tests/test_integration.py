@@ -7,6 +7,9 @@ from ticket input to final output, including all tools
 and business logic working together.
 """
 
+import json
+import time
+
 import pytest
 
 from src.triage_agent.core.agent import TriageAgent
@@ -20,6 +23,8 @@ from src.triage_agent.models.triage_output import (
     RecommendedAction,
     SpecialistQueue,
 )
+from src.triage_agent.chat import _triage_cached
+from src.triage_agent.runner import iter_tickets_ndjson, process_tickets
 
 
 class TestEnterpriseTriageFlow:
@@ -271,4 +276,106 @@ class TestOutputCompleteness:
         """Test that confidence score is in valid range."""
         result = agent.triage(billing_ticket)
         
-        assert 0.0 <= result.confidence_score <= 1.0
\ No newline at end of file
+        assert 0.0 <= result.confidence_score <= 1.0
+
+
+class TestRunner:
+    """Tests for the command-line runner."""
+    
+    def test_parallel_processing_keeps_order(self, agent, sample_tickets, monkeypatch):
+        """Test that threaded triage returns results in ticket order."""
+        rule_based = agent._rule_based_triage
+        monkeypatch.setattr(agent, "client", object())
+        monkeypatch.setattr(agent, "triage", rule_based)
+        
+        results = process_tickets(agent, sample_tickets)
+        
+        assert [r.ticket_id for r in results] == [t.ticket_id for t in sample_tickets]
+    
+    def test_parallel_processing_reads_ahead_at_most_one_window(self, agent, sample_tickets, monkeypatch):
+        """Test that threaded triage does not pull the whole stream up front."""
+        window = agent.config.max_concurrency
+        tickets = [
+            t.model_copy(update={"ticket_id": f"{t.ticket_id}-{i}"})
+            for i in range(3)
+            for t in sample_tickets
+        ]
+        pulled = []
+        read_ahead = []
+        
+        def stream():
+            for ticket in tickets:
+                pulled.append(ticket)
+                yield ticket
+        
+        def slow_first_triage(ticket):
+            if ticket is tickets[0]:
+                # Give the submitting thread time to read ahead if it would
+                time.sleep(0.1)
+                read_ahead.append(len(pulled))
+            return rule_based(ticket)
+        
+        rule_based = agent._rule_based_triage
+        monkeypatch.setattr(agent, "client", object())
+        monkeypatch.setattr(agent, "triage", slow_first_triage)
+        
+        results = process_tickets(agent, stream())
+        
+        assert read_ahead == [window]
+        assert [r.ticket_id for r in results] == [t.ticket_id for t in tickets]
+    
+    def test_ndjson_tickets_are_streamed(self, agent, sample_tickets, tmp_path):
+        """Test that NDJSON input is read lazily, one ticket per line."""
+        path = tmp_path / "tickets.ndjson"
+        path.write_text("\n".join(t.model_dump_json() for t in sample_tickets) + "\n\n")
+        
+        stream = iter_tickets_ndjson(str(path))
+        assert next(stream) == sample_tickets[0]
+        
+        results = process_tickets(agent, iter_tickets_ndjson(str(path)))
+        assert [r.ticket_id for r in results] == [t.ticket_id for t in sample_tickets]
+    
+    def test_invalid_ndjson_line_is_skipped(self, agent, sample_tickets, tmp_path):
+        """Test that a ticket failing validation does not end the stream."""
+        bad = sample_tickets[0].model_dump(mode="json") | {"customer_email": "bad"}
+        path = tmp_path / "tickets.ndjson"
+        path.write_text(
+            sample_tickets[0].model_dump_json() + "\n"
+            + json.dumps(bad) + "\n"
+            + sample_tickets[1].model_dump_json() + "\n"
+        )
+        
+        results = process_tickets(agent, iter_tickets_ndjson(str(path)))
+        
+        assert [r.ticket_id for r in results] == [
+            sample_tickets[0].ticket_id, sample_tickets[1].ticket_id
+        ]
+
+
+class TestChatResultCache:
+    """Tests for the chat CLI's on-disk result cache."""
+    
+    def test_resubmitted_ticket_reuses_stored_result(self, sample_tickets, tmp_path, monkeypatch):
+        """Test that a ticket re-sent under a new ID is served from the cache."""
+        agent = TriageAgent(Config(
+            openai_api_key="",
+            enable_result_cache=True,
+            result_cache_dir=str(tmp_path)
+        ))
+        calls = []
+        
+        def llm_triage(ticket):
+            calls.append(ticket.ticket_id)
+            return agent._rule_based_triage(ticket).model_copy(update={"reasoning": "LLM"})
+        
+        monkeypatch.setattr(agent, "client", object())
+        monkeypatch.setattr(agent, "triage", llm_triage)
+        ticket = sample_tickets[0]
+        resent = ticket.model_copy(update={"ticket_id": "CHAT-RESENT"})
+        
+        first = _triage_cached(agent, ticket)
+        second = _triage_cached(agent, resent)
+        
+        assert calls == [ticket.ticket_id]
+        assert second.ticket_id == "CHAT-RESENT"
+        assert second.model_copy(update={"ticket_id": first.ticket_id}) == first
@@ -8,14 +8,17 @@ serialization, and schema generation.
 
 import json
 import pytest
+from pydantic import ValidationError
 
-from src.triage_agent.models.ticket import SupportTicket
+from src.triage_agent.models.ticket import SupportTicket, load_tickets, load_tickets_json
 from src.triage_agent.models.triage_output import (
+    CLASSIFICATIONS,
     TriageOutput,
     UrgencyLevel,
     IssueType,
     CustomerSentiment,
     RiskSignal,
+    RiskSignalMask,
     RecommendedAction,
     SpecialistQueue,
 )
@@ -75,6 +78,16 @@ class TestSupportTicket:
                 customer_email="not-an-email"
             )
     
+    def test_ticket_email_validation_requires_domain_dot(self):
+        """Test that a dot outside the domain does not pass as an email."""
+        with pytest.raises(ValueError):
+            SupportTicket(
+                ticket_id="T-004",
+                subject="Test",
+                body="Body",
+                customer_email="first.last@localhost"
+            )
+    
     def test_ticket_get_full_text(self):
         """Test get_full_text method."""
         ticket = SupportTicket(
@@ -88,6 +101,94 @@ class TestSupportTicket:
         assert "Subject here" in full_text
         assert "Body content here" in full_text
     
+    def test_ticket_full_text_lower_tracks_updates(self):
+        """Test full_text and full_text_lower are cached and refreshed on copy."""
+        ticket = SupportTicket(
+            ticket_id="T-005",
+            subject="Subject HERE",
+            body="Body",
+            customer_email="test@example.com"
+        )
+        
+        assert ticket.full_text_lower == ticket.get_full_text().lower()
+        
+        copy = ticket.model_copy(update={"body": "New BODY"})
+        assert copy.full_text_lower == "subject here\n\nnew body"
+        assert copy.full_text == "Subject HERE\n\nNew BODY"
+        assert ticket.full_text is ticket.get_full_text()
+    
+    def test_ticket_equality_ignores_text_cache(self):
+        """Test that reading full_text does not change ticket equality."""
+        ticket = SupportTicket(
+            ticket_id="T-006",
+            subject="Subject",
+            body="Body",
+            customer_email="test@example.com"
+        )
+        copy = ticket.model_copy()
+        
+        assert ticket.full_text_lower
+        assert ticket == copy
+        assert ticket != copy.model_copy(update={"body": "Other"})
+    
+    def test_ticket_timestamp_parsed(self):
+        """Test that ISO 8601 timestamps are parsed and invalid ones rejected."""
+        ticket = SupportTicket(
+            ticket_id="T-005",
+            subject="Subject",
+            body="Body",
+            customer_email="test@example.com",
+            timestamp="2024-01-15T14:30:00Z"
+        )
+        
+        assert ticket.timestamp.year == 2024
+        assert ticket.timestamp.utcoffset().total_seconds() == 0
+        
+        with pytest.raises(ValidationError):
+            SupportTicket(
+                ticket_id="T-005",
+                subject="Subject",
+                body="Body",
+                customer_email="test@example.com",
+                timestamp="yesterday"
+            )
+    
+    def test_load_tickets_validates_batch(self):
+        """Test that load_tickets validates every ticket in one call."""
+        raw = [
+            {"ticket_id": "T-1", "subject": "A", "body": "B", "customer_email": "a@example.com"},
+            {"ticket_id": "T-2", "subject": "C", "body": "D", "customer_email": "c@example.com"},
+        ]
+        
+        tickets = load_tickets(raw)
+        assert [t.ticket_id for t in tickets] == ["T-1", "T-2"]
+        
+        raw[1]["customer_email"] = "not-an-email"
+        with pytest.raises(ValidationError):
+            load_tickets(raw)
+    
+    def test_load_tickets_json_matches_load_tickets(self):
+        """Test that JSON input is parsed and validated the same way."""
+        raw = [
+            {"ticket_id": "T-1", "subject": "A", "body": "B", "customer_email": "A@Example.com"},
+        ]
+        
+        assert load_tickets_json(json.dumps(raw).encode()) == load_tickets(raw)
+        with pytest.raises(ValidationError):
+            load_tickets_json(b"[{")
+    
+    def test_ticket_is_frozen(self):
+        """Test that tickets cannot be mutated after validation."""
+        ticket = SupportTicket(
+            ticket_id="T-005",
+            subject="Subject",
+            body="Body",
+            customer_email="test@example.com"
+        )
+        
+        with pytest.raises(ValidationError):
+            ticket.body = "Changed"
+    
     def test_ticket_is_enterprise(self):
         """Test is_enterprise method."""
         enterprise = SupportTicket(
@@ -171,6 +272,32 @@ class TestTriageOutput:
         
         assert len(output.customer_risk_signals) == 3
         assert RiskSignal.CHURN_RISK in output.customer_risk_signals
+        assert output.risk_signal_mask == (
+            RiskSignalMask.CHURN_RISK | RiskSignalMask.CHARGE_DISPUTE | RiskSignalMask.LEGAL_THREAT
+        )
+        assert not output.risk_signal_mask & RiskSignalMask.COMPLIANCE_ISSUE
+    
+    def test_output_is_frozen(self):
+        """Test that outputs cannot be changed once built."""
+        output = TriageOutput(
+            ticket_id="T-004",
+            urgency=UrgencyLevel.LOW,
+            issue_type=IssueType.OTHER,
+            customer_sentiment=CustomerSentiment.NEUTRAL,
+            recommended_action=RecommendedAction.AUTO_RESPOND,
+            recommended_specialist_queue=SpecialistQueue.NONE
+        )
+        
+        with pytest.raises(ValidationError):
+            output.urgency = UrgencyLevel.CRITICAL
+    
+    def test_json_bytes_match_model_dump_json(self):
+        """Test that byte serialization matches the string form."""
+        output = TriageOutput.model_validate(
+            TriageOutput.model_config["json_schema_extra"]["example"]
+        )
+        
+        assert output.to_json_bytes() == output.model_dump_json().encode()
 
 
 class TestEnums:
@@ -204,4 +331,13 @@ class TestEnums:
         """Test all action values exist."""
         assert RecommendedAction.AUTO_RESPOND.value == "auto_respond"
         assert RecommendedAction.ROUTE_TO_SPECIALIST.value == "route_to_specialist"
-        assert RecommendedAction.ESCALATE_TO_HUMAN.value == "escalate_to_human"
\ No newline at end of file
+        assert RecommendedAction.ESCALATE_TO_HUMAN.value == "escalate_to_human"
+    
+    def test_classifications_cover_output_fields(self):
+        """Test the shared value table maps output fields to enum members."""
+        for field, members in CLASSIFICATIONS.items():
+            assert field in TriageOutput.model_fields
+            assert all(member.value == value for value, member in members.items())
+        
+        assert CLASSIFICATIONS["urgency"]["high"] is UrgencyLevel.HIGH
+        assert len(CLASSIFICATIONS["customer_risk_signals"]) == len(RiskSignal)
@@ -10,6 +10,7 @@ Tests for MCP-style integration tools:
 
 import pytest
 
+from src.triage_agent.tools import create_tool_registry
 from src.triage_agent.tools.slack import (
     SlackSearchTool,
     SlackSearchInput,
@@ -386,4 +387,42 @@ class TestToolRegistration:
         """Test native tools present even without MCP."""
         assert tool_registry_native_only.has_tool("knowledge_base_search")
         assert tool_registry_native_only.has_tool("customer_history")
-        assert tool_registry_native_only.has_tool("region_status")
\ No newline at end of file
+        assert tool_registry_native_only.has_tool("region_status")
+    
+    def test_schemas_cached_until_registry_changes(self, tool_registry):
+        """Test that tool schemas are reused until a tool is removed."""
+        schemas = tool_registry.get_schemas()
+        
+        assert tool_registry.get_schemas() is schemas
+        
+        tool_registry.unregister("slack_post")
+        updated = tool_registry.get_schemas()
+        
+        assert len(updated) == len(schemas) - 1
+        assert updated[0] is schemas[0]
+    
+    def test_default_tools_shared_between_registries(self):
+        """Test that registries share tool instances but not their tool lists."""
+        first = create_tool_registry(include_mcp=False)
+        second = create_tool_registry(include_mcp=False)
+        
+        assert first.get("customer_history") is second.get("customer_history")
+        
+        first.unregister("customer_history")
+        assert second.has_tool("customer_history")
+    
+    def test_mcp_tools_not_shared_between_registries(self):
+        """Test that each registry gets its own MCP-style tool instances."""
+        first = create_tool_registry()
+        second = create_tool_registry()
+        
+        assert first.get("slack_post") is not second.get("slack_post")
+        assert first.get("knowledge_base_search") is second.get("knowledge_base_search")
+    
+    def test_schema_built_once_per_tool_class(self):
+        """Test that instances of a tool class share one prebuilt schema."""
+        schema = SlackPostTool().get_schema()
+        
+        assert SlackPostTool().get_schema() is schema
+        assert schema["function"]["name"] == "slack_post"
+        assert "title" not in schema["function"]["parameters"]
@@ -8,11 +8,15 @@ Tests for native tool implementations:
 - RegionStatusTool
 """
 
+import json
+
 import pytest
 
+from src.triage_agent.knowledge_base_data import KNOWLEDGE_BASE_ARTICLES, search_kb
 from src.triage_agent.tools.knowledge_base import (
     KnowledgeBaseTool,
     KnowledgeBaseInput,
+    _cached_search,
 )
 from src.triage_agent.tools.customer_history import (
     CustomerHistoryTool,
@@ -80,6 +84,36 @@ class TestKnowledgeBaseTool:
         result = tool.execute(KnowledgeBaseInput(query="xyznonexistent123"))
         
         assert result.total_matches == 0
+    
+    def test_unvalidated_output_matches_validated(self):
+        """Test that the unvalidated output equals a validated rebuild."""
+        tool = KnowledgeBaseTool()
+        result = tool.execute(KnowledgeBaseInput(query="password reset"))
+        
+        assert type(result).model_validate(result.model_dump()) == result
+    
+    def test_search_index_matches_partial_terms(self):
+        """Test that indexed search matches terms inside words and filters by category."""
+        total, results = search_kb("pass", category="Authentication", limit=1)
+        
+        assert total >= len(results) == 1
+        assert results[0][1]["id"] == "KB-AUTH-001"
+        assert all(article["category"] == "authentication" for _, article in results)
+    
+    def test_articles_serialize_to_json(self):
+        """Test that article keywords stay ordered, JSON-serializable tuples."""
+        assert KNOWLEDGE_BASE_ARTICLES[0]["keywords"][:2] == ("password", "reset")
+        assert json.dumps([dict(article) for article in KNOWLEDGE_BASE_ARTICLES])
+    
+    def test_repeated_search_is_cached(self):
+        """Test that equivalent queries reuse the cached search."""
+        _cached_search.cache_clear()
+        tool = KnowledgeBaseTool()
+        first = tool.execute(KnowledgeBaseInput(query="Password  reset"))
+        second = tool.execute(KnowledgeBaseInput(query="password reset "))
+        
+        assert _cached_search.cache_info().hits == 1
+        assert first.results == second.results
 
 
 class TestCustomerHistoryTool:
@@ -124,6 +158,28 @@ class TestCustomerHistoryTool:
         
         assert result.account_tier == "unknown"
         assert result.lifetime_value == 0
+        assert result.customer_email == "unknown@example.com"
+    
+    def test_malformed_email_returns_defaults(self):
+        """Test that a non-email lookup key gets the default profile."""
+        tool = CustomerHistoryTool()
+        result = tool.execute(CustomerHistoryInput(customer_email=" John Smith "))
+        
+        assert result.account_tier == "unknown"
+        assert result.customer_email == "john smith"
+    
+    def test_known_customer_outputs_are_prebuilt(self):
+        """Test that repeated lookups return equal but independent outputs."""
+        tool = CustomerHistoryTool()
+        lookup = CustomerHistoryInput(customer_email="cto@bigcorp.com")
+        
+        first = tool.execute(lookup)
+        
+        assert tool.execute(lookup) == first
+        assert first.past_ticket_count == len(first.past_tickets) == 2
+        
+        first.past_tickets.clear()
+        assert len(tool.execute(lookup).past_tickets) == 2
     
     def test_customer_risk_indicator(self):
         """Test that at-risk customers are identified."""
@@ -191,4 +247,20 @@ class TestRegionStatusTool:
         tool = RegionStatusTool()
         result = tool.execute(RegionStatusInput(region="eu-west"))
         
-        assert result.last_updated is not None
\ No newline at end of file
+        assert result.last_updated is not None
+    
+    def test_service_filter_reuses_prebuilt_entries(self):
+        """Test that filtered lookups share the prebuilt service entries."""
+        tool = RegionStatusTool()
+        full = tool.execute(RegionStatusInput(region="us-east"))
+        filtered = tool.execute(RegionStatusInput(region="us-east", check_services=["api"]))
+        
+        assert [s.service_name for s in filtered.services] == ["api"]
+        assert filtered.services[0] is full.services[0]
+    
+    def test_unvalidated_output_matches_validated(self):
+        """Test that the unvalidated output equals a validated rebuild."""
+        tool = RegionStatusTool()
+        result = tool.execute(RegionStatusInput(region="us-east"))
+        
+        assert type(result).model_validate(result.model_dump()) == result
@@ -396,4 +396,23 @@ class TestIssueTypeDetection:
         issue_type = triage_logic.detect_issue_type_from_keywords(ticket)
         
         # Returns None if no keywords match
-        assert issue_type is None
\ No newline at end of file
+        assert issue_type is None
+
+    def test_overlapping_keywords_all_detected(self, triage_logic):
+        """Test that keywords nested in longer keywords still match."""
+        ticket = make_ticket(body="I filed a chargeback")
+
+        signals = triage_logic.detect_risk_signals(ticket)
+        issue_type = triage_logic.detect_issue_type_from_keywords(ticket)
+
+        # "chargeback" also contains the billing keyword "charge"
+        assert RiskSignal.CHARGE_DISPUTE in signals
+        assert RiskSignal.LEGAL_THREAT in signals
+        assert issue_type == IssueType.BILLING
+
+    def test_scan_reports_all_keyword_groups(self, triage_logic):
+        """Test that a single scan reports urgency, sentiment and issue tags."""
+        tags = triage_logic.scan("urgent: the dashboard is down, thanks for the help")
+
+        assert {"fallback_urgent", "down", "outage", "sentiment_positive"} <= tags
+        assert "sentiment_negative" not in tags